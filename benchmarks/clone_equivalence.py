@@ -0,0 +1,116 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Checks that rigs generated with instance cloning, batched rig types or
+    both are equivalent to a direct generation, and reports the time of each.
+    Also checks that the instances of a batch capable rig type are generated
+    in a single batch.
+
+        blender -b --factory-startup --python-exit-code 1 --python benchmarks/clone_equivalence.py -- --output clone.json
+"""
+
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+
+def generate_signature(metarig_name, use_cloning, use_batching):
+    from gamerig import generate
+    from gamerig.clone import rig_signature
+
+    common.reset_scene()
+    metarig = common.add_bundled_metarig(metarig_name)
+    context = bpy.context
+    context.view_layer.objects.active = metarig
+    start = time.perf_counter()
+    generate.generate_rig(context, metarig, use_cloning=use_cloning, use_batching=use_batching)
+    elapsed = time.perf_counter() - start
+    rig = context.view_layer.objects.active
+    cloned = sum(1 for label, seconds in generate.generate_rig.rig_timings if label.startswith("Clone rig"))
+    return rig_signature(rig), elapsed, cloned
+
+
+def check_single_batch(rig_type='generic', count=2):
+    """ Returns the batch sizes of a metarig of count bones of the rig type,
+        which must be a single batch of count instances.
+    """
+    from gamerig import generate
+    from gamerig.utils import get_rig_type
+
+    common.reset_scene()
+    create_sample = get_rig_type(rig_type).create_sample
+    metarig = common.add_metarig(lambda obj: [create_sample(obj) for _ in range(count)])
+    bpy.context.view_layer.objects.active = metarig
+    generate.generate_rig(bpy.context, metarig, use_cloning=False)
+    return generate.generate_rig.batch_sizes
+
+
+def main():
+    parser = common.argument_parser("GameRig instance cloning equivalence check")
+    parser.add_argument('--metarigs', nargs='*', default=common.BUNDLED_METARIGS, help="Bundled metarigs to check")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+    from gamerig.clone import compare_rig_signatures
+
+    results = common.blender_info()
+    results['metarigs'] = {}
+    failed = False
+    for metarig_name in args.metarigs:
+        print("Checking cloning of '%s'" % metarig_name)
+        direct, direct_time, _ = generate_signature(metarig_name, False, False)
+        cloned, cloned_time, clone_count = generate_signature(metarig_name, True, False)
+        batched, batched_time, _ = generate_signature(metarig_name, False, True)
+        both, both_time, both_count = generate_signature(metarig_name, True, True)
+        differences = compare_rig_signatures(direct, cloned)
+        batch_differences = compare_rig_signatures(direct, batched)
+        both_differences = compare_rig_signatures(direct, both)
+        failed = failed or bool(differences) or bool(batch_differences) or bool(both_differences)
+        results['metarigs'][metarig_name] = {
+            'direct_s'          : direct_time,
+            'cloned_s'          : cloned_time,
+            'clones'            : clone_count,
+            'differences'       : differences,
+            'batched_s'         : batched_time,
+            'batch_differences' : batch_differences,
+            'both_s'            : both_time,
+            'both_clones'       : both_count,
+            'both_differences'  : both_differences,
+        }
+
+    results['generic_batches'] = check_single_batch()
+    if results['generic_batches'] != [2]:
+        print("Instances of a batch capable rig type are not generated in a single batch")
+        failed = True
+
+    common.write_results(results, args.output)
+
+    if failed:
+        print("Cloned or batched rigs differ from direct generation")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Shared helpers of the GameRig benchmarks.
+
+    The benchmarks run inside Blender in background mode, e.g.
+
+        blender -b --factory-startup --python benchmarks/playback.py -- --output playback.json
+
+    Arguments after '--' are handed to the benchmark script.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import bpy
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUNDLED_METARIGS = ['human', 'human_simple_face', 'cat', 'Unity Mechanim.human']
+
+
+def script_args(parser):
+    """ Parses the arguments given after '--' on the blender command line.
+    """
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    return parser.parse_args(argv)
+
+
+def argument_parser(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--output', default='', help="JSON file to write the results to (stdout if empty)")
+    return parser
+
+
+def setup_addon():
+    """ Imports and registers the add-on from this source tree.
+    """
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import gamerig
+    if not hasattr(bpy.types.Armature, 'gamerig_rig_ui_template'):
+        gamerig.register()
+    return gamerig
+
+
+def reset_scene():
+    """ Starts from an empty file.
+    """
+    bpy.ops.wm.read_homefile(use_empty=True)
+    return bpy.context.scene
+
+
+def add_metarig(create, name="metarig"):
+    """ Adds an armature and builds a metarig into it with the given create function.
+    """
+    context = bpy.context
+    if context.object is not None and context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    obj = bpy.data.objects.new(name, bpy.data.armatures.new(name))
+    context.collection.objects.link(obj)
+    for objt in context.view_layer.objects:
+        objt.select_set(False)
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    create(obj)
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return obj
+
+
+def add_bundled_metarig(metarig_name):
+    """ Adds one of the metarigs shipped with the add-on ('Unity Mechanim.human' for sub directories).
+    """
+    from gamerig import utils
+    package, _, module = metarig_name.rpartition('.')
+    path = utils.METARIG_DIR + ('.' + package if package else '')
+    return add_metarig(utils.get_metarig_module(module, path).create)
+
+
+def generate(metarig, profile=False):
+    """ Generates the rig of a metarig. Returns (rig object, seconds).
+        profile keeps the bones of each rig instance, see generate_rig().
+    """
+    from gamerig import generate as gamerig_generate
+    context = bpy.context
+    context.view_layer.objects.active = metarig
+    start = time.perf_counter()
+    gamerig_generate.generate_rig(context, metarig, profile=profile)
+    elapsed = time.perf_counter() - start
+    return context.view_layer.objects.active, elapsed
+
+
+def write_results(results, output):
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if output:
+        with open(output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+def blender_info():
+    from gamerig import bl_info
+    return {
+        'blender' : bpy.app.version_string,
+        'addon'   : '.'.join(str(i) for i in bl_info['version']),
+    }
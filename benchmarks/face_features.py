@@ -0,0 +1,94 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Face feature mask report.
+
+    Generates the face sample for every combination of the face feature
+    parameters and reports the bones of the generated rig: all, controls,
+    mechanism, deformation and static (ORG bones of excluded features).
+
+        blender -b --factory-startup --python benchmarks/face_features.py -- --output face_features.json
+"""
+
+import itertools
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+
+def generate_face(features):
+    """ Generates the face sample with only the given features enabled.
+    """
+    from gamerig.utils import get_rig_type, is_org, is_mch, is_jig
+    face = get_rig_type('face')
+
+    common.reset_scene()
+    metarig = common.add_metarig(face.create_sample)
+    pbone = next(pbone for pbone in metarig.pose.bones if pbone.gamerig_type == 'face')
+    for param, prefixes in face.FACE_FEATURES:
+        setattr(pbone.gamerig_parameters, param, param in features)
+
+    rig, elapsed = common.generate(metarig)
+    bones = rig.data.bones
+    return {
+        'features'   : sorted(param[len('face_'):] for param in features),
+        'bones'      : len(bones),
+        'controls'   : sum(1 for bone in bones if not (is_org(bone.name) or is_mch(bone.name) or is_jig(bone.name))),
+        'mechanism'  : sum(1 for bone in bones if is_mch(bone.name)),
+        'deform'     : sum(1 for bone in bones if bone.use_deform),
+        'constraints': sum(len(pbone.constraints) for pbone in rig.pose.bones),
+        'generate_s' : elapsed,
+    }
+
+
+def main():
+    parser = common.argument_parser("GameRig face feature mask report")
+    parser.add_argument('--features', nargs='*', default=None,
+                        help="Features to combine (lips lids tongue cheeks nose ears chin), the others stay enabled")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+    from gamerig.utils import get_rig_type
+
+    params = [param for param, prefixes in get_rig_type('face').FACE_FEATURES]
+    if args.features is None:
+        varying = params
+    else:
+        varying = ['face_' + feature for feature in args.features]
+    fixed = [param for param in params if param not in varying]
+
+    results = common.blender_info()
+    results['combinations'] = []
+    for count in range(len(varying) + 1):
+        for combination in itertools.combinations(varying, count):
+            features = fixed + list(combination)
+            run = generate_face(features)
+            print("%-40s %4d bones %4d deform" % (' '.join(run['features']) or '-', run['bones'], run['deform']))
+            results['combinations'].append(run)
+
+    common.write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
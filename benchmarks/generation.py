@@ -0,0 +1,260 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Generation scaling benchmark.
+
+    Builds synthetic metarigs of growing size (arm/leg pairs, tentacle chains,
+    generic bones, faces and fingers), times generate_rig by phase and times
+    the create_sample() of every rig type. Results can be compared against a
+    stored baseline, failing when generation time regresses over tolerance.
+
+        blender -b --factory-startup --python-exit-code 1 --python benchmarks/generation.py -- \\
+            --scales 1 2 4 8 --baseline benchmarks/baseline.json --output generation.json
+"""
+
+import json
+import os
+import sys
+import time
+
+import bpy
+import numpy as np
+from mathutils import Vector
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+
+def add_sample(obj, rig_type, offset):
+    """ Adds the sample of a rig type to the metarig, moved by offset.
+    """
+    from gamerig.utils import get_rig_type
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    before = set(obj.data.edit_bones.keys())
+    get_rig_type(rig_type).create_sample(obj)
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    for ebone in obj.data.edit_bones:
+        if ebone.name not in before:
+            ebone.head += offset
+            ebone.tail += offset
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def add_chain(obj, rig_type, name, length, offset, params=None):
+    """ Adds a connected chain of bones typed with rig_type on its first bone.
+    """
+    bpy.ops.object.mode_set(mode='EDIT')
+    ebones = obj.data.edit_bones
+    names = []
+    parent = None
+    for i in range(length):
+        ebone = ebones.new(name)
+        ebone.head = offset + Vector((0, 0, 0.2 * i))
+        ebone.tail = offset + Vector((0, 0, 0.2 * (i + 1)))
+        ebone.roll = 0.0
+        ebone.parent = parent
+        ebone.use_connect = parent is not None
+        names.append(ebone.name)
+        parent = ebone
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    pbone = obj.pose.bones[names[0]]
+    pbone.gamerig_type = rig_type
+    for key, value in (params or {}).items():
+        setattr(pbone.gamerig_parameters, key, value)
+
+
+def build_synthetic_metarig(counts):
+    """ Builds a metarig holding the given numbers of each rig kind.
+    """
+    def create(obj):
+        obj.data.gamerig_rig_ui_template = 'ui_template'
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        for i in range(counts['limbs']):
+            add_sample(obj, 'limbs.arm', Vector((1.0 * i, 0, 0)))
+            add_sample(obj, 'limbs.leg', Vector((1.0 * i, 1.0, 0)))
+        for i in range(counts['tentacles']):
+            add_chain(obj, 'tentacle', 'tentacle', counts['tentacle_length'], Vector((1.0 * i, 2.0, 0)),
+                      {'chain_length': counts['tentacle_length']})
+        for i in range(counts['generic']):
+            add_chain(obj, 'generic', 'generic', 1, Vector((0.1 * i, 3.0, 0)))
+        for i in range(counts['fingers']):
+            add_sample(obj, 'finger', Vector((0.1 * i, 4.0, 0)))
+        for i in range(counts['faces']):
+            add_sample(obj, 'face', Vector((1.0 * i, 5.0, 0)))
+
+    return common.add_metarig(create)
+
+
+def benchmark_generation(counts):
+    from gamerig import generate
+
+    common.reset_scene()
+    metarig = build_synthetic_metarig(counts)
+    metarig_bones = len(metarig.data.bones)
+
+    rig, elapsed = common.generate(metarig)
+
+    per_type = {}
+    for label, seconds in generate.generate_rig.rig_timings:
+        # label is "Generate rig : <gamerig.rigs.xxx.Rig object at ...>"
+        rig_type = label.split('gamerig.rigs.', 1)[-1].split('.Rig', 1)[0]
+        per_type[rig_type] = per_type.get(rig_type, 0.0) + seconds
+
+    return {
+        'counts'        : counts,
+        'metarig_bones' : metarig_bones,
+        'rig_bones'     : len(rig.data.bones),
+        'generate_s'    : elapsed,
+        'phases'        : dict(generate.generate_rig.timings),
+        'rig_types'     : per_type,
+    }
+
+
+def benchmark_samples():
+    """ Times create_sample() of every rig type on its own armature.
+    """
+    from gamerig import rig_lists
+    from gamerig.utils import get_rig_type
+
+    results = {}
+    for rig_type in rig_lists.rig_list:
+        create_sample = getattr(get_rig_type(rig_type), 'create_sample', None)
+        if create_sample is None:
+            continue
+        common.reset_scene()
+        obj = common.add_metarig(lambda obj: None, "sample")
+        start = time.perf_counter()
+        create_sample(obj)
+        results[rig_type] = time.perf_counter() - start
+    return results
+
+
+def scaling_exponent(runs):
+    """ Slope of log(time) over log(bone count). ~1 is linear, 2 is quadratic.
+    """
+    if len(runs) < 2:
+        return None
+    bones = np.log([run['rig_bones'] for run in runs])
+    seconds = np.log([run['generate_s'] for run in runs])
+    return float(np.polyfit(bones, seconds, 1)[0])
+
+
+def plot(runs, path):
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not available, skip plotting")
+        return
+    fig, ax = plt.subplots()
+    ax.plot([run['rig_bones'] for run in runs], [run['generate_s'] for run in runs], 'o-')
+    ax.set_xlabel("bones")
+    ax.set_ylabel("generate_rig (s)")
+    fig.savefig(path)
+
+
+def compare(results, baseline, tolerance):
+    """ Returns the list of regressions of results against baseline.
+    """
+    regressions = []
+
+    def check(name, value, base):
+        if base is not None and value > base * (1.0 + tolerance):
+            regressions.append("%s: %.3fs > baseline %.3fs (+%d%%)" % (name, value, base, round(tolerance * 100)))
+
+    base_runs = {str(run['scale']): run for run in baseline.get('runs', [])}
+    for run in results['runs']:
+        base = base_runs.get(str(run['scale']))
+        if base is not None and base['counts'] == run['counts']:
+            check("generate x%s" % run['scale'], run['generate_s'], base['generate_s'])
+
+    for rig_type, seconds in results['create_sample'].items():
+        check("create_sample %s" % rig_type, seconds, baseline.get('create_sample', {}).get(rig_type))
+
+    return regressions
+
+
+def main():
+    parser = common.argument_parser("GameRig generation scaling benchmark")
+    parser.add_argument('--scales', type=int, nargs='*', default=[1, 2, 4, 8], help="Multipliers of the rig counts")
+    parser.add_argument('--limbs', type=int, default=2, help="limbs.arm/limbs.leg pairs")
+    parser.add_argument('--tentacles', type=int, default=2, help="tentacle chains")
+    parser.add_argument('--tentacle-length', type=int, default=6, help="bones per tentacle chain")
+    parser.add_argument('--generic', type=int, default=10, help="generic bones")
+    parser.add_argument('--fingers', type=int, default=5, help="finger samples")
+    parser.add_argument('--faces', type=int, default=0, help="face samples (not multiplied by scale)")
+    parser.add_argument('--plot', default='', help="PNG file to plot time against bone count to")
+    parser.add_argument('--baseline', default='', help="Baseline JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown against baseline (0.2 = 20%%)")
+    parser.add_argument('--write-baseline', action='store_true', help="Store the results as baseline")
+    args = common.script_args(parser)
+
+    # A missing baseline must not pass the regression gate
+    if args.baseline and not args.write_baseline and not os.path.exists(args.baseline):
+        print("Error: baseline %s not found (use --write-baseline to create it)" % args.baseline)
+        sys.exit(1)
+
+    common.setup_addon()
+
+    results = common.blender_info()
+    results['runs'] = []
+    for scale in args.scales:
+        counts = {
+            'limbs'           : args.limbs * scale,
+            'tentacles'       : args.tentacles * scale,
+            'tentacle_length' : args.tentacle_length,
+            'generic'         : args.generic * scale,
+            'fingers'         : args.fingers * scale,
+            'faces'           : args.faces,
+        }
+        print("Benchmarking generation x%d" % scale)
+        run = benchmark_generation(counts)
+        run['scale'] = scale
+        results['runs'].append(run)
+
+    results['scaling_exponent'] = scaling_exponent(results['runs'])
+    results['create_sample'] = benchmark_samples()
+
+    if args.plot:
+        plot(results['runs'], args.plot)
+
+    if args.write_baseline and args.baseline:
+        common.write_results(results, args.baseline)
+
+    regressions = []
+    if args.baseline and not args.write_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    results['regressions'] = regressions
+
+    common.write_results(results, args.output)
+
+    if regressions:
+        print("Generation time regressed:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Playback evaluation cost of the lean limbs against the full limbs.
+
+    Generates each bundled metarig with its limbs in the full and in the lean
+    mode, plays the synthetic action of the playback benchmark, and reports
+    ms/frame with the constraint and driver counts of the limb rigs.
+
+        blender -b --factory-startup --python benchmarks/lean_limb.py -- --frames 200 --output lean_limb.json
+"""
+
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+import playback
+
+
+def benchmark_limbs(metarig_name, lean, frames, key_step):
+    from gamerig import generate
+
+    scene = common.reset_scene()
+    scene.frame_start = 1
+    scene.frame_end = frames
+
+    metarig = common.add_bundled_metarig(metarig_name)
+    for pbone in metarig.pose.bones:
+        if pbone.gamerig_type.startswith('limbs.'):
+            pbone.gamerig_parameters.lean_limb = lean
+
+    rig, generate_time = common.generate(metarig, profile=True)
+    metarig.hide_viewport = True
+    playback.add_synthetic_action(rig, frames, key_step)
+
+    limb_bones = set()
+    for rig_bone, rig_type, bones in generate.generate_rig.rig_bones:
+        if rig_type.startswith('limbs.'):
+            limb_bones.update(bones)
+
+    pose_bones = rig.pose.bones
+    paths = set(pose_bones[bone].path_from_id() for bone in limb_bones)
+    result = {
+        'limb_bones'       : len(limb_bones),
+        'limb_constraints' : sum(len(pose_bones[bone].constraints) for bone in limb_bones),
+        'limb_drivers'     : sum(1 for fcu in rig.animation_data.drivers if fcu.data_path.split('.constraints', 1)[0] in paths),
+        'generate_s'       : generate_time,
+        'ms_per_frame'     : playback.ms_per_frame(scene, frames),
+    }
+
+    playback.set_constraints_mute(rig, limb_bones, True)
+    result['limb_cost_ms'] = result['ms_per_frame'] - playback.ms_per_frame(scene, frames)
+    playback.set_constraints_mute(rig, limb_bones, False)
+
+    return result
+
+
+def main():
+    parser = common.argument_parser("GameRig lean limb playback benchmark")
+    parser.add_argument('--frames', type=int, default=200, help="Number of frames played per measurement")
+    parser.add_argument('--key-step', type=int, default=4, help="Frames between synthetic keys")
+    parser.add_argument('--metarigs', nargs='*', default=common.BUNDLED_METARIGS, help="Bundled metarigs to benchmark")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+
+    results = common.blender_info()
+    results['frames'] = args.frames
+    results['metarigs'] = {}
+    for metarig_name in args.metarigs:
+        print("Benchmarking limbs of '%s'" % metarig_name)
+        full = benchmark_limbs(metarig_name, False, args.frames, args.key_step)
+        lean = benchmark_limbs(metarig_name, True, args.frames, args.key_step)
+        results['metarigs'][metarig_name] = {
+            'full'          : full,
+            'lean'          : lean,
+            'limb_speedup'  : full['limb_cost_ms'] / lean['limb_cost_ms'] if lean['limb_cost_ms'] > 0 else None,
+        }
+
+    common.write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Playback evaluation benchmark of the generated rigs.
+
+    Generates each bundled metarig, plays a synthetic action on its controls
+    and reports ms/frame, then again with the constraints of each rig
+    instance muted to attribute the evaluation cost per rig.
+
+        blender -b --factory-startup --python benchmarks/playback.py -- --frames 200 --output playback.json
+"""
+
+import math
+import os
+import sys
+import time
+
+import bpy
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+
+def control_bones(rig):
+    from gamerig.utils import is_org, is_mch, is_jig
+    return [pbone for pbone in rig.pose.bones if not (is_org(pbone.name) or is_mch(pbone.name) or is_jig(pbone.name))]
+
+
+def add_synthetic_action(rig, frames, key_step):
+    """ Keys a sine wave on the unlocked rotation (and location) channels of every control.
+    """
+    from gamerig.utils import transform_locks
+
+    rig.animation_data_create()
+    action = bpy.data.actions.new(rig.name + "Benchmark")
+    rig.animation_data.action = action
+
+    key_frames = np.arange(1, frames + key_step + 1, key_step, dtype=np.float32)
+    co = np.empty((len(key_frames), 2), dtype=np.float32)
+    co[:, 0] = key_frames
+
+    for n, pbone in enumerate(control_bones(rig)):
+        for attr, locks in transform_locks(pbone).items():
+            if attr == 'scale':
+                continue
+            amplitude = 0.05 if attr == 'location' else 0.2
+            rest = 1.0 if attr in ('rotation_quaternion', 'rotation_axis_angle') else 0.0
+            for index, locked in enumerate(locks):
+                if locked or (rest and index == 0):
+                    continue
+                fcu = action.fcurves.new(pbone.path_from_id(attr), index=index, action_group=pbone.name)
+                phase = n * 0.37 + index * 1.3
+                co[:, 1] = amplitude * np.sin(key_frames * (2.0 * math.pi / 48.0) + phase)
+                fcu.keyframe_points.add(len(key_frames))
+                fcu.keyframe_points.foreach_set('co', co.ravel())
+                fcu.update()
+
+    return action
+
+
+def ms_per_frame(scene, frames):
+    scene.frame_set(1)
+    start = time.perf_counter()
+    for frame in range(1, frames + 1):
+        scene.frame_set(frame)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def set_constraints_mute(rig, bones, mute):
+    pose_bones = rig.pose.bones
+    count = 0
+    for bone in bones:
+        pbone = pose_bones.get(bone)
+        if pbone is None:
+            continue
+        for const in pbone.constraints:
+            const.mute = mute
+            count += 1
+    return count
+
+
+def set_playback_mode(rig, constraints, drivers, mute):
+    pose_bones = rig.pose.bones
+    for bone, name in constraints:
+        pose_bones[bone].constraints[name].mute = mute
+    fcurves = {(fcu.data_path, fcu.array_index): fcu for fcu in rig.animation_data.drivers}
+    for key in drivers:
+        fcurves[key].mute = mute
+
+
+def benchmark_metarig(metarig_name, frames, key_step):
+    from gamerig import generate
+    from gamerig.utils import playback_optional_mechanism
+
+    scene = common.reset_scene()
+    scene.frame_start = 1
+    scene.frame_end = frames
+
+    metarig = common.add_bundled_metarig(metarig_name)
+    rig, generate_time = common.generate(metarig, profile=True)
+    metarig.hide_viewport = True
+
+    add_synthetic_action(rig, frames, key_step)
+
+    result = {
+        'bones'                   : len(rig.pose.bones),
+        'constraints'             : sum(len(pbone.constraints) for pbone in rig.pose.bones),
+        'drivers'                 : len(rig.animation_data.drivers),
+        'generate_s'              : generate_time,
+        'ms_per_frame'            : ms_per_frame(scene, frames),
+    }
+
+    all_bones = rig.pose.bones.keys()
+    set_constraints_mute(rig, all_bones, True)
+    result['ms_per_frame_all_muted'] = ms_per_frame(scene, frames)
+    set_constraints_mute(rig, all_bones, False)
+
+    constraints, drivers = playback_optional_mechanism(rig)
+    set_playback_mode(rig, constraints, drivers, True)
+    result['ms_per_frame_playback_mode'] = ms_per_frame(scene, frames)
+    set_playback_mode(rig, constraints, drivers, False)
+
+    rigs = []
+    for rig_bone, rig_type, bones in generate.generate_rig.rig_bones:
+        muted = set_constraints_mute(rig, bones, True)
+        muted_ms = ms_per_frame(scene, frames)
+        set_constraints_mute(rig, bones, False)
+        rigs.append({
+            'bone'               : rig_bone,
+            'type'               : rig_type,
+            'bones'              : len(bones),
+            'constraints'        : muted,
+            'ms_per_frame_muted' : muted_ms,
+            'cost_ms'            : result['ms_per_frame'] - muted_ms,
+        })
+    result['rigs'] = rigs
+
+    return result
+
+
+def main():
+    parser = common.argument_parser("GameRig playback evaluation benchmark")
+    parser.add_argument('--frames', type=int, default=200, help="Number of frames played per measurement")
+    parser.add_argument('--key-step', type=int, default=4, help="Frames between synthetic keys")
+    parser.add_argument('--metarigs', nargs='*', default=common.BUNDLED_METARIGS, help="Bundled metarigs to benchmark")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+
+    results = common.blender_info()
+    results['frames'] = args.frames
+    results['metarigs'] = {}
+    for metarig_name in args.metarigs:
+        print("Benchmarking playback of '%s'" % metarig_name)
+        results['metarigs'][metarig_name] = benchmark_metarig(metarig_name, args.frames, args.key_step)
+
+    common.write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Strand rig against per bone and per chain rigs.
+
+    Builds a metarig of short chains under a single root bone (hair cards,
+    cloth strips), rigs them with one strand instance, with a generic rig per
+    bone and with a tentacle per chain, and reports the generation time, bone
+    count and widget count of each. Fails when the strand rig takes longer
+    than --max-seconds.
+
+        blender -b --factory-startup --python-exit-code 1 --python benchmarks/strand.py -- \\
+            --bones 5000 --chain-length 10 --output strand.json
+"""
+
+import os
+import sys
+
+import bpy
+from mathutils import Vector
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+MODES = ('strand', 'generic', 'tentacle')
+
+
+def build_strands(obj, chains, length, mode):
+    """ Adds a root bone with chains of length bones, typed for mode.
+    """
+    bpy.ops.object.mode_set(mode='EDIT')
+    ebones = obj.data.edit_bones
+    root = ebones.new('scalp')
+    root.head = Vector((0, 0, 0))
+    root.tail = Vector((0, 0, 0.1))
+    root_name = root.name
+
+    columns = max(1, int(chains ** 0.5))
+    chain_names = []
+    for c in range(chains):
+        offset = Vector((0.02 * (c % columns), 0.02 * (c // columns), 0.1))
+        parent = ebones[root_name]
+        names = []
+        for i in range(length):
+            ebone = ebones.new('strand')
+            ebone.head = offset + Vector((0, 0, -0.05 * i))
+            ebone.tail = offset + Vector((0, 0, -0.05 * (i + 1)))
+            ebone.parent = parent
+            ebone.use_connect = i > 0
+            names.append(ebone.name)
+            parent = ebone
+        chain_names.append(names)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    pb = obj.pose.bones
+    if mode == 'strand':
+        pb[root_name].gamerig_type = 'strand'
+    elif mode == 'generic':
+        for names in chain_names:
+            for name in names:
+                pb[name].gamerig_type = 'generic'
+    else:
+        for names in chain_names:
+            pb[names[0]].gamerig_type = 'tentacle'
+            pb[names[0]].gamerig_parameters.chain_length = length
+
+
+def benchmark_strands(chains, length, mode):
+    common.reset_scene()
+    metarig = common.add_metarig(lambda obj: build_strands(obj, chains, length, mode))
+    rig, generate_time = common.generate(metarig)
+
+    shapes = set(pbone.custom_shape for pbone in rig.pose.bones if pbone.custom_shape is not None)
+    return {
+        'metarig_bones' : len(metarig.data.bones),
+        'rig_bones'     : len(rig.data.bones),
+        'constraints'   : sum(len(pbone.constraints) for pbone in rig.pose.bones),
+        'widgets'       : len(shapes),
+        'generate_s'    : generate_time,
+    }
+
+
+def main():
+    parser = common.argument_parser("GameRig strand rig benchmark")
+    parser.add_argument('--bones', type=int, default=5000, help="Number of strand bones")
+    parser.add_argument('--chain-length', type=int, default=10, help="Bones per chain")
+    parser.add_argument('--modes', nargs='*', default=list(MODES), choices=MODES, help="Rigs to compare")
+    parser.add_argument('--max-seconds', type=float, default=5.0, help="Strand generation time limit, 0 to disable")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+
+    chains = max(1, args.bones // args.chain_length)
+    results = common.blender_info()
+    results['chains'] = chains
+    results['chain_length'] = args.chain_length
+    results['modes'] = {}
+    for mode in args.modes:
+        print("Benchmarking %d chains of %d bones with %s" % (chains, args.chain_length, mode))
+        results['modes'][mode] = benchmark_strands(chains, args.chain_length, mode)
+
+    common.write_results(results, args.output)
+
+    strand = results['modes'].get('strand')
+    if strand is not None and args.max_seconds > 0 and strand['generate_s'] > args.max_seconds:
+        print("Strand rig generation took %.2fs, over %.2fs" % (strand['generate_s'], args.max_seconds))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
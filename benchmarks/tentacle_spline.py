@@ -0,0 +1,93 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Chain against spline tentacles.
+
+    Generates a single tentacle of each chain length in the chain mode and in
+    the spline mode (with and without FK overrides), and reports the generation
+    time, bone/constraint/driver counts and ms/frame of the synthetic action of
+    the playback benchmark.
+
+        blender -b --factory-startup --python benchmarks/tentacle_spline.py -- --lengths 8 32 128 --output tentacle.json
+"""
+
+import os
+import sys
+
+import bpy
+from mathutils import Vector
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+import generation
+import playback
+
+MODES = (
+    ('chain',     {'tentacle_mode': 'CHAIN'}),
+    ('spline',    {'tentacle_mode': 'SPLINE'}),
+    ('spline_fk', {'tentacle_mode': 'SPLINE', 'spline_fk': True}),
+)
+
+
+def benchmark_tentacle(length, params, frames, key_step):
+    scene = common.reset_scene()
+    scene.frame_start = 1
+    scene.frame_end = frames
+
+    params = dict(params, chain_length=length)
+    metarig = common.add_metarig(
+        lambda obj: generation.add_chain(obj, 'tentacle', 'tentacle', length, Vector((0, 0, 0)), params)
+    )
+    rig, generate_time = common.generate(metarig)
+    metarig.hide_viewport = True
+    playback.add_synthetic_action(rig, frames, key_step)
+
+    return {
+        'bones'        : len(rig.pose.bones),
+        'constraints'  : sum(len(pbone.constraints) for pbone in rig.pose.bones),
+        'drivers'      : len(rig.animation_data.drivers) if rig.animation_data else 0,
+        'generate_s'   : generate_time,
+        'ms_per_frame' : playback.ms_per_frame(scene, frames),
+    }
+
+
+def main():
+    parser = common.argument_parser("GameRig chain against spline tentacle benchmark")
+    parser.add_argument('--lengths', type=int, nargs='*', default=[8, 32, 128], help="Chain lengths")
+    parser.add_argument('--frames', type=int, default=200, help="Number of frames played per measurement")
+    parser.add_argument('--key-step', type=int, default=4, help="Frames between synthetic keys")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+
+    results = common.blender_info()
+    results['frames'] = args.frames
+    results['lengths'] = {}
+    for length in args.lengths:
+        results['lengths'][str(length)] = runs = {}
+        for mode, params in MODES:
+            print("Benchmarking %s tentacle of %d bones" % (mode, length))
+            runs[mode] = benchmark_tentacle(length, params, args.frames, args.key_step)
+
+    common.write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
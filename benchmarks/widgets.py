@@ -0,0 +1,110 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Widget library benchmark.
+
+    Times the import of the widget modules, the first read of the widget
+    library, and the generation of the bundled metarigs, with the number of
+    widget meshes they use. Run it on the trees to compare.
+
+        blender -b --factory-startup --python benchmarks/widgets.py -- --output widgets.json
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import common
+
+WIDGET_MODULES = ['gamerig.rigs.widgets', 'gamerig.rigs.root', 'gamerig.rigs.torso', 'gamerig.rigs.face']
+
+
+def time_imports(repeat):
+    """ Returns the best time of importing the widget modules from scratch.
+    """
+    best = None
+    for _ in range(repeat):
+        for name in WIDGET_MODULES:
+            sys.modules.pop(name, None)
+        importlib.invalidate_caches()
+        start = time.perf_counter()
+        for name in WIDGET_MODULES:
+            importlib.import_module(name)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_library_read(repeat):
+    """ Returns the best time of reading the widget library and the geometry
+        of all its shapes, with empty caches.
+    """
+    from gamerig.widget_library import read_library, library_shape
+
+    best = None
+    for _ in range(repeat):
+        read_library.stamp = None
+        start = time.perf_counter()
+        for shape in read_library():
+            library_shape(shape)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_generation(metarig_name):
+    common.reset_scene()
+    metarig = common.add_bundled_metarig(metarig_name)
+    rig, generate_time = common.generate(metarig)
+
+    return {
+        'generate_s' : generate_time,
+        'meshes'     : len(bpy.data.meshes),
+        'widgets'    : len(set(pbone.custom_shape for pbone in rig.pose.bones if pbone.custom_shape is not None)),
+    }
+
+
+def main():
+    parser = common.argument_parser("GameRig widget library benchmark")
+    parser.add_argument('--metarigs', nargs='*', default=common.BUNDLED_METARIGS, help="Bundled metarigs to generate")
+    parser.add_argument('--repeat', type=int, default=5, help="Import and read repetitions")
+    args = common.script_args(parser)
+
+    common.setup_addon()
+    from gamerig.widget_library import read_library
+
+    results = common.blender_info()
+    results['library'] = sorted(read_library())
+    results['import_s'] = time_imports(args.repeat)
+    results['library_read_s'] = time_library_read(args.repeat)
+    results['metarigs'] = {}
+    for metarig_name in args.metarigs:
+        print("Generating %s" % metarig_name)
+        results['metarigs'][metarig_name] = time_generation(metarig_name)
+
+    common.write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -57,6 +57,11 @@ from bpy.props import (
 )
 
 
+def update_widget_segments(self, context):
+    from .rigs.widgets import rebuild_round_widgets
+    rebuild_round_widgets(int(self.widget_segments))
+
+
 class GameRigPreferences(AddonPreferences):
     # this must match the addon name, use '__package__'
     # when defining this in a submodule of a python package.
@@ -68,8 +73,52 @@ class GameRigPreferences(AddonPreferences):
         default=False
     )
 
+    use_generation_cache : BoolProperty(
+        name='Use Generation Cache',
+        description='Reuse previously generated rigs of identical metarigs from an on-disk cache',
+        default=False
+    )
+
+    cache_directory : StringProperty(
+        name='Cache Directory',
+        description='Directory of the generated rig cache. (Blender user data directory if empty)',
+        subtype='DIR_PATH',
+        default=''
+    )
+
+    cache_size : IntProperty(
+        name='Cache Size',
+        description='Maximum number of generated rigs kept in the cache',
+        default=32,
+        min=1
+    )
+
+    use_instance_cloning : BoolProperty(
+        name='Clone Identical Rigs',
+        description='Generate structurally identical (or mirrored) rig instances once and clone the others',
+        default=False
+    )
+
+    widget_segments : EnumProperty(
+        name='Widget Detail',
+        description='Number of segments of the round control widgets. Existing widgets are rebuilt on change',
+        items=[
+            ('8', 'Low', 'Round widgets with 8 segments'),
+            ('16', 'Medium', 'Round widgets with 16 segments'),
+            ('32', 'High', 'Round widgets with 32 segments'),
+        ],
+        default='32',
+        update=update_widget_segments
+    )
+
     def draw(self, context):
         self.layout.row().prop(self, 'shows_dev_tools')
+        self.layout.row().prop(self, 'widget_segments')
+        self.layout.row().prop(self, 'use_instance_cloning')
+        self.layout.row().prop(self, 'use_generation_cache')
+        if self.use_generation_cache:
+            self.layout.row().prop(self, 'cache_directory')
+            self.layout.row().prop(self, 'cache_size')
 
 
 class GameRigName(bpy.types.PropertyGroup):
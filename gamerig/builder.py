@@ -0,0 +1,186 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Declarative pose setup.
+
+    Rigs describe constraints, custom properties and drivers as records with
+    add_constraint(), add_property() and add_driver(). The generator applies
+    the pending records of the armature in a single pose pass once all the
+    rigs are generated with apply_records(), and keeps the applied records
+    with their owning rig.
+"""
+
+from rna_prop_ui import rna_idprop_ui_prop_get
+
+from .utils import tag_playback_optional
+
+
+#=======================================================================
+# Constraints
+#=======================================================================
+
+def constraint_properties(const):
+    """ Returns the writable RNA properties of the type of a constraint.
+        The schema of each constraint type is only looked up once.
+    """
+    props = constraint_properties.cache.get(const.type)
+    if props is None:
+        props = frozenset(prop.identifier for prop in const.bl_rna.properties if not prop.is_readonly)
+        constraint_properties.cache[const.type] = props
+    return props
+
+constraint_properties.cache = {}
+
+
+def make_constraint(obj, pbone, constraint):
+    """ Creates a constraint on the pose bone right away.
+        constraint is a dict with the 'constraint' type and the attributes to
+        set, the ones not existing in that type of constraint being ignored.
+        The target defaults to the armature.
+        'playback_optional': True tags the constraint with tag_playback_optional().
+    """
+    const = pbone.constraints.new(constraint['constraint'])
+    const.target = obj
+
+    props = constraint_properties(const)
+    for key, value in constraint.items():
+        if key in props:
+            setattr(const, key, value)
+
+    if constraint.get('playback_optional'):
+        tag_playback_optional(pbone, const)
+
+    return const
+
+
+#=======================================================================
+# Records
+#=======================================================================
+
+def add_record(rig, kind, bone, **fields):
+    """ Queues a record of the given kind for the next apply_records().
+    """
+    if add_record.pending is None:
+        add_record.pending = []
+    if add_record.properties is None:
+        add_record.properties = {}
+    record = dict(fields, kind=kind, rig=rig, bone=bone)
+    add_record.pending.append(record)
+    if kind == 'PROPERTY':
+        add_record.properties.setdefault(record['name'], bone)
+    return record
+
+add_record.pending    = None
+add_record.applied    = None
+add_record.properties = None  # {property name: bone} of the first record of each property
+
+
+def add_constraint(rig, bone, constraint):
+    """ Records a constraint of the bone, described as in make_constraint().
+        Returns the record, which can be given to add_driver().
+    """
+    return add_record(rig, 'CONSTRAINT', bone, constraint=constraint, name=None)
+
+
+def add_property(rig, bone, name, value=0.0, description=None, minimum=0.0, maximum=1.0):
+    """ Records a float custom property of the pose bone, with its UI limits.
+    """
+    return add_record(
+        rig, 'PROPERTY', bone, name=name, value=value,
+        description=name if description is None else description,
+        minimum=minimum, maximum=maximum
+    )
+
+
+def recorded_property(name):
+    """ Returns the bone of the property name recorded during the current
+        generation, applied or still pending, or None.
+    """
+    return (add_record.properties or {}).get(name)
+
+
+def add_driver(rig, bone, constraint, prop_bone, prop, variable, driver_type='AVERAGE', coefficients=None):
+    """ Records a driver of a constraint influence, reading the custom property
+        prop of prop_bone through a single variable.
+        constraint is the record returned by add_constraint(), a constraint name
+        or a constraint index, resolved when the records are applied.
+        coefficients of a POLYNOMIAL modifier, (1.0, -1.0) inverts the property.
+    """
+    return add_record(
+        rig, 'DRIVER', bone, constraint=constraint, prop_bone=prop_bone, prop=prop,
+        variable=variable, driver_type=driver_type, coefficients=coefficients
+    )
+
+
+def apply_records(obj):
+    """ Applies all the pending records to the armature, in object mode:
+        the properties, then the constraints, then the drivers, which find
+        both by name. Returns the list of the applied records.
+    """
+    records = add_record.pending or []
+    add_record.pending = None
+    if not records:
+        return []
+
+    pb = obj.pose.bones
+    order = {'PROPERTY': 0, 'CONSTRAINT': 1, 'DRIVER': 2}
+    for record in sorted(records, key=lambda record: order[record['kind']]):
+        pbone = pb[record['bone']]
+        kind = record['kind']
+
+        if kind == 'CONSTRAINT':
+            record['name'] = make_constraint(obj, pbone, record['constraint']).name
+
+        elif kind == 'PROPERTY':
+            pbone[record['name']] = record['value']
+            prop = rna_idprop_ui_prop_get(pbone, record['name'], create=True)
+            prop["min"]         = record['minimum']
+            prop["max"]         = record['maximum']
+            prop["soft_min"]    = record['minimum']
+            prop["soft_max"]    = record['maximum']
+            prop["description"] = record['description']
+
+        elif kind == 'DRIVER':
+            constraint = record['constraint']
+            if isinstance(constraint, dict):
+                constraint = constraint['name']
+            fcurve = pbone.constraints[constraint].driver_add("influence")
+
+            drv = fcurve.driver
+            drv.type = record['driver_type']
+
+            var = drv.variables.new()
+            var.name = record['variable']
+            var.type = "SINGLE_PROP"
+            var.targets[0].id = obj
+            var.targets[0].data_path = 'pose.bones["%s"]["%s"]' % (record['prop_bone'], record['prop'])
+
+            if record['coefficients'] is not None:
+                drv_modifier = fcurve.modifiers[0]
+                drv_modifier.mode            = 'POLYNOMIAL'
+                drv_modifier.poly_order      = 1
+                drv_modifier.coefficients[0] = record['coefficients'][0]
+                drv_modifier.coefficients[1] = record['coefficients'][1]
+
+    if add_record.applied is None:
+        add_record.applied = []
+    add_record.applied += records
+
+    return records
@@ -0,0 +1,305 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+import bpy
+import hashlib
+import importlib.util
+import os
+
+from .utils import (
+    MODULE_NAME, RIG_DIR, is_org, is_mch, is_jig, get_wgt_name, create_control_keying_set
+)
+from .widget_builder import widget_collection, widget_segments
+
+CACHE_DIR = "gamerig_cache"  # Name of the cache directory in the user data directory
+
+
+#=======================================================================
+# Settings
+#=======================================================================
+
+def generation_cache(context):
+    """ Returns (cache directory, max entries) of the generated rig cache,
+        or (None, 0) if the cache is disabled.
+    """
+    addon = context.preferences.addons.get(MODULE_NAME)
+    if addon is None or not addon.preferences.use_generation_cache:
+        return None, 0
+
+    directory = bpy.path.abspath(addon.preferences.cache_directory) if addon.preferences.cache_directory \
+        else bpy.utils.user_resource('DATAFILES', CACHE_DIR, create=True)
+    os.makedirs(directory, exist_ok=True)
+    return directory, addon.preferences.cache_size
+
+
+#=======================================================================
+# Metarig fingerprint
+#=======================================================================
+
+def canonical(value):
+    """ Converts a RNA value to a hashable and precision stable value.
+    """
+    if isinstance(value, float):
+        return round(value, 5) + 0.0  # + 0.0 folds -0.0
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    try:
+        return tuple(canonical(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+
+def rna_values(struct, skip=()):
+    """ Returns the (identifier, value) of all the RNA properties of a struct.
+        Pointers are represented by the name of the pointed data.
+    """
+    values = []
+    for prop in struct.bl_rna.properties:
+        ident = prop.identifier
+        if ident == 'rna_type' or ident in skip or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, ident, None)
+        if prop.type == 'POINTER':
+            value = getattr(value, 'name', None)
+        values.append((ident, canonical(value)))
+    return values
+
+
+def addon_digest():
+    """ Returns a digest of the .py and .json sources of the add-on, read
+        once per session.
+    """
+    if addon_digest.value is None:
+        root = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for directory, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            for name in sorted(files):
+                if name.endswith(('.py', '.json')):
+                    path = os.path.join(directory, name)
+                    digest.update(os.path.relpath(path, root).replace(os.sep, '/').encode('utf-8'))
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+        addon_digest.value = digest.hexdigest()
+    return addon_digest.value
+
+addon_digest.value = None
+
+
+def is_cacheable(metarig):
+    """ True if the metarig is an armature whose rig types all exist, the
+        only metarigs whose rigs are looked up in or stored to the cache.
+    """
+    if metarig.type != 'ARMATURE':
+        return False
+    for pbone in metarig.pose.bones:
+        rig_type = pbone.gamerig_type.replace(" ", "")
+        if not rig_type:
+            continue
+        try:
+            if importlib.util.find_spec("%s.%s.%s" % (MODULE_NAME, RIG_DIR, rig_type)) is None:
+                return False
+        except ImportError:
+            return False
+    return True
+
+
+def metarig_fingerprint(metarig):
+    """ Returns a deterministic digest of everything the generated rig depends on.
+    """
+    from . import bl_info
+
+    digest = hashlib.sha256()
+
+    def feed(*values):
+        digest.update(repr(values).encode('utf-8'))
+
+    arm = metarig.data
+    feed('gamerig', bl_info['version'], addon_digest(), arm.gamerig_rig_name, arm.gamerig_rig_ui_template, canonical(arm.layers))
+    feed('widget_segments', widget_segments())
+
+    for layer in arm.gamerig_layers:
+        feed('layer', rna_values(layer))
+    for color in arm.gamerig_colors:
+        feed('color', rna_values(color))
+    feed('selection_colors', rna_values(arm.gamerig_selection_colors))
+
+    for bone in arm.bones:
+        feed('bone', rna_values(bone, skip=('select', 'select_head', 'select_tail', 'hide')))
+
+    for pbone in metarig.pose.bones:
+        feed(
+            'pose_bone', pbone.name, pbone.gamerig_type, pbone.rotation_mode,
+            canonical(pbone.lock_location), canonical(pbone.lock_rotation),
+            pbone.lock_rotation_w, pbone.lock_rotations_4d, canonical(pbone.lock_scale),
+        )
+        feed('parameters', rna_values(pbone.gamerig_parameters))
+        feed('custom', sorted((key, canonical(pbone[key])) for key in pbone.keys() if key != '_RNA_UI'))
+        for con in pbone.constraints:
+            feed('constraint', rna_values(con))
+
+    if metarig.animation_data:
+        for fcu in metarig.animation_data.drivers:
+            feed('driver', fcu.data_path, fcu.array_index, rna_values(fcu.driver))
+            for var in fcu.driver.variables:
+                feed('variable', rna_values(var), [rna_values(target) for target in var.targets])
+            for mod in fcu.modifiers:
+                feed('modifier', rna_values(mod))
+
+    return digest.hexdigest()
+
+
+#=======================================================================
+# Cache access
+#=======================================================================
+
+def cache_path(directory, fingerprint):
+    return os.path.join(directory, fingerprint + ".blend")
+
+
+def prune_cache(directory, size):
+    """ Removes the least recently used entries over size.
+    """
+    entries = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".blend")]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[size:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def store_cached_rig(rig, directory, fingerprint, size):
+    """ Saves the generated rig (with widgets and UI script as dependencies) to the cache.
+    """
+    path = cache_path(directory, fingerprint)
+    temp_path = path + ".tmp"
+    bpy.data.libraries.write(temp_path, {rig}, fake_user=False)
+    os.replace(temp_path, path)
+    prune_cache(directory, size)
+
+
+def load_cached_rig(context, metarig, directory, fingerprint, rig_name, rig_id, old_rig):
+    """ Appends the cached rig of the fingerprint in place of old_rig.
+        Returns the rig object, or None on a cache miss.
+    """
+    path = cache_path(directory, fingerprint)
+    if not os.path.exists(path):
+        return None
+
+    # Touch for LRU
+    os.utime(path, None)
+
+    # The appended UI script must take its name back
+    rig_ui_name = 'gamerig_ui_%s.py' % rig_id
+    if rig_ui_name in bpy.data.texts:
+        bpy.data.texts.remove(bpy.data.texts[rig_ui_name])
+
+    old_shapes = set()
+    if old_rig is not None:
+        old_shapes = set(pbone.custom_shape for pbone in old_rig.pose.bones if pbone.custom_shape is not None)
+
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.objects = [name for name in data_from.objects if name == rig_name]
+
+    rig = data_to.objects[0] if data_to.objects else None
+    if rig is None:
+        return None
+
+    context.collection.objects.link(rig)
+
+    if old_rig is not None:
+        # Take over the users of the rig being replaced
+        for objt in context.scene.objects:
+            for mod in objt.modifiers:
+                if mod.type == 'ARMATURE' and mod.object == old_rig:
+                    mod.object = rig
+        for child in list(old_rig.children):
+            if 'gamerig_spline' in child:
+                # Generated with the rig, the cached rig comes with its own
+                curve = child.data
+                bpy.data.objects.remove(child)
+                if curve.users == 0:
+                    bpy.data.curves.remove(curve)
+                continue
+            mat = child.matrix_world.copy()
+            sub_parent = child.parent_bone
+            child.parent = rig
+            child.parent_type = 'BONE' if sub_parent in rig.pose.bones else 'OBJECT'
+            child.parent_bone = sub_parent if sub_parent in rig.pose.bones else ''
+            child.matrix_world = mat
+
+        old_data = old_rig.data
+        old_widgets = widget_collection(context, rig_name, context.collection)
+        bpy.data.objects.remove(old_rig)
+        if old_data.users == 0:
+            bpy.data.armatures.remove(old_data)
+        for shape in old_shapes:
+            if shape.name in old_widgets.objects and len(shape.users_collection) == 1:
+                old_widgets.objects.unlink(shape)
+            if shape.users == 0:
+                mesh = shape.data
+                bpy.data.objects.remove(shape)
+                if mesh is not None and mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
+
+        rig.name = rig_name
+
+    # Curves of the rig, with their regular names
+    for child in rig.children:
+        if 'gamerig_spline' in child:
+            if child.name not in context.scene.objects:
+                context.collection.objects.link(child)
+            if child.name != child['gamerig_spline'] and child['gamerig_spline'] not in bpy.data.objects:
+                child.name = child['gamerig_spline']
+
+    # Widgets get their regular names back when the old ones are gone
+    widgets = widget_collection(context, rig_name, context.collection)
+    for pbone in rig.pose.bones:
+        shape = pbone.custom_shape
+        if shape is not None:
+            wgt_name = get_wgt_name(rig_name, pbone.name)
+            if shape.name != wgt_name and wgt_name not in bpy.data.objects:
+                shape.name = wgt_name
+            if not shape.users_collection:
+                widgets.objects.link(shape)
+
+    # Set location generated rig to metarig location
+    rig.location            = metarig.location
+    rig.rotation_mode       = metarig.rotation_mode
+    rig.rotation_euler      = metarig.rotation_euler
+    rig.rotation_quaternion = metarig.rotation_quaternion
+    rig.rotation_axis_angle = metarig.rotation_axis_angle
+    rig.scale               = metarig.scale
+
+    # Select generated rig object
+    metarig.select_set(False)
+    rig.select_set(True)
+    rig.hide_viewport = False
+    context.view_layer.objects.active = rig
+
+    # Run UI script
+    if rig_ui_name in bpy.data.texts:
+        exec(bpy.data.texts[rig_ui_name].as_string(), {})
+
+    controls = [bone.name for bone in rig.data.bones if not (is_org(bone.name) or is_mch(bone.name) or is_jig(bone.name))]
+    create_control_keying_set(context.scene, rig, controls)
+
+    return rig
@@ -0,0 +1,457 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Generate-once-then-clone of structurally identical rig instances.
+
+    Rig instances of a CLONEABLE rig type (and not setting their cloneable
+    attribute to False) with the same parameters and a congruent ORG bone
+    tree (same shape up to a rigid transform, or mirrored in X) are not
+    generated again: the bones, constraints, drivers, widgets and UI script
+    of the first generated instance are replicated onto them.
+
+    A rig type opts in with a module level CLONEABLE = True, its instances
+    being cloned when the 'Clone Identical Rigs' preference is enabled.
+    Cloning takes precedence over batching: the instances of a batch capable
+    type taking part in a clone are left out of its batch.
+"""
+
+import bpy
+import re
+import sys
+from mathutils import Matrix
+from rna_prop_ui import rna_idprop_ui_prop_get
+
+from .utils import (
+    MODULE_NAME, is_org, basename, mirror_name, copy_attributes,
+    tag_playback_optional, pose_bone_path_pattern
+)
+from .cache import rna_values, canonical
+from .builder import add_record
+from .widget_builder import queue_widget, queued_widget
+
+X_MIRROR = Matrix.Scale(-1.0, 4, (1.0, 0.0, 0.0))
+EPSILON = 1e-4
+
+EDIT_BONE_ATTRIBUTES = (
+    'layers', 'use_inherit_rotation', 'use_inherit_scale', 'use_local_location', 'use_deform',
+    'bbone_segments', 'bbone_easein', 'bbone_easeout',
+)
+
+POSE_BONE_ATTRIBUTES = (
+    'rotation_mode', 'lock_location', 'lock_scale', 'lock_rotation', 'lock_rotation_w', 'lock_rotations_4d',
+)
+
+
+def use_instance_cloning(context):
+    addon = context.preferences.addons.get(MODULE_NAME)
+    return addon is not None and addon.preferences.use_instance_cloning
+
+
+#=======================================================================
+# Planning
+#=======================================================================
+
+def instance_bones(obj, bone_name):
+    """ Returns the ORG bones of a rig instance: the rig bone and its
+        descendants up to the bones starting another rig instance.
+    """
+    bones = obj.data.bones
+    pbones = obj.pose.bones
+    names = []
+    stack = [bone_name]
+    while stack:
+        name = stack.pop()
+        names.append(name)
+        children = sorted((child.name for child in bones[name].children if not pbones[child.name].gamerig_type), reverse=True)
+        stack += children
+    return names
+
+
+def instance_signature(obj, rig, bone_name, names):
+    """ Rig type, parameters and bone tree shape of a rig instance.
+    """
+    bones = obj.data.bones
+    index = {name: i for i, name in enumerate(names)}
+    shape = tuple(
+        (index.get(bones[name].parent.name, -1) if bones[name].parent else -1, bones[name].use_connect)
+        for name in names
+    )
+    params = rna_values(obj.pose.bones[bone_name].gamerig_parameters)
+    return (type(rig).__module__, canonical(params), shape)
+
+
+def congruent_transform(obj, source, target, mirror):
+    """ Returns the armature space matrix carrying the source instance bones
+        onto the target ones, or None if they are not congruent.
+    """
+    bones = obj.data.bones
+    if mirror:
+        transform = X_MIRROR
+    else:
+        transform = bones[target[0]].matrix_local @ bones[source[0]].matrix_local.inverted()
+
+    pairs = list(zip(source, target))
+    # The parent of the instance holds the generated bones too
+    src_parent, tgt_parent = bones[source[0]].parent, bones[target[0]].parent
+    if (src_parent is None) != (tgt_parent is None):
+        return None
+    if src_parent is not None:
+        pairs.append((src_parent.name, tgt_parent.name))
+
+    rotation = transform.to_3x3()
+    for s, t in pairs:
+        bs, bt = bones[s], bones[t]
+        if (transform @ bs.head_local - bt.head_local).length > EPSILON:
+            return None
+        if (transform @ bs.tail_local - bt.tail_local).length > EPSILON:
+            return None
+        if (rotation @ bs.z_axis).normalized().dot(bt.z_axis) < 1.0 - EPSILON:
+            return None
+
+    return transform
+
+
+def plan_clones(obj, rigs, rig_bones):
+    """ Returns {target rig bone: (source rig bone, source bones, target bones, mirror, transform)}.
+        Must be called in object mode before the rigs are generated.
+    """
+    plan = {}
+    sources = {}
+    for rig, bone_name in zip(rigs, rig_bones):
+        if not getattr(sys.modules[type(rig).__module__], 'CLONEABLE', False) or not getattr(rig, 'cloneable', True):
+            continue
+        names = instance_bones(obj, bone_name)
+        signature = instance_signature(obj, rig, bone_name, names)
+        candidates = sources.setdefault(signature, [])
+
+        for source_bone, source_names in candidates:
+            mirror = mirror_name(source_bone) == bone_name
+            if mirror:
+                target_names = [mirror_name(name) for name in source_names]
+                if None in target_names or set(target_names) != set(names):
+                    continue
+            else:
+                target_names = names
+            transform = congruent_transform(obj, source_names, target_names, mirror)
+            if transform is not None:
+                plan[bone_name] = (source_bone, source_names, target_names, mirror, transform)
+                break
+        else:
+            candidates.append((bone_name, names))
+
+    return plan
+
+
+#=======================================================================
+# Name remapping
+#=======================================================================
+
+def name_stems(pairs):
+    """ Returns {source stem: target stem} from corresponding names,
+        the stem being what remains once the common ending is removed.
+    """
+    stems = {}
+    for s, t in pairs:
+        s, t = basename(s), basename(t)
+        i = 0
+        while i < min(len(s), len(t)) and s[-1 - i] == t[-1 - i]:
+            i += 1
+        s_stem, t_stem = s[:len(s) - i], t[:len(t) - i]
+        if not s_stem or stems.get(s_stem, t_stem) != t_stem:
+            return None
+        stems[s_stem] = t_stem
+    return stems
+
+
+class NameMap:
+    """ Maps the names of the source instance to the target instance.
+    """
+    def __init__(self, obj, source, target, mirror):
+        bones = obj.data.bones
+        self.mirror = mirror
+        self.names = dict(zip(source, target))
+        if bones[source[0]].parent is not None:
+            self.names[bones[source[0]].parent.name] = bones[target[0]].parent.name
+        self.stems = None if mirror else name_stems(zip(source, target))
+
+    def __call__(self, name):
+        if not name:
+            return name
+        if name in self.names:
+            return self.names[name]
+        if self.mirror:
+            return mirror_name(name) or name
+        for stem in sorted(self.stems, key=len, reverse=True):
+            if stem in name:
+                return name.replace(stem, self.stems[stem], 1)
+        return name
+
+
+quoted_string_pattern = re.compile(r'''(['"])([^'"\n]*)\1''')
+
+
+def remap_script(script, remap):
+    return quoted_string_pattern.sub(lambda m: m.group(1) + remap(m.group(2)) + m.group(1), script)
+
+
+def remap_data_path(data_path, remap):
+    match = pose_bone_path_pattern.match(data_path)
+    if match is None:
+        return data_path
+    bone_name, attr = match.groups()
+    return 'pose.bones["%s"]%s' % (remap(bone_name), ('.' + attr) if attr and not attr.startswith('[') else attr)
+
+
+#=======================================================================
+# Cloning
+#=======================================================================
+
+def is_array_property(obj, data_path):
+    """ True if the property at data_path is an array, driven per index.
+    """
+    value = obj.path_resolve(data_path)
+    return hasattr(value, '__len__') and not isinstance(value, str)
+
+
+def clone_record(record, rig, remap, copies):
+    """ Adds the pending record of the source instance for the target instance.
+        copies maps the ids of the source records to their copies, for the
+        drivers of recorded constraints.
+    """
+    fields = dict((key, value) for key, value in record.items() if key not in ('kind', 'rig', 'bone'))
+    kind = record['kind']
+    if kind == 'CONSTRAINT':
+        constraint = dict(record['constraint'])
+        for attr in ('subtarget', 'pole_subtarget'):
+            if constraint.get(attr):
+                constraint[attr] = remap(constraint[attr])
+        fields['constraint'] = constraint
+        fields['name'] = None
+    elif kind == 'DRIVER':
+        if isinstance(record['constraint'], dict):
+            fields['constraint'] = copies.get(id(record['constraint']), record['constraint'])
+        fields['prop_bone'] = remap(record['prop_bone'])
+    copy = add_record(rig, kind, remap(record['bone']), **fields)
+    copies[id(record)] = copy
+    return copy
+
+
+def clone_rig_instance(obj, source, plan_entry, rig=None):
+    """ Replicates the generated source instance onto the target instance.
+        source is the record of the source instance generation:
+        {'owned', 'first_constraint', 'records', 'scripts', 'tags'}, records
+        being its pose records, still pending. rig is the target instance,
+        owning the copies of the records.
+        Returns the record of the clone, or None if it can't be cloned
+        (nothing is changed in that case).
+    """
+    source_bone, source_names, target_names, mirror, transform = plan_entry
+    if not mirror and name_stems(zip(source_names, target_names)) is None:
+        return None
+    remap = NameMap(obj, source_names, target_names, mirror)
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    eb = obj.data.edit_bones
+
+    owned = source['owned']
+    new_bones = [name for name in owned if not is_org(name)]
+    owned_org = [name for name in owned if is_org(name)]
+
+    # Validate before touching anything
+    mapped = [remap(name) for name in new_bones]
+    if len(set(mapped)) != len(mapped) or any(t == s or t in eb for s, t in zip(new_bones, mapped)):
+        return None
+    if any(remap(name) not in eb for name in owned_org):
+        return None
+    known = set(eb.keys()) | set(mapped)
+    pb = obj.pose.bones
+    for name in owned:
+        for con in pb[name].constraints[source['first_constraint'].get(name, 0):]:
+            for attr in ('subtarget', 'pole_subtarget'):
+                subtarget = getattr(con, attr, '')
+                if subtarget and remap(subtarget) not in known:
+                    return None
+    for record in source['records']:
+        if remap(record['bone']) not in known:
+            return None
+        for attr in ('subtarget', 'pole_subtarget'):
+            subtarget = record.get('constraint', {}).get(attr) if record['kind'] == 'CONSTRAINT' else None
+            if subtarget and remap(subtarget) not in known:
+                return None
+
+    # Edit bones
+    rotation = transform.to_3x3()
+    for s, t in zip(new_bones, mapped):
+        src = eb[s]
+        dst = eb.new(t)
+        dst.head = transform @ src.head
+        dst.tail = transform @ src.tail
+        if mirror:
+            dst.roll = -src.roll
+        else:
+            dst.align_roll(rotation @ src.z_axis)
+        for attr in EDIT_BONE_ATTRIBUTES:
+            setattr(dst, attr, getattr(src, attr))
+
+    for s in new_bones + source_names:
+        src, dst = eb[s], eb[remap(s)]
+        parent = eb.get(remap(src.parent.name)) if src.parent else None
+        dst.parent = parent
+        dst.use_connect = src.use_connect and parent is not None
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    pb = obj.pose.bones
+
+    # Pose bones, custom properties and constraints
+    copied_constraints = set()
+    for s in owned:
+        src, dst = pb[s], pb[remap(s)]
+        if s in new_bones:
+            for attr in POSE_BONE_ATTRIBUTES:
+                value = getattr(src, attr)
+                setattr(dst, attr, value if isinstance(value, (bool, str)) else tuple(value))
+            dst.bone_group = src.bone_group
+            dst.bone.hide = src.bone.hide
+            if src.custom_shape_transform is not None:
+                dst.custom_shape_transform = pb.get(remap(src.custom_shape_transform.name))
+            for key in src.keys():
+                if key != "_RNA_UI":
+                    prop1 = rna_idprop_ui_prop_get(src, key, create=False)
+                    dst[key] = src[key]
+                    if prop1 is not None:
+                        prop2 = rna_idprop_ui_prop_get(dst, key, create=True)
+                        for k in prop1.keys():
+                            prop2[k] = prop1[k]
+
+        for con in src.constraints[source['first_constraint'].get(s, 0):]:
+            copy = dst.constraints.new(con.type)
+            copy_attributes(con, copy)
+            for attr in ('subtarget', 'pole_subtarget'):
+                if getattr(con, attr, ''):
+                    setattr(copy, attr, remap(getattr(con, attr)))
+            copied_constraints.add(con.path_from_id())
+
+    # Pose records, applied with the ones of the other rigs
+    copies = {}
+    records = [clone_record(record, rig, remap, copies) for record in source['records']]
+
+    # Drivers
+    if obj.animation_data:
+        new_set = set(new_bones)
+        for fcu in list(obj.animation_data.drivers):
+            match = pose_bone_path_pattern.match(fcu.data_path)
+            if match is None or match.group(1) not in owned:
+                continue
+            if match.group(1) not in new_set and fcu.data_path.rsplit('.', 1)[0] not in copied_constraints:
+                continue
+            data_path = remap_data_path(fcu.data_path, remap)
+            if is_array_property(obj, fcu.data_path):
+                copy = obj.driver_add(data_path, fcu.array_index)
+            else:
+                copy = obj.driver_add(data_path)
+            copy_attributes(fcu.driver, copy.driver)
+            for mod in copy.modifiers:
+                copy.modifiers.remove(mod)
+            for mod in fcu.modifiers:
+                copy_attributes(mod, copy.modifiers.new(type=mod.type))
+            for var in fcu.driver.variables:
+                var_copy = copy.driver.variables.new()
+                copy_attributes(var, var_copy)
+                for target, target_copy in zip(var.targets, var_copy.targets):
+                    copy_attributes(target, target_copy)
+                    target_copy.data_path = remap_data_path(target.data_path, remap)
+                    if target.bone_target:
+                        target_copy.bone_target = remap(target.bone_target)
+
+    # Widgets
+    for s in new_bones:
+        src_wgt = queued_widget(s)
+        if src_wgt is None:
+            continue
+        if mirror:
+            queue_widget(
+                obj, remap(s), [(-v[0], v[1], v[2]) for v in src_wgt['verts']], src_wgt['edges'], src_wgt['faces'],
+                bone_transform_name=remap(src_wgt['transform']), subsurf=src_wgt['subsurf'],
+                mesh_props=src_wgt['mesh_props']
+            )
+        else:
+            queue_widget(
+                obj, remap(s), src_wgt['verts'], src_wgt['edges'], src_wgt['faces'],
+                bone_transform_name=remap(src_wgt['transform']), mesh_of=s, subsurf=src_wgt['subsurf']
+            )
+
+    # Playback mode tags
+    for bone_name, const_name in source['tags']:
+        tag_playback_optional(pb[remap(bone_name)], pb[remap(bone_name)].constraints[const_name])
+
+    return {
+        'owned'            : [remap(name) for name in owned],
+        'first_constraint' : {remap(name): count for name, count in source['first_constraint'].items()},
+        'records'          : records,
+        'scripts'          : [remap_script(script, remap) for script in source['scripts']],
+        'tags'             : [(remap(b), c) for b, c in source['tags']],
+    }
+
+
+#=======================================================================
+# Verification
+#=======================================================================
+
+def rig_signature(obj):
+    """ Structural description of a generated rig, to compare rigs generated
+        with and without cloning.
+    """
+    signature = {}
+    for bone in obj.data.bones:
+        pbone = obj.pose.bones[bone.name]
+        signature[bone.name] = (
+            bone.parent.name if bone.parent else None, bone.use_connect, bone.use_deform,
+            canonical(bone.head_local), canonical(bone.tail_local), canonical(bone.z_axis),
+            canonical(bone.layers), pbone.rotation_mode,
+            canonical(pbone.lock_location), canonical(pbone.lock_rotation), canonical(pbone.lock_scale),
+            pbone.custom_shape is not None,
+            tuple(sorted((key, canonical(pbone[key])) for key in pbone.keys() if key != '_RNA_UI')),
+            tuple(
+                (con.type, con.name, getattr(con, 'subtarget', ''), getattr(con, 'pole_subtarget', ''),
+                 canonical(con.influence))
+                for con in pbone.constraints
+            ),
+        )
+    if obj.animation_data:
+        for fcu in obj.animation_data.drivers:
+            signature[(fcu.data_path, fcu.array_index)] = (
+                fcu.driver.type, fcu.driver.expression,
+                tuple((var.name, var.type, tuple(t.data_path for t in var.targets)) for var in fcu.driver.variables),
+            )
+    return signature
+
+
+def compare_rig_signatures(a, b):
+    """ Returns the list of differences between two rig signatures.
+    """
+    differences = []
+    for key in sorted(set(a) | set(b), key=str):
+        if key not in a:
+            differences.append("missing in first: %s" % (key,))
+        elif key not in b:
+            differences.append("missing in second: %s" % (key,))
+        elif a[key] != b[key]:
+            differences.append("differs: %s\n    %s\n    %s" % (key, a[key], b[key]))
+    return differences
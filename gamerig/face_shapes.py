@@ -0,0 +1,277 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Face shape key output.
+
+    A face generated with the SHAPE_KEYS output keeps all its controls, but
+    its ORG bones (but the face root and the eyes) don't deform. Instead,
+    bake_face_shapes() poses the face controls at their extreme values with
+    the ORG bones deforming, captures the deformed meshes bound to the rig as
+    shape keys driven by the controls, and moves the skin weights of the ORG
+    bones to the face root.
+"""
+
+import bpy
+import json
+import numpy as np
+from mathutils import Matrix
+
+from .utils import MetarigError
+
+SHAPES_PROP = 'gamerig_face_shapes'  # Custom property of the face root holding the shape output
+SHAPE_KEY_PREFIX = 'GRF-'            # Prefix of the baked shape keys
+BACKUP_SUFFIX = '.unbaked'           # Suffix of the copy of the original face root weights
+EPSILON = 1e-5                       # Shapes moving no vertex further than this are not kept
+
+CHANNEL_MATRIX = {
+    'LOC_X' : lambda value: Matrix.Translation((value, 0.0, 0.0)),
+    'LOC_Y' : lambda value: Matrix.Translation((0.0, value, 0.0)),
+    'LOC_Z' : lambda value: Matrix.Translation((0.0, 0.0, value)),
+    'ROT_X' : lambda value: Matrix.Rotation(value, 4, 'X'),
+    'ROT_Y' : lambda value: Matrix.Rotation(value, 4, 'Y'),
+    'ROT_Z' : lambda value: Matrix.Rotation(value, 4, 'Z'),
+}
+
+
+def face_shape_output(face_bone, controls, bones, eyes):
+    """ Stores on the face root pose bone the shape output of a face.
+        controls is a list of (control bone, transform channel, extreme value),
+        bones the ORG bones replaced by shape keys and eyes the ORG bones that
+        keep deforming, left out of the shapes.
+    """
+    face_bone[SHAPES_PROP] = json.dumps({ 'controls' : controls, 'bones' : bones, 'eyes' : eyes })
+
+
+def face_shape_outputs(rig):
+    """ Returns the (face root, shape output) of all faces of the rig with the SHAPE_KEYS output.
+    """
+    return [ (pbone.name, json.loads(pbone[SHAPES_PROP])) for pbone in rig.pose.bones if SHAPES_PROP in pbone ]
+
+
+def shape_key_name(control, channel, extreme):
+    return "%s%s_%s%s" % (SHAPE_KEY_PREFIX, control, channel, '+' if extreme > 0 else '-')
+
+
+def bound_meshes(context, rig):
+    """ Returns the meshes of the scene deformed by the rig.
+    """
+    return [
+        objt for objt in context.scene.objects
+        if objt.type == 'MESH' and any(mod.type == 'ARMATURE' and mod.object == rig for mod in objt.modifiers)
+    ]
+
+
+#=======================================================================
+# Capture
+#=======================================================================
+
+def evaluated_coordinates(context, obj):
+    """ Returns the (n, 3) array of the deformed vertex coordinates of a mesh.
+    """
+    depsgraph = context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        count = len(obj.data.vertices)
+        if len(mesh.vertices) != count:
+            raise MetarigError("gamerig.face_shapes: modifiers of '%s' change its vertex count" % obj.name)
+        co = np.empty(count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+    finally:
+        eval_obj.to_mesh_clear()
+    return co.reshape(count, 3)
+
+
+def capture_shapes(context, rig, meshes, controls):
+    """ Poses each control at its extreme value from the rest pose, and returns
+        { mesh name : [ (control, channel, extreme, (n, 3) deltas) ] }.
+    """
+    pb = rig.pose.bones
+
+    context.view_layer.update()
+    rest = { objt.name : evaluated_coordinates(context, objt) for objt in meshes }
+    shapes = { objt.name : [] for objt in meshes }
+
+    for control, channel, extreme in controls:
+        if control not in pb:
+            continue
+        pb[control].matrix_basis = CHANNEL_MATRIX[channel](extreme)
+        context.view_layer.update()
+
+        for objt in meshes:
+            delta = evaluated_coordinates(context, objt) - rest[objt.name]
+            if np.abs(delta).max(initial=0.0) > EPSILON:
+                shapes[objt.name].append( (control, channel, extreme, delta) )
+
+        pb[control].matrix_basis = Matrix.Identity(4)
+
+    return shapes
+
+
+#=======================================================================
+# Output
+#=======================================================================
+
+def remove_baked_shape_keys(obj):
+    key = obj.data.shape_keys
+    if key is None:
+        return
+    for block in [ block for block in key.key_blocks if block.name.startswith(SHAPE_KEY_PREFIX) ]:
+        key.driver_remove('key_blocks["%s"].value' % block.name)
+        obj.shape_key_remove(block)
+
+
+def add_shape_keys(obj, rig, shapes):
+    """ Adds the captured shapes to the mesh as shape keys driven by their controls.
+    """
+    if obj.data.shape_keys is None:
+        obj.shape_key_add(name='Basis', from_mix=False)
+    key = obj.data.shape_keys
+
+    basis = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    key.reference_key.data.foreach_get('co', basis)
+    basis = basis.reshape(-1, 3)
+
+    for control, channel, extreme, delta in shapes:
+        name = shape_key_name(control, channel, extreme)
+        block = obj.shape_key_add(name=name, from_mix=False)
+        block.data.foreach_set('co', (basis + delta).ravel())
+
+        fcurve = key.driver_add('key_blocks["%s"].value' % block.name)
+        drv = fcurve.driver
+        drv.type = 'SCRIPTED'
+        drv.expression = 'max(0.0, var * %r)' % (1.0 / extreme)
+
+        var = drv.variables.new()
+        var.name = 'var'
+        var.type = 'TRANSFORMS'
+        var.targets[0].id = rig
+        var.targets[0].bone_target = control
+        var.targets[0].transform_type = channel
+        var.targets[0].transform_space = 'LOCAL_SPACE'
+
+
+def vertex_weights(obj, names):
+    """ Returns { group name : (n,) array of weights } of the vertex groups of the mesh.
+    """
+    groups = { obj.vertex_groups[name].index : name for name in names if name in obj.vertex_groups }
+    weights = { name : np.zeros(len(obj.data.vertices), dtype=np.float32) for name in groups.values() }
+    for vert in obj.data.vertices:
+        for elem in vert.groups:
+            name = groups.get(elem.group)
+            if name is not None:
+                weights[name][vert.index] = elem.weight
+    return weights
+
+
+def set_vertex_weights(obj, name, weights):
+    group = obj.vertex_groups.get(name)
+    if group is None:
+        group = obj.vertex_groups.new(name=name)
+    group.remove(range(len(weights)))
+    for index in np.flatnonzero(weights):
+        group.add([int(index)], float(weights[index]), 'REPLACE')
+
+
+def restore_face_weights(obj, face):
+    """ Gives back to the face root its weights before the previous bake.
+    """
+    backup = obj.vertex_groups.get(face + BACKUP_SUFFIX)
+    if backup is not None:
+        set_vertex_weights(obj, face, vertex_weights(obj, [backup.name])[backup.name])
+
+
+def merge_face_weights(obj, face, bones):
+    """ Adds the weights of the replaced bones to the face root, so that what
+        they deformed follows the face. The original face root weights are
+        kept for the next bake.
+    """
+    backup_name = face + BACKUP_SUFFIX
+    weights = vertex_weights(obj, [face] + list(bones))
+    rest = weights.get(face, np.zeros(len(obj.data.vertices), dtype=np.float32))
+    if backup_name not in obj.vertex_groups:
+        set_vertex_weights(obj, backup_name, rest)
+
+    merged = rest + sum(weights[bone] for bone in bones if bone in weights)
+    set_vertex_weights(obj, face, np.minimum(merged, 1.0))
+
+
+#=======================================================================
+# Bake
+#=======================================================================
+
+def bake_face_shapes(context, rig):
+    """ Bakes the shape keys of all the faces of the rig with the SHAPE_KEYS
+        output into the meshes it deforms. Returns the number of shape keys.
+    """
+    outputs = face_shape_outputs(rig)
+    if not outputs:
+        raise MetarigError("gamerig.face_shapes: '%s' has no face with the shape keys output" % rig.name)
+
+    meshes = bound_meshes(context, rig)
+    bones = rig.data.bones
+    pb = rig.pose.bones
+
+    # Bake from the rest pose, deforming with the face bones and with the armature modifiers only
+    pose = { pbone.name : pbone.matrix_basis.copy() for pbone in pb }
+    pose_position = rig.data.pose_position
+    modifiers = [ mod for objt in meshes for mod in objt.modifiers if mod.type != 'ARMATURE' and mod.show_viewport ]
+    for pbone in pb:
+        pbone.matrix_basis = Matrix.Identity(4)
+    rig.data.pose_position = 'POSE'
+    for mod in modifiers:
+        mod.show_viewport = False
+
+    count = 0
+    try:
+        for objt in meshes:
+            remove_baked_shape_keys(objt)
+
+        for face, output in outputs:
+            for objt in meshes:
+                restore_face_weights(objt, face)
+            for bone in output['bones']:
+                bones[bone].use_deform = True
+            for bone in output['eyes']:
+                bones[bone].use_deform = False
+
+            shapes = capture_shapes(context, rig, meshes, output['controls'])
+
+            for bone in output['bones']:
+                bones[bone].use_deform = False
+            for bone in output['eyes']:
+                bones[bone].use_deform = True
+            for objt in meshes:
+                add_shape_keys(objt, rig, shapes[objt.name])
+                merge_face_weights(objt, face, output['bones'])
+                count += len(shapes[objt.name])
+    finally:
+        for face, output in outputs:
+            for bone in output['bones']:
+                bones[bone].use_deform = False
+            for bone in output['eyes']:
+                bones[bone].use_deform = True
+        for mod in modifiers:
+            mod.show_viewport = True
+        rig.data.pose_position = pose_position
+        for name, matrix in pose.items():
+            pb[name].matrix_basis = matrix
+
+    return count
@@ -27,10 +27,15 @@ from rna_prop_ui import rna_idprop_ui_prop_get
 from .utils import (
     get_rig_type, create_widget, assign_and_unlink_all_widgets,
     is_org, is_mch,is_jig,  org, get_wgt_name, random_id,
-    copy_attributes, gamma_correct, get_rig_name,
+    copy_attributes, gamma_correct, get_rig_name, symmetrical_pairs,
+    create_control_keying_set, tag_playback_optional, playback_optional_mechanism,
     MetarigError
 )
 from . import rig_lists
+from .cache import generation_cache, is_cacheable, metarig_fingerprint, load_cached_rig, store_cached_rig
+from .clone import use_instance_cloning, plan_clones, clone_rig_instance
+from .builder import add_record, apply_records
+from .widget_builder import queue_widget, share_widget, build_widgets, widget_collection
 
 
 RIG_MODULE = "rigs"
@@ -41,21 +46,40 @@ MCH_LAYER = [n == 30 for n in range(0, 32)]  # Armature layer that mechanism bon
 class Timer:
     def __init__(self):
         self.timez = time.time()
+        self.records = []
 
     def tick(self, string):
         t = time.time()
         print(string + "%.3f" % (t - self.timez))
+        self.records.append((string.rstrip(': '), t - self.timez))
         self.timez = t
 
 
 # TODO: generalize to take a group as input instead of an armature.
-def generate_rig(context, metarig):
+def generate_rig(context, metarig, use_cloning=None, use_batching=True, profile=False):
     """ Generates a rig from a metarig.
+        use_cloning overrides the 'Clone Identical Rigs' preference when not None.
+        use_batching generates all the instances of the rig types having a
+        generate_batch() class method at once, but for the cloned ones.
+        profile keeps the bones of each rig instance in generate_rig.rig_bones.
     """
     t = Timer()
 
     # clear created widget list
     create_widget.created_widgets = None
+    queue_widget.pending = None
+    share_widget.pending = None
+
+    # clear tagged playback optional mechanism
+    tag_playback_optional.constraints = None
+
+    # clear declarative pose records
+    add_record.pending    = None
+    add_record.applied    = None
+    add_record.properties = None
+
+    # sizes of the batches of batch capable rig types, for tooling
+    generate_rig.batch_sizes = []
 
     # Find overwrite target rig if exists
     rig_name = get_rig_name(metarig)
@@ -71,6 +95,25 @@ def generate_rig(context, metarig):
     # different rigs don't collide id's
     rig_id = (obj.data.get("gamerig_id") if obj else None) or random_id()
 
+    # Identical metarigs get identical rigs from the generation cache.
+    # (rig id is derived from the fingerprint so cached rigs are reproducible)
+    # Metarigs that are not armatures or use missing rig types skip it.
+    cache_dir, cache_size = generation_cache(context)
+    if cache_dir and not is_cacheable(metarig):
+        cache_dir = None
+    if cache_dir:
+        bpy.ops.object.mode_set(mode='OBJECT')
+        ensure_layer_names(metarig)
+        fingerprint = metarig_fingerprint(metarig)
+        old_rig_id = rig_id
+        rig_id = random_id(seed=fingerprint)
+        if old_rig_id != rig_id and 'gamerig_ui_%s.py' % old_rig_id in bpy.data.texts:
+            bpy.data.texts.remove(bpy.data.texts['gamerig_ui_%s.py' % old_rig_id])
+
+        if load_cached_rig(context, metarig, cache_dir, fingerprint, rig_name, rig_id, obj) is not None:
+            t.tick("Load cached rig: ")
+            return
+
     # Initial configuration
     rest_backup = metarig.data.pose_position
     metarig.data.pose_position = 'REST'
@@ -115,7 +158,7 @@ def generate_rig(context, metarig):
         collection.objects.link(obj)
         # Put the rig_name in the armature custom properties
         rna_idprop_ui_prop_get(obj.data, "gamerig_id", create=True)
-        obj.data["gamerig_id"] = rig_id
+    obj.data["gamerig_id"] = rig_id
 
     obj.data.pose_position = 'POSE'
 
@@ -285,26 +328,110 @@ def generate_rig(context, metarig):
     try:
         # Collect/initialize all the rigs.
         rigs = []
+        rig_bones = []
         rigtypes = set()
+        rig_modules = {}
         for bone in bones_sorted:
             bpy.ops.object.mode_set(mode='EDIT')
-            rigs += get_bone_rigs(obj, bone, rigtypes)
+            bone_rigs = get_bone_rigs(obj, bone, rigtypes, rig_modules=rig_modules)
+            rigs += bone_rigs
+            rig_bones += [bone] * len(bone_rigs)
         t.tick("Initialize rigs: ")
 
+        # Structurally identical rig instances are cloned from the first one generated
+        if use_cloning is None:
+            use_cloning = use_instance_cloning(context)
+        bpy.ops.object.mode_set(mode='OBJECT')
+        clone_plan = {}
+        if use_cloning:
+            clone_plan = plan_clones(obj, rigs, rig_bones)
+        clone_sources = set(entry[0] for entry in clone_plan.values())
+        generated = {}
+
+        # Instances of batch capable rig types are generated together,
+        # in place of the first instance of their type. Cloning takes
+        # precedence: the clone sources and targets are generated on their own.
+        batches = {}  # {rig class: [rig instances]}
+        batched = set()
+        if use_batching:
+            for rig, rig_bone in zip(rigs, rig_bones):
+                if hasattr(type(rig), 'generate_batch') and rig_bone not in clone_plan and rig_bone not in clone_sources:
+                    batches.setdefault(type(rig), []).append(rig)
+                    batched.add(rig)
+        generate_rig.batch_sizes = [len(batch) for batch in batches.values()]
+
         # Generate all the rigs.
+        # The bones each rig instance creates or constrains are only looked up
+        # for the instances cloned later, and for all of them when profiling.
         tt = Timer()
         ui_scripts = []
-        for rig in rigs:
+        generate_rig.rig_bones = []
+        for rig, rig_bone in zip(rigs, rig_bones):
             # Go into editmode in the rig armature
             bpy.ops.object.mode_set(mode='OBJECT')
             context.view_layer.objects.active = obj
             obj.select_set(True)
+
+            if rig in batched:
+                batch = batches[type(rig)]
+                if rig is not batch[0]:
+                    continue
+                constraint_counts = bone_constraint_counts(obj) if profile else None
+                records_before = len(add_record.pending or [])
+                bpy.ops.object.mode_set(mode='EDIT')
+                ui_scripts += type(rig).generate_batch(batch, context)
+
+                # The bones of a batch are recorded as owned by its first instance
+                bpy.ops.object.mode_set(mode='OBJECT')
+                if profile:
+                    owned = owned_bones(obj, constraint_counts, (add_record.pending or [])[records_before:])
+                    generate_rig.rig_bones.append((rig_bone, rig.__module__.split('.', 2)[-1], owned))
+                tt.tick("Generate rig batch : %s x%d: " % (rig, len(batch)))
+                continue
+
+            plan_entry = clone_plan.get(rig_bone)
+            if plan_entry is not None and plan_entry[0] in generated:
+                record = clone_rig_instance(obj, generated[plan_entry[0]], plan_entry, rig)
+                if record is not None:
+                    ui_scripts += record['scripts']
+                    bpy.ops.object.mode_set(mode='OBJECT')
+                    if profile:
+                        generate_rig.rig_bones.append((rig_bone, rig.__module__.split('.', 2)[-1], record['owned']))
+                    tt.tick("Clone rig : %s: " % rig)
+                    continue
+
+            track = profile or rig_bone in clone_sources
+            constraint_counts = bone_constraint_counts(obj) if track else None
+            records_before = len(add_record.pending or [])
+            tags_before = len(tag_playback_optional.constraints or [])
             bpy.ops.object.mode_set(mode='EDIT')
             scripts = rig.generate(context)
             if scripts is not None:
                 ui_scripts.append(scripts[0])
+
+            # Record the bones this rig instance created or constrained
+            bpy.ops.object.mode_set(mode='OBJECT')
+            if track:
+                records = (add_record.pending or [])[records_before:]
+                owned = owned_bones(obj, constraint_counts, records)
+                if profile:
+                    generate_rig.rig_bones.append((rig_bone, rig.__module__.split('.', 2)[-1], owned))
+                if rig_bone in clone_sources:
+                    generated[rig_bone] = {
+                        'owned'            : owned,
+                        'first_constraint' : {bone: constraint_counts.get(bone, 0) for bone in owned},
+                        'records'          : records,
+                        'scripts'          : scripts[:1] if scripts else [],
+                        'tags'             : (tag_playback_optional.constraints or [])[tags_before:],
+                    }
+
             tt.tick("Generate rig : %s: " % rig)
         t.tick("Generate rigs: ")
+
+        # Constraints, properties and drivers of all the rigs in one pass
+        bpy.ops.object.mode_set(mode='OBJECT')
+        apply_records(obj)
+        t.tick("Apply pose records: ")
     except Exception as e:
         # Cleanup if something goes wrong
         print("GameRig: failed to generate rig.")
@@ -340,17 +467,23 @@ def generate_rig(context, metarig):
                         else:
                             target.data_path = 'pose.bones["%s"]["%s"]' % (org(bone), prop)
 
-    # Move all the original bones to their layer.
-    for bone in original_bones:
-        obj.data.bones[bone].layers = ORG_LAYER
+    # Move all the original bones to their layer, with the ORG bones added by
+    # the rigs, such as the resampled torso deform bones.
+    for bone in bones:
+        if is_org(bone):
+            obj.data.bones[bone].layers = ORG_LAYER
 
     # Move all the bones with names starting with "MCH-" to their layer.
     for bone in bones:
         if is_mch(obj.data.bones[bone].name):
             obj.data.bones[bone].layers = MCH_LAYER
 
-    # Assign shapes to bones
+    t.tick("Finalize bones: ")
+
+    # Build the queued widgets and assign shapes to bones
+    build_widgets(obj, widget_collection(context, obj.name, collection))
     assign_and_unlink_all_widgets(collection, obj)
+    t.tick("Assign widgets: ")
     # Reveal all the layers with control bones on them
     vis_layers = [False for n in range(0, 32)]
     for bone in bones:
@@ -361,8 +494,7 @@ def generate_rig(context, metarig):
     obj.data.layers = vis_layers
 
     # Ensure the collection of layer names exists
-    for i in range(1 + len(metarig.data.gamerig_layers), 30):
-        metarig.data.gamerig_layers.add()
+    ensure_layer_names(metarig)
 
     # Create list of layer name/row pairs
     layer_layout = []
@@ -390,18 +522,32 @@ def generate_rig(context, metarig):
 
     uitemplate = rig_lists.riguitemplate_dic[metarig.data.gamerig_rig_ui_template]
 
+    # Control bones known to the pose tools of rig UI
+    controls = [bone for bone in bones if not (is_org(bone) or is_mch(bone) or is_jig(bone))]
+
+    # Optional mechanism muted in animator playback mode
+    playback_constraints, playback_drivers = playback_optional_mechanism(obj)
+    obj.data["gamerig_playback_mode"] = False
+    if "gamerig_auto_playback_mode" not in obj.data:
+        obj.data["gamerig_auto_playback_mode"] = False
+
     script.write(
         uitemplate[0].format(
             rig_id=rig_id,
             operators=operator_scripts,
             properties=properties_ui(ui_scripts),
-            layers=layers_ui(vis_layers, layer_layout)
+            layers=layers_ui(vis_layers, layer_layout),
+            controls=repr(controls),
+            mirror_pairs=repr(symmetrical_pairs(controls)),
+            playback_constraints=repr(playback_constraints),
+            playback_drivers=repr(playback_drivers)
         )
     )
     script.use_module = True
 
     # Run UI script
     exec(script.as_string(), {})
+    t.tick("Create rig UI: ")
 
     # Create Selection Sets
     create_selection_sets(obj, metarig)
@@ -409,6 +555,9 @@ def generate_rig(context, metarig):
     # Create Bone Groups
     create_bone_groups(obj, metarig)
 
+    # Create keying set of the control channels
+    create_control_keying_set(scene, obj, controls)
+
     # Add rig_ui to logic
     create_persistent_rig_ui(obj, script)
     
@@ -447,7 +596,52 @@ def generate_rig(context, metarig):
     obj.rotation_axis_angle = metarig.rotation_axis_angle
     obj.scale               = metarig.scale
 
-    t.tick("The rest: ")
+    t.tick("Set rig transform: ")
+
+    if cache_dir:
+        store_cached_rig(obj, cache_dir, fingerprint, cache_size)
+        t.tick("Store cached rig: ")
+
+    # Keep the phase timings for profiling
+    generate_rig.timings = t.records
+    generate_rig.rig_timings = tt.records
+
+    # (rig bone, kind, bone, name) of the applied pose records, for tooling
+    owners = dict(zip(rigs, rig_bones))
+    generate_rig.pose_records = [
+        (owners.get(record['rig']), record['kind'], record['bone'], record.get('name') or record.get('prop'))
+        for record in add_record.applied or []
+    ]
+
+
+def ensure_layer_names(metarig):
+    """ Ensures the collection of layer names of the metarig exists.
+    """
+    for i in range(1 + len(metarig.data.gamerig_layers), 30):
+        metarig.data.gamerig_layers.add()
+
+
+def bone_constraint_counts(obj):
+    """ Returns {bone name: number of constraints} of the pose bones.
+    """
+    return {pbone.name: len(pbone.constraints) for pbone in obj.pose.bones}
+
+
+def owned_bones(obj, constraint_counts, records):
+    """ Returns the bones created or constrained since constraint_counts was
+        taken with bone_constraint_counts(), and the bones of the records
+        added meanwhile.
+    """
+    owned = [
+        pbone.name for pbone in obj.pose.bones
+        if constraint_counts.get(pbone.name) != len(pbone.constraints)
+    ]
+    known = set(owned)
+    for record in records:
+        if record['bone'] not in known:
+            owned.append(record['bone'])
+            known.add(record['bone'])
+    return owned
 
 
 def create_selection_sets(obj, metarig):
@@ -544,8 +738,10 @@ def create_persistent_rig_ui(obj, script):
         variable.targets[0].id = script
 
 
-def get_bone_rigs(obj, bone_name, rigtypes, halt_on_missing=False):
+def get_bone_rigs(obj, bone_name, rigtypes, halt_on_missing=False, rig_modules=None):
     """ Fetch all the rigs specified on a bone.
+        rig_modules caches {rig type: module} so that a rig type module is
+        (re)loaded once, and all its instances share the same Rig class.
     """
     rigs = []
     rig_type = obj.pose.bones[bone_name].gamerig_type
@@ -559,7 +755,11 @@ def get_bone_rigs(obj, bone_name, rigtypes, halt_on_missing=False):
 
         # Get the rig
         try:
-            rigt = get_rig_type(rig_type)
+            rigt = rig_modules.get(rig_type) if rig_modules is not None else None
+            if rigt is None:
+                rigt = get_rig_type(rig_type)
+                if rig_modules is not None:
+                    rig_modules[rig_type] = rigt
             rig = rigt.Rig(obj, bone_name, params)
         except ImportError:
             message = "Rig Type Missing: python module for type '%s' not found (bone: %s)" % (rig_type, bone_name)
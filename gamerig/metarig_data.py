@@ -0,0 +1,377 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Data encoding of metarigs and widgets.
+
+    Metarigs are encoded as a table of bones (one array per attribute, in
+    parent first order), the pose bone properties, the non default rig
+    parameters of each bone, and the layer and color settings of the
+    armature. Widgets are encoded as their vertex, edge and face arrays.
+    Everything is read with bulk reads, and written as JSON or as NumPy .npz
+    with the arrays stored natively. load_metarig() creates a metarig from
+    its data with bulk writes; the bundled metarigs and the rig samples are
+    stored this way.
+"""
+
+import bpy
+import json
+import os
+import numpy as np
+
+from .utils import MetarigError
+
+METARIG_FORMAT = 'gamerig.metarig'
+WIDGET_FORMAT  = 'gamerig.widget'
+DATA_VERSION   = 1
+PRECISION      = 4  # Decimals of the encoded coordinates, as write_metarig()
+
+
+#=======================================================================
+# Bulk reads
+#=======================================================================
+
+def read_array(collection, attr, size=1, dtype=np.float32):
+    """ Returns the attribute of all the items of the collection, (n, size) shaped.
+    """
+    values = np.empty(len(collection) * size, dtype=dtype)
+    collection.foreach_get(attr, values)
+    return values.reshape(-1, size) if size > 1 else values
+
+
+def write_array(collection, attr, values, dtype=np.float32):
+    """ Sets the attribute of all the items of the collection from values.
+    """
+    collection.foreach_set(attr, np.ascontiguousarray(values, dtype=dtype).ravel())
+
+
+def rounded(values):
+    return (np.round(values, PRECISION) + 0.0).tolist()
+
+
+def encode_parameter(value):
+    """ Converts a rig parameter value to a JSON value.
+    """
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    try:
+        return [encode_parameter(v) for v in value]
+    except TypeError:
+        return str(value)
+
+
+#=======================================================================
+# Encoders
+#=======================================================================
+
+def encode_metarig(obj, layers=False, groups=False, template=False):
+    """ Returns the data of a metarig, the counterpart of write_metarig().
+        Leaves the armature in object mode.
+    """
+    arm = obj.data
+    data = {'format': METARIG_FORMAT, 'version': DATA_VERSION}
+
+    if template:
+        data['template'] = arm.gamerig_rig_ui_template or 'ui_template'
+
+    if groups and len(arm.gamerig_colors) > 0:
+        data['colors'] = [
+            {
+                'name'                 : color.name,
+                'active'               : list(color.active),
+                'normal'               : list(color.normal),
+                'select'               : list(color.select),
+                'standard_colors_lock' : color.standard_colors_lock,
+            }
+            for color in arm.gamerig_colors
+        ]
+
+    if layers and len(arm.gamerig_layers) > 0:
+        data['layers'] = [
+            {'name': layer.name, 'row': layer.row, 'selset': layer.selset, 'group': layer.group}
+            for layer in arm.gamerig_layers
+        ]
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    ebones = arm.edit_bones
+
+    # Parents first
+    depths = dict((bone.name, len(bone.parent_recursive)) for bone in ebones)
+    edit_names = ebones.keys()
+    order = sorted(range(len(edit_names)), key=lambda i: depths[edit_names[i]])
+    names = [edit_names[i] for i in order]
+    index = dict((name, i) for i, name in enumerate(names))
+
+    data['bones'] = {
+        'name'        : names,
+        'parent'      : [index[ebones[name].parent.name] if ebones[name].parent else -1 for name in names],
+        'head'        : rounded(read_array(ebones, 'head', 3)[order]),
+        'tail'        : rounded(read_array(ebones, 'tail', 3)[order]),
+        'roll'        : rounded(read_array(ebones, 'roll')[order]),
+        'use_connect' : read_array(ebones, 'use_connect', dtype=bool)[order].tolist(),
+        'use_deform'  : read_array(ebones, 'use_deform', dtype=bool)[order].tolist(),
+    }
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    pbones = obj.pose.bones
+    pose_order = [pbones.find(name) for name in names]
+
+    data['pose'] = {
+        'gamerig_type'    : [pbones[name].gamerig_type for name in names],
+        'rotation_mode'   : [pbones[name].rotation_mode for name in names],
+        'lock_location'   : read_array(pbones, 'lock_location', 3, bool)[pose_order].tolist(),
+        'lock_rotation'   : read_array(pbones, 'lock_rotation', 3, bool)[pose_order].tolist(),
+        'lock_rotation_w' : read_array(pbones, 'lock_rotation_w', dtype=bool)[pose_order].tolist(),
+        'lock_scale'      : read_array(pbones, 'lock_scale', 3, bool)[pose_order].tolist(),
+    }
+
+    if layers:
+        bones = arm.bones
+        bone_order = [bones.find(name) for name in names]
+        data['bones']['layers'] = read_array(bones, 'layers', 32, bool)[bone_order].tolist()
+        visible = np.any(np.array(data['bones']['layers'], dtype=bool), axis=0) if names else []
+        data['visible_layers'] = [i for i, shown in enumerate(visible) if shown]
+
+    # Parameters set on each bone, by bone index
+    parameters = {}
+    for i, name in enumerate(names):
+        params = pbones[name].gamerig_parameters
+        values = dict(
+            (key, encode_parameter(getattr(params, key, None))) for key in params.keys() if hasattr(params, key)
+        )
+        if values:
+            parameters[str(i)] = values
+    data['parameters'] = parameters
+
+    return data
+
+
+def encode_widget(obj):
+    """ Returns the data of a mesh widget, the counterpart of write_widget().
+    """
+    mesh = obj.data
+    return {
+        'format'      : WIDGET_FORMAT,
+        'version'     : DATA_VERSION,
+        'verts'       : rounded(read_array(mesh.vertices, 'co', 3)),
+        'edges'       : read_array(mesh.edges, 'vertices', 2, np.int32).tolist(),
+        'face_loops'  : read_array(mesh.loops, 'vertex_index', dtype=np.int32).tolist(),
+        'face_totals' : read_array(mesh.polygons, 'loop_total', dtype=np.int32).tolist(),
+    }
+
+
+#=======================================================================
+# Loader
+#=======================================================================
+
+def parameter_schema(params):
+    """ Returns the set of the rig parameters of the parameters group, read
+        once per registration of the group.
+    """
+    key = params.bl_rna.as_pointer()
+    schema = parameter_schema.cache.get(key)
+    if schema is None:
+        schema = set(prop.identifier for prop in params.bl_rna.properties if prop.identifier != 'rna_type')
+        parameter_schema.cache = {key: schema}
+    return schema
+
+parameter_schema.cache = {}
+
+
+def load_metarig(obj, data):
+    """ Adds the bones of metarig data to the armature, the counterpart of
+        encode_metarig(). All the edit bones are created in one pass and
+        their attributes set with bulk writes. Leaves the new bones selected,
+        in edit mode.
+    """
+    if data.get('format') != METARIG_FORMAT:
+        raise MetarigError("GAMERIG ERROR: not metarig data")
+    if data.get('version', 0) > DATA_VERSION:
+        raise MetarigError("GAMERIG ERROR: metarig data version %s is not supported" % data['version'])
+
+    arm = obj.data
+
+    if 'template' in data:
+        arm.gamerig_rig_ui_template = data['template']
+
+    for values in data.get('colors', []):
+        color = arm.gamerig_colors.add()
+        for attr, value in values.items():
+            setattr(color, attr, value)
+
+    for values in data.get('layers', []):
+        layer = arm.gamerig_layers.add()
+        for attr, value in values.items():
+            setattr(layer, attr, value)
+
+    bones = data['bones']
+    pose  = data['pose']
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    ebones = arm.edit_bones
+
+    # Names may be taken already, the new bones are addressed by index
+    created = [ebones.new(name).name for name in bones['name']]
+    for name, parent in zip(created, bones['parent']):
+        if parent >= 0:
+            ebones[name].parent = ebones[created[parent]]
+
+    edit_index = [ebones.find(name) for name in created]
+    for attr, size, dtype in (
+        ('head', 3, np.float32), ('tail', 3, np.float32), ('roll', 1, np.float32),
+        ('use_connect', 1, bool), ('use_deform', 1, bool),
+    ):
+        if attr in bones:
+            values = read_array(ebones, attr, size, dtype)
+            values[edit_index] = np.array(bones[attr], dtype=dtype).reshape(values[edit_index].shape)
+            write_array(ebones, attr, values, dtype)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    pbones = obj.pose.bones
+
+    pose_index = [pbones.find(name) for name in created]
+    for attr, size in (('lock_location', 3), ('lock_rotation', 3), ('lock_rotation_w', 1), ('lock_scale', 3)):
+        if attr in pose:
+            values = read_array(pbones, attr, size, bool)
+            values[pose_index] = np.array(pose[attr], dtype=bool).reshape(values[pose_index].shape)
+            write_array(pbones, attr, values, bool)
+
+    for name, gamerig_type, rotation_mode in zip(created, pose['gamerig_type'], pose['rotation_mode']):
+        pbone = pbones[name]
+        pbone.gamerig_type = gamerig_type
+        pbone.rotation_mode = rotation_mode
+
+    if 'layers' in bones:
+        values = read_array(arm.bones, 'layers', 32, bool)
+        values[[arm.bones.find(name) for name in created]] = bones['layers']
+        write_array(arm.bones, 'layers', values, bool)
+
+    # Parameters of rig types that are not installed are skipped
+    for index, values in data.get('parameters', {}).items():
+        params = pbones[created[int(index)]].gamerig_parameters
+        schema = parameter_schema(params)
+        for key, value in values.items():
+            if key in schema:
+                setattr(params, key, value)
+
+    if 'visible_layers' in data:
+        visible = data['visible_layers']
+        arm.layers = [(x in visible) for x in range(32)]
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    for bone in ebones:
+        bone.select = False
+        bone.select_head = False
+        bone.select_tail = False
+    for name in created:
+        bone = ebones[name]
+        bone.select = True
+        bone.select_head = True
+        bone.select_tail = True
+    if created:
+        ebones.active = ebones[created[-1]]
+
+
+def load_metarig_file(obj, path):
+    load_metarig(obj, read_data(path))
+
+
+def load_bundled_metarig(obj, module_file):
+    """ Creates a bundled metarig from the data next to its module.
+    """
+    load_metarig_file(obj, os.path.splitext(module_file)[0] + ".json")
+
+
+def load_sample(obj, module_file):
+    """ Creates the sample metarig of a rig type from the data next to its
+        module.
+    """
+    load_metarig_file(obj, os.path.splitext(module_file)[0] + "_sample.json")
+
+
+#=======================================================================
+# Files
+#=======================================================================
+
+def is_array(value):
+    """ True for the numeric lists stored as arrays in .npz files.
+    """
+    if not isinstance(value, list) or not value:
+        return False
+    first = value[0]
+    while isinstance(first, list) and first:
+        first = first[0]
+    return isinstance(first, (int, float)) and not isinstance(first, str)
+
+
+def split_arrays(data, arrays, prefix=''):
+    """ Returns data with its numeric lists moved to arrays, by key path.
+    """
+    meta = {}
+    for key, value in data.items():
+        path = prefix + key
+        if isinstance(value, dict):
+            meta[key] = split_arrays(value, arrays, path + '/')
+        elif is_array(value):
+            arrays[path] = np.array(value)
+            meta[key] = {'$array': path}
+        else:
+            meta[key] = value
+    return meta
+
+
+def join_arrays(meta, arrays):
+    """ The reverse of split_arrays().
+    """
+    data = {}
+    for key, value in meta.items():
+        if isinstance(value, dict) and '$array' in value:
+            data[key] = arrays[value['$array']].tolist()
+        elif isinstance(value, dict):
+            data[key] = join_arrays(value, arrays)
+        else:
+            data[key] = value
+    return data
+
+
+def data_to_json(data):
+    return json.dumps(data, separators=(',', ':'), sort_keys=True)
+
+
+def write_data(data, path):
+    """ Writes data to a .json or .npz file, by extension.
+    """
+    if path.endswith('.npz'):
+        arrays = {}
+        meta = split_arrays(data, arrays)
+        np.savez_compressed(path, __meta__=np.array(data_to_json(meta)), **arrays)
+    else:
+        with open(path, 'w') as f:
+            f.write(data_to_json(data))
+
+
+def read_data(path):
+    """ Reads data written by write_data().
+    """
+    if path.endswith('.npz'):
+        with np.load(path, allow_pickle=False) as npz:
+            meta = json.loads(str(npz['__meta__']))
+            return join_arrays(meta, npz)
+    with open(path) as f:
+        return json.load(f)
@@ -1,1239 +1,5 @@
-import bpy
-
-
-from mathutils import Color
+from ...metarig_data import load_bundled_metarig
 
 
 def create(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    arm.gamerig_rig_ui_template = 'ui_template'
-
-    for i in range(6):
-        arm.gamerig_colors.add()
-
-    arm.gamerig_colors[0].name = "Root"
-    arm.gamerig_colors[0].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[0].normal = Color((0.67384934425354, 0.09994713962078094, 0.605361819267273))
-    arm.gamerig_colors[0].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[0].standard_colors_lock = True
-    arm.gamerig_colors[1].name = "FK"
-    arm.gamerig_colors[1].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[1].normal = Color((0.2890395522117615, 1.0, 0.08723420649766922))
-    arm.gamerig_colors[1].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[1].standard_colors_lock = True
-    arm.gamerig_colors[2].name = "IK"
-    arm.gamerig_colors[2].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[2].normal = Color((0.9568628668785095, 0.21056735515594482, 0.234207421541214))
-    arm.gamerig_colors[2].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[2].standard_colors_lock = True
-    arm.gamerig_colors[3].name = "Tweak"
-    arm.gamerig_colors[3].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[3].normal = Color((0.03921600058674812, 0.21176500618457794, 0.5803920030593872))
-    arm.gamerig_colors[3].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[3].standard_colors_lock = True
-    arm.gamerig_colors[4].name = "Special"
-    arm.gamerig_colors[4].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[4].normal = Color((0.7191200852394104, 0.7356600761413574, 0.011989133432507515))
-    arm.gamerig_colors[4].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[4].standard_colors_lock = True
-    arm.gamerig_colors[5].name = "Extra"
-    arm.gamerig_colors[5].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[5].normal = Color((0.09200122952461243, 0.041189342737197876, 0.9686281681060791))
-    arm.gamerig_colors[5].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[5].standard_colors_lock = True
-
-    for i in range(30):
-        arm.gamerig_layers.add()
-
-    arm.gamerig_layers[0].name = "Face"
-    arm.gamerig_layers[0].row = 1
-    arm.gamerig_layers[0].selset = False
-    arm.gamerig_layers[0].group = 2
-    arm.gamerig_layers[1].name = "Face (Primary)"
-    arm.gamerig_layers[1].row = 2
-    arm.gamerig_layers[1].selset = False
-    arm.gamerig_layers[1].group = 4
-    arm.gamerig_layers[2].name = "Face (Secondary)"
-    arm.gamerig_layers[2].row = 2
-    arm.gamerig_layers[2].selset = False
-    arm.gamerig_layers[2].group = 6
-    arm.gamerig_layers[3].name = "Torso"
-    arm.gamerig_layers[3].row = 3
-    arm.gamerig_layers[3].selset = False
-    arm.gamerig_layers[3].group = 2
-    arm.gamerig_layers[4].name = "Torso (Tweak)"
-    arm.gamerig_layers[4].row = 4
-    arm.gamerig_layers[4].selset = False
-    arm.gamerig_layers[4].group = 4
-    arm.gamerig_layers[5].name = "Fingers"
-    arm.gamerig_layers[5].row = 5
-    arm.gamerig_layers[5].selset = False
-    arm.gamerig_layers[5].group = 2
-    arm.gamerig_layers[6].name = ""
-    arm.gamerig_layers[6].row = 1
-    arm.gamerig_layers[6].selset = False
-    arm.gamerig_layers[6].group = 0
-    arm.gamerig_layers[7].name = ""
-    arm.gamerig_layers[7].row = 1
-    arm.gamerig_layers[7].selset = False
-    arm.gamerig_layers[7].group = 0
-    arm.gamerig_layers[8].name = "Arm.L (IK)"
-    arm.gamerig_layers[8].row = 6
-    arm.gamerig_layers[8].selset = False
-    arm.gamerig_layers[8].group = 3
-    arm.gamerig_layers[9].name = "Arm.L (FK)"
-    arm.gamerig_layers[9].row = 7
-    arm.gamerig_layers[9].selset = False
-    arm.gamerig_layers[9].group = 2
-    arm.gamerig_layers[10].name = ""
-    arm.gamerig_layers[10].row = 1
-    arm.gamerig_layers[10].selset = False
-    arm.gamerig_layers[10].group = 0
-    arm.gamerig_layers[11].name = ""
-    arm.gamerig_layers[11].row = 1
-    arm.gamerig_layers[11].selset = False
-    arm.gamerig_layers[11].group = 0
-    arm.gamerig_layers[12].name = "Arm.R (IK)"
-    arm.gamerig_layers[12].row = 6
-    arm.gamerig_layers[12].selset = False
-    arm.gamerig_layers[12].group = 3
-    arm.gamerig_layers[13].name = "Arm.R (FK)"
-    arm.gamerig_layers[13].row = 7
-    arm.gamerig_layers[13].selset = False
-    arm.gamerig_layers[13].group = 2
-    arm.gamerig_layers[14].name = ""
-    arm.gamerig_layers[14].row = 1
-    arm.gamerig_layers[14].selset = False
-    arm.gamerig_layers[14].group = 0
-    arm.gamerig_layers[15].name = ""
-    arm.gamerig_layers[15].row = 1
-    arm.gamerig_layers[15].selset = False
-    arm.gamerig_layers[15].group = 0
-    arm.gamerig_layers[16].name = "Leg.L (IK)"
-    arm.gamerig_layers[16].row = 8
-    arm.gamerig_layers[16].selset = False
-    arm.gamerig_layers[16].group = 3
-    arm.gamerig_layers[17].name = "Leg.L (FK)"
-    arm.gamerig_layers[17].row = 9
-    arm.gamerig_layers[17].selset = False
-    arm.gamerig_layers[17].group = 2
-    arm.gamerig_layers[18].name = ""
-    arm.gamerig_layers[18].row = 1
-    arm.gamerig_layers[18].selset = False
-    arm.gamerig_layers[18].group = 0
-    arm.gamerig_layers[19].name = ""
-    arm.gamerig_layers[19].row = 1
-    arm.gamerig_layers[19].selset = False
-    arm.gamerig_layers[19].group = 0
-    arm.gamerig_layers[20].name = "Leg.R (IK)"
-    arm.gamerig_layers[20].row = 8
-    arm.gamerig_layers[20].selset = False
-    arm.gamerig_layers[20].group = 3
-    arm.gamerig_layers[21].name = "Leg.R (FK)"
-    arm.gamerig_layers[21].row = 9
-    arm.gamerig_layers[21].selset = False
-    arm.gamerig_layers[21].group = 2
-    arm.gamerig_layers[22].name = ""
-    arm.gamerig_layers[22].row = 1
-    arm.gamerig_layers[22].selset = False
-    arm.gamerig_layers[22].group = 0
-    arm.gamerig_layers[23].name = ""
-    arm.gamerig_layers[23].row = 1
-    arm.gamerig_layers[23].selset = False
-    arm.gamerig_layers[23].group = 0
-    arm.gamerig_layers[24].name = ""
-    arm.gamerig_layers[24].row = 1
-    arm.gamerig_layers[24].selset = False
-    arm.gamerig_layers[24].group = 0
-    arm.gamerig_layers[25].name = ""
-    arm.gamerig_layers[25].row = 1
-    arm.gamerig_layers[25].selset = False
-    arm.gamerig_layers[25].group = 0
-    arm.gamerig_layers[26].name = ""
-    arm.gamerig_layers[26].row = 1
-    arm.gamerig_layers[26].selset = False
-    arm.gamerig_layers[26].group = 0
-    arm.gamerig_layers[27].name = ""
-    arm.gamerig_layers[27].row = 1
-    arm.gamerig_layers[27].selset = False
-    arm.gamerig_layers[27].group = 0
-    arm.gamerig_layers[28].name = ""
-    arm.gamerig_layers[28].row = 1
-    arm.gamerig_layers[28].selset = False
-    arm.gamerig_layers[28].group = 0
-    arm.gamerig_layers[29].name = "Root"
-    arm.gamerig_layers[29].row = 10
-    arm.gamerig_layers[29].selset = False
-    arm.gamerig_layers[29].group = 1
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-root')
-    bone.head[:] = 0.0000, 0.0000, 0.0000
-    bone.tail[:] = 0.0000, 1.0000, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bones['ORG-root'] = bone.name
-    bone = arm.edit_bones.new('ORG-hips')
-    bone.head[:] = 0.0000, 0.0433, 0.9062
-    bone.tail[:] = 0.0000, -0.0035, 1.0727
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-root']]
-    bones['ORG-hips'] = bone.name
-    bone = arm.edit_bones.new('ORG-waist')
-    bone.head[:] = 0.0000, -0.0035, 1.0727
-    bone.tail[:] = 0.0000, -0.0103, 1.1916
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-waist'] = bone.name
-    bone = arm.edit_bones.new('ORG-thigh.L')
-    bone.head[:] = 0.0877, -0.0039, 0.9470
-    bone.tail[:] = 0.0880, -0.0310, 0.4738
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-thigh.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-thigh.R')
-    bone.head[:] = -0.0877, -0.0039, 0.9470
-    bone.tail[:] = -0.0880, -0.0310, 0.4738
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-thigh.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-chest')
-    bone.head[:] = 0.0000, -0.0103, 1.1916
-    bone.tail[:] = 0.0000, -0.0071, 1.3049
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-waist']]
-    bones['ORG-chest'] = bone.name
-    bone = arm.edit_bones.new('ORG-shin.L')
-    bone.head[:] = 0.0880, -0.0310, 0.4738
-    bone.tail[:] = 0.0883, 0.0145, 0.0747
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thigh.L']]
-    bones['ORG-shin.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-shin.R')
-    bone.head[:] = -0.0880, -0.0310, 0.4738
-    bone.tail[:] = -0.0883, 0.0145, 0.0747
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thigh.R']]
-    bones['ORG-shin.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-upper_chest')
-    bone.head[:] = 0.0000, -0.0071, 1.3049
-    bone.tail[:] = 0.0000, 0.0102, 1.4716
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-chest']]
-    bones['ORG-upper_chest'] = bone.name
-    bone = arm.edit_bones.new('ORG-foot.L')
-    bone.head[:] = 0.0883, 0.0145, 0.0747
-    bone.tail[:] = 0.0890, -0.0836, 0.0148
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shin.L']]
-    bones['ORG-foot.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-foot.R')
-    bone.head[:] = -0.0883, 0.0145, 0.0747
-    bone.tail[:] = -0.0890, -0.0836, 0.0148
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shin.R']]
-    bones['ORG-foot.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-shoulder.L')
-    bone.head[:] = 0.0216, -0.0141, 1.4241
-    bone.tail[:] = 0.1516, 0.0183, 1.4240
-    bone.roll = 0.0004
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_chest']]
-    bones['ORG-shoulder.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-shoulder.R')
-    bone.head[:] = -0.0216, -0.0141, 1.4241
-    bone.tail[:] = -0.1516, 0.0183, 1.4240
-    bone.roll = -0.0004
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_chest']]
-    bones['ORG-shoulder.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-neck')
-    bone.head[:] = 0.0000, 0.0102, 1.4716
-    bone.tail[:] = 0.0000, 0.0015, 1.5619
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_chest']]
-    bones['ORG-neck'] = bone.name
-    bone = arm.edit_bones.new('ORG-toe.L')
-    bone.head[:] = 0.0890, -0.0836, 0.0148
-    bone.tail[:] = 0.0890, -0.1437, 0.0143
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-foot.L']]
-    bones['ORG-toe.L'] = bone.name
-    bone = arm.edit_bones.new('JIG-heel.L')
-    bone.head[:] = 0.0551, 0.0411, 0.0000
-    bone.tail[:] = 0.1267, 0.0411, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = False
-    bone.parent = arm.edit_bones[bones['ORG-foot.L']]
-    bones['JIG-heel.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-toe.R')
-    bone.head[:] = -0.0890, -0.0836, 0.0148
-    bone.tail[:] = -0.0890, -0.1437, 0.0143
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-foot.R']]
-    bones['ORG-toe.R'] = bone.name
-    bone = arm.edit_bones.new('JIG-heel.R')
-    bone.head[:] = -0.0551, 0.0411, 0.0000
-    bone.tail[:] = -0.1267, 0.0411, 0.0000
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = False
-    bone.parent = arm.edit_bones[bones['ORG-foot.R']]
-    bones['JIG-heel.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-upper_arm.L')
-    bone.head[:] = 0.1748, 0.0239, 1.4057
-    bone.tail[:] = 0.4329, 0.0465, 1.4017
-    bone.roll = 1.5232
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shoulder.L']]
-    bones['ORG-upper_arm.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-upper_arm.R')
-    bone.head[:] = -0.1748, 0.0239, 1.4057
-    bone.tail[:] = -0.4329, 0.0465, 1.4017
-    bone.roll = -1.5232
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shoulder.R']]
-    bones['ORG-upper_arm.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-head')
-    bone.head[:] = 0.0000, 0.0015, 1.5619
-    bone.tail[:] = 0.0000, 0.0015, 1.7394
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-neck']]
-    bones['ORG-head'] = bone.name
-    bone = arm.edit_bones.new('ORG-forearm.L')
-    bone.head[:] = 0.4329, 0.0465, 1.4017
-    bone.tail[:] = 0.6681, 0.0144, 1.3980
-    bone.roll = 1.5232
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_arm.L']]
-    bones['ORG-forearm.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-forearm.R')
-    bone.head[:] = -0.4329, 0.0465, 1.4017
-    bone.tail[:] = -0.6681, 0.0144, 1.3980
-    bone.roll = -1.5232
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_arm.R']]
-    bones['ORG-forearm.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-eye.L')
-    bone.head[:] = 0.0462, -0.0721, 1.6629
-    bone.tail[:] = 0.0462, -0.0938, 1.6629
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-eye.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-eye.R')
-    bone.head[:] = -0.0462, -0.0721, 1.6629
-    bone.tail[:] = -0.0462, -0.0938, 1.6629
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-eye.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-jaw')
-    bone.head[:] = 0.0000, 0.0018, 1.6055
-    bone.tail[:] = 0.0000, -0.0828, 1.5663
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-jaw'] = bone.name
-    bone = arm.edit_bones.new('ORG-hand.L')
-    bone.head[:] = 0.6681, 0.0144, 1.3980
-    bone.tail[:] = 0.7398, 0.0147, 1.3968
-    bone.roll = -3.1196
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forearm.L']]
-    bones['ORG-hand.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-hand.R')
-    bone.head[:] = -0.6681, 0.0144, 1.3980
-    bone.tail[:] = -0.7398, 0.0147, 1.3968
-    bone.roll = 3.1196
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forearm.R']]
-    bones['ORG-hand.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.01.L')
-    bone.head[:] = 0.7529, -0.0177, 1.4114
-    bone.tail[:] = 0.7925, -0.0197, 1.3988
-    bone.roll = -2.5142
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['ORG-f_index.01.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-thumb.01.L')
-    bone.head[:] = 0.6881, -0.0128, 1.3838
-    bone.tail[:] = 0.7261, -0.0296, 1.3695
-    bone.roll = -1.0807
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['ORG-thumb.01.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.01.L')
-    bone.head[:] = 0.7559, 0.0028, 1.4143
-    bone.tail[:] = 0.7962, 0.0006, 1.3972
-    bone.roll = -2.6166
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['ORG-f_middle.01.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.01.L')
-    bone.head[:] = 0.7559, 0.0247, 1.4140
-    bone.tail[:] = 0.7937, 0.0240, 1.3939
-    bone.roll = -2.6230
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['ORG-f_ring.01.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.01.L')
-    bone.head[:] = 0.7547, 0.0463, 1.4115
-    bone.tail[:] = 0.7799, 0.0473, 1.3976
-    bone.roll = -2.9415
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['ORG-f_pinky.01.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.01.R')
-    bone.head[:] = -0.7529, -0.0177, 1.4114
-    bone.tail[:] = -0.7925, -0.0197, 1.3988
-    bone.roll = 2.5142
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['ORG-f_index.01.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-thumb.01.R')
-    bone.head[:] = -0.6881, -0.0128, 1.3838
-    bone.tail[:] = -0.7261, -0.0296, 1.3695
-    bone.roll = 1.0807
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['ORG-thumb.01.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.01.R')
-    bone.head[:] = -0.7559, 0.0028, 1.4143
-    bone.tail[:] = -0.7962, 0.0006, 1.3972
-    bone.roll = 2.6166
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['ORG-f_middle.01.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.01.R')
-    bone.head[:] = -0.7559, 0.0247, 1.4140
-    bone.tail[:] = -0.7937, 0.0240, 1.3939
-    bone.roll = 2.6230
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['ORG-f_ring.01.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.01.R')
-    bone.head[:] = -0.7547, 0.0463, 1.4115
-    bone.tail[:] = -0.7799, 0.0473, 1.3976
-    bone.roll = 2.9415
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['ORG-f_pinky.01.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.02.L')
-    bone.head[:] = 0.7925, -0.0197, 1.3988
-    bone.tail[:] = 0.8140, -0.0199, 1.3881
-    bone.roll = -2.5086
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_index.01.L']]
-    bones['ORG-f_index.02.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-thumb.02.L')
-    bone.head[:] = 0.7261, -0.0296, 1.3695
-    bone.tail[:] = 0.7475, -0.0344, 1.3623
-    bone.roll = -1.0175
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thumb.01.L']]
-    bones['ORG-thumb.02.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.02.L')
-    bone.head[:] = 0.7962, 0.0006, 1.3972
-    bone.tail[:] = 0.8176, 0.0003, 1.3827
-    bone.roll = -2.5224
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_middle.01.L']]
-    bones['ORG-f_middle.02.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.02.L')
-    bone.head[:] = 0.7937, 0.0240, 1.3939
-    bone.tail[:] = 0.8112, 0.0242, 1.3799
-    bone.roll = -2.4682
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_ring.01.L']]
-    bones['ORG-f_ring.02.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.02.L')
-    bone.head[:] = 0.7799, 0.0473, 1.3976
-    bone.tail[:] = 0.7922, 0.0480, 1.3862
-    bone.roll = -2.6423
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_pinky.01.L']]
-    bones['ORG-f_pinky.02.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.02.R')
-    bone.head[:] = -0.7925, -0.0197, 1.3988
-    bone.tail[:] = -0.8140, -0.0199, 1.3881
-    bone.roll = 2.5086
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_index.01.R']]
-    bones['ORG-f_index.02.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-thumb.02.R')
-    bone.head[:] = -0.7261, -0.0296, 1.3695
-    bone.tail[:] = -0.7475, -0.0344, 1.3623
-    bone.roll = 1.0175
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thumb.01.R']]
-    bones['ORG-thumb.02.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.02.R')
-    bone.head[:] = -0.7962, 0.0006, 1.3972
-    bone.tail[:] = -0.8176, 0.0003, 1.3827
-    bone.roll = 2.5224
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_middle.01.R']]
-    bones['ORG-f_middle.02.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.02.R')
-    bone.head[:] = -0.7937, 0.0240, 1.3939
-    bone.tail[:] = -0.8112, 0.0242, 1.3799
-    bone.roll = 2.4682
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_ring.01.R']]
-    bones['ORG-f_ring.02.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.02.R')
-    bone.head[:] = -0.7799, 0.0473, 1.3976
-    bone.tail[:] = -0.7922, 0.0480, 1.3862
-    bone.roll = 2.6423
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_pinky.01.R']]
-    bones['ORG-f_pinky.02.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.03.L')
-    bone.head[:] = 0.8140, -0.0199, 1.3881
-    bone.tail[:] = 0.8299, -0.0198, 1.3752
-    bone.roll = -2.2891
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_index.02.L']]
-    bones['ORG-f_index.03.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-thumb.03.L')
-    bone.head[:] = 0.7475, -0.0344, 1.3623
-    bone.tail[:] = 0.7655, -0.0373, 1.3565
-    bone.roll = -0.9828
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thumb.02.L']]
-    bones['ORG-thumb.03.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.03.L')
-    bone.head[:] = 0.8176, 0.0003, 1.3827
-    bone.tail[:] = 0.8344, 0.0001, 1.3664
-    bone.roll = -2.3209
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_middle.02.L']]
-    bones['ORG-f_middle.03.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.03.L')
-    bone.head[:] = 0.8112, 0.0242, 1.3799
-    bone.tail[:] = 0.8227, 0.0246, 1.3633
-    bone.roll = -2.2135
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_ring.02.L']]
-    bones['ORG-f_ring.03.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.03.L')
-    bone.head[:] = 0.7922, 0.0480, 1.3862
-    bone.tail[:] = 0.7999, 0.0483, 1.3742
-    bone.roll = -2.4545
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_pinky.02.L']]
-    bones['ORG-f_pinky.03.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.03.R')
-    bone.head[:] = -0.8140, -0.0199, 1.3881
-    bone.tail[:] = -0.8299, -0.0198, 1.3752
-    bone.roll = 2.2891
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_index.02.R']]
-    bones['ORG-f_index.03.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-thumb.03.R')
-    bone.head[:] = -0.7475, -0.0344, 1.3623
-    bone.tail[:] = -0.7655, -0.0373, 1.3565
-    bone.roll = 0.9828
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thumb.02.R']]
-    bones['ORG-thumb.03.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.03.R')
-    bone.head[:] = -0.8176, 0.0003, 1.3827
-    bone.tail[:] = -0.8344, 0.0001, 1.3664
-    bone.roll = 2.3209
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_middle.02.R']]
-    bones['ORG-f_middle.03.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.03.R')
-    bone.head[:] = -0.8112, 0.0242, 1.3799
-    bone.tail[:] = -0.8227, 0.0246, 1.3633
-    bone.roll = 2.2135
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_ring.02.R']]
-    bones['ORG-f_ring.03.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.03.R')
-    bone.head[:] = -0.7922, 0.0480, 1.3862
-    bone.tail[:] = -0.7999, 0.0483, 1.3742
-    bone.roll = 2.4545
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_pinky.02.R']]
-    bones['ORG-f_pinky.03.R'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-root']]
-    pbone.gamerig_type = 'root'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False]
-    pbone = obj.pose.bones[bones['ORG-hips']]
-    pbone.gamerig_type = 'torso'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.neck_pos = 5
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.stretchable_tweak = False
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-waist']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-thigh.L']]
-    pbone.gamerig_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-thigh.R']]
-    pbone.gamerig_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = False
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-heel.R"
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-chest']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shin.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shin.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-upper_chest']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-foot.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-foot.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shoulder.L']]
-    pbone.gamerig_type = 'generic'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shoulder.R']]
-    pbone.gamerig_type = 'generic'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-neck']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-toe.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['JIG-heel.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-toe.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['JIG-heel.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-upper_arm.L']]
-    pbone.gamerig_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-upper_arm.R']]
-    pbone.gamerig_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-head']]
-    pbone.gamerig_type = 'face'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.secondary_layers = [False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.primary_layers_extra = False
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.secondary_layers_extra = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-forearm.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-forearm.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-eye.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-eye.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-jaw']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-hand.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-hand.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.01.L']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-thumb.01.L']]
-    pbone.gamerig_type = 'thumb'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_middle.01.L']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_ring.01.L']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_pinky.01.L']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_index.01.R']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-thumb.01.R']]
-    pbone.gamerig_type = 'thumb'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_middle.01.R']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_ring.01.R']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_pinky.01.R']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-f_index.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-thumb.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.02.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-thumb.02.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.02.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.02.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.02.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-thumb.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.03.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-thumb.03.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.03.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.03.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.03.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
-
-    arm.layers = [(x in [0, 3, 5, 8, 12, 16, 20, 29]) for x in range(32)]
-
-if __name__ == "__main__":
-    create(bpy.context.active_object)
+    load_bundled_metarig(obj, __file__)
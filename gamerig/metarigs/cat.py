@@ -1,3019 +1,5 @@
-import bpy
-
-
-from mathutils import Color
+from ..metarig_data import load_bundled_metarig
 
 
 def create(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    arm.gamerig_rig_ui_template = 'ui_template'
-
-    for i in range(6):
-        arm.gamerig_colors.add()
-
-    arm.gamerig_colors[0].name = "Root"
-    arm.gamerig_colors[0].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[0].normal = Color((0.4352940022945404, 0.18431399762630463, 0.4156860113143921))
-    arm.gamerig_colors[0].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[0].standard_colors_lock = True
-    arm.gamerig_colors[1].name = "IK"
-    arm.gamerig_colors[1].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[1].normal = Color((0.6039220094680786, 0.0, 0.0))
-    arm.gamerig_colors[1].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[1].standard_colors_lock = True
-    arm.gamerig_colors[2].name = "Special"
-    arm.gamerig_colors[2].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[2].normal = Color((0.9568629860877991, 0.7882350087165833, 0.04705899953842163))
-    arm.gamerig_colors[2].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[2].standard_colors_lock = True
-    arm.gamerig_colors[3].name = "Tweak"
-    arm.gamerig_colors[3].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[3].normal = Color((0.03921600058674812, 0.21176500618457794, 0.5803920030593872))
-    arm.gamerig_colors[3].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[3].standard_colors_lock = True
-    arm.gamerig_colors[4].name = "FK"
-    arm.gamerig_colors[4].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[4].normal = Color((0.11764699965715408, 0.5686269998550415, 0.035294000059366226))
-    arm.gamerig_colors[4].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[4].standard_colors_lock = True
-    arm.gamerig_colors[5].name = "Extra"
-    arm.gamerig_colors[5].active = Color((0.5490196347236633, 1.0, 1.0))
-    arm.gamerig_colors[5].normal = Color((0.9686279892921448, 0.2509799897670746, 0.09411799907684326))
-    arm.gamerig_colors[5].select = Color((0.31372547149658203, 0.7843138575553894, 1.0))
-    arm.gamerig_colors[5].standard_colors_lock = True
-
-    for i in range(30):
-        arm.gamerig_layers.add()
-
-    arm.gamerig_layers[0].name = "Face"
-    arm.gamerig_layers[0].row = 1
-    arm.gamerig_layers[0].selset = False
-    arm.gamerig_layers[0].group = 5
-    arm.gamerig_layers[1].name = "Face (Primary)"
-    arm.gamerig_layers[1].row = 2
-    arm.gamerig_layers[1].selset = False
-    arm.gamerig_layers[1].group = 2
-    arm.gamerig_layers[2].name = "Face (Secondary)"
-    arm.gamerig_layers[2].row = 2
-    arm.gamerig_layers[2].selset = False
-    arm.gamerig_layers[2].group = 3
-    arm.gamerig_layers[3].name = "Torso"
-    arm.gamerig_layers[3].row = 3
-    arm.gamerig_layers[3].selset = False
-    arm.gamerig_layers[3].group = 3
-    arm.gamerig_layers[4].name = "Torso (Tweak)"
-    arm.gamerig_layers[4].row = 4
-    arm.gamerig_layers[4].selset = False
-    arm.gamerig_layers[4].group = 4
-    arm.gamerig_layers[5].name = "Fingers"
-    arm.gamerig_layers[5].row = 5
-    arm.gamerig_layers[5].selset = False
-    arm.gamerig_layers[5].group = 6
-    arm.gamerig_layers[6].name = "Fingers (Tweak)"
-    arm.gamerig_layers[6].row = 6
-    arm.gamerig_layers[6].selset = False
-    arm.gamerig_layers[6].group = 4
-    arm.gamerig_layers[7].name = "Arm.L (IK)"
-    arm.gamerig_layers[7].row = 7
-    arm.gamerig_layers[7].selset = False
-    arm.gamerig_layers[7].group = 2
-    arm.gamerig_layers[8].name = "Arm.L (FK)"
-    arm.gamerig_layers[8].row = 8
-    arm.gamerig_layers[8].selset = False
-    arm.gamerig_layers[8].group = 5
-    arm.gamerig_layers[9].name = "Arm.L (Tweak)"
-    arm.gamerig_layers[9].row = 9
-    arm.gamerig_layers[9].selset = False
-    arm.gamerig_layers[9].group = 4
-    arm.gamerig_layers[10].name = "Arm.R (IK)"
-    arm.gamerig_layers[10].row = 7
-    arm.gamerig_layers[10].selset = False
-    arm.gamerig_layers[10].group = 2
-    arm.gamerig_layers[11].name = "Arm.R (FK)"
-    arm.gamerig_layers[11].row = 8
-    arm.gamerig_layers[11].selset = False
-    arm.gamerig_layers[11].group = 5
-    arm.gamerig_layers[12].name = "Arm.R (Tweak)"
-    arm.gamerig_layers[12].row = 9
-    arm.gamerig_layers[12].selset = False
-    arm.gamerig_layers[12].group = 4
-    arm.gamerig_layers[13].name = "Leg.L (IK)"
-    arm.gamerig_layers[13].row = 10
-    arm.gamerig_layers[13].selset = False
-    arm.gamerig_layers[13].group = 2
-    arm.gamerig_layers[14].name = "Leg.L (FK)"
-    arm.gamerig_layers[14].row = 11
-    arm.gamerig_layers[14].selset = False
-    arm.gamerig_layers[14].group = 5
-    arm.gamerig_layers[15].name = "Leg.L (Tweak)"
-    arm.gamerig_layers[15].row = 12
-    arm.gamerig_layers[15].selset = False
-    arm.gamerig_layers[15].group = 4
-    arm.gamerig_layers[16].name = "Leg.R (IK)"
-    arm.gamerig_layers[16].row = 10
-    arm.gamerig_layers[16].selset = False
-    arm.gamerig_layers[16].group = 2
-    arm.gamerig_layers[17].name = "Leg.R (FK)"
-    arm.gamerig_layers[17].row = 11
-    arm.gamerig_layers[17].selset = False
-    arm.gamerig_layers[17].group = 5
-    arm.gamerig_layers[18].name = "Leg.R (Tweak)"
-    arm.gamerig_layers[18].row = 12
-    arm.gamerig_layers[18].selset = False
-    arm.gamerig_layers[18].group = 4
-    arm.gamerig_layers[19].name = "Tail (IK)"
-    arm.gamerig_layers[19].row = 13
-    arm.gamerig_layers[19].selset = False
-    arm.gamerig_layers[19].group = 2
-    arm.gamerig_layers[20].name = "Tail (FK)"
-    arm.gamerig_layers[20].row = 13
-    arm.gamerig_layers[20].selset = False
-    arm.gamerig_layers[20].group = 5
-    arm.gamerig_layers[21].name = ""
-    arm.gamerig_layers[21].row = 1
-    arm.gamerig_layers[21].selset = False
-    arm.gamerig_layers[21].group = 0
-    arm.gamerig_layers[22].name = ""
-    arm.gamerig_layers[22].row = 1
-    arm.gamerig_layers[22].selset = False
-    arm.gamerig_layers[22].group = 0
-    arm.gamerig_layers[23].name = ""
-    arm.gamerig_layers[23].row = 1
-    arm.gamerig_layers[23].selset = False
-    arm.gamerig_layers[23].group = 0
-    arm.gamerig_layers[24].name = ""
-    arm.gamerig_layers[24].row = 1
-    arm.gamerig_layers[24].selset = False
-    arm.gamerig_layers[24].group = 0
-    arm.gamerig_layers[25].name = ""
-    arm.gamerig_layers[25].row = 1
-    arm.gamerig_layers[25].selset = False
-    arm.gamerig_layers[25].group = 0
-    arm.gamerig_layers[26].name = ""
-    arm.gamerig_layers[26].row = 1
-    arm.gamerig_layers[26].selset = False
-    arm.gamerig_layers[26].group = 0
-    arm.gamerig_layers[27].name = ""
-    arm.gamerig_layers[27].row = 1
-    arm.gamerig_layers[27].selset = False
-    arm.gamerig_layers[27].group = 0
-    arm.gamerig_layers[28].name = ""
-    arm.gamerig_layers[28].row = 1
-    arm.gamerig_layers[28].selset = False
-    arm.gamerig_layers[28].group = 0
-    arm.gamerig_layers[29].name = "Root"
-    arm.gamerig_layers[29].row = 14
-    arm.gamerig_layers[29].selset = False
-    arm.gamerig_layers[29].group = 1
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-hips')
-    bone.head[:] = 0.0000, 0.1499, 0.2500
-    bone.tail[:] = 0.0000, 0.0769, 0.2272
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bones['ORG-hips'] = bone.name
-    bone = arm.edit_bones.new('ORG-tail.001')
-    bone.head[:] = 0.0000, 0.1499, 0.2500
-    bone.tail[:] = 0.0000, 0.1980, 0.2412
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-tail.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-waist')
-    bone.head[:] = 0.0000, 0.0769, 0.2272
-    bone.tail[:] = 0.0000, 0.0180, 0.2240
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-waist'] = bone.name
-    bone = arm.edit_bones.new('ORG-thigh.L')
-    bone.head[:] = 0.0291, 0.1148, 0.2460
-    bone.tail[:] = 0.0293, 0.1074, 0.1682
-    bone.roll = 3.1383
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-thigh.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-thigh.R')
-    bone.head[:] = -0.0291, 0.1148, 0.2460
-    bone.tail[:] = -0.0293, 0.1074, 0.1682
-    bone.roll = -3.1383
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hips']]
-    bones['ORG-thigh.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tail.002')
-    bone.head[:] = 0.0000, 0.1980, 0.2412
-    bone.tail[:] = 0.0000, 0.2460, 0.2324
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-tail.001']]
-    bones['ORG-tail.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-chest')
-    bone.head[:] = 0.0000, 0.0180, 0.2240
-    bone.tail[:] = 0.0000, -0.0513, 0.2271
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-waist']]
-    bones['ORG-chest'] = bone.name
-    bone = arm.edit_bones.new('ORG-shin.L')
-    bone.head[:] = 0.0293, 0.1074, 0.1682
-    bone.tail[:] = 0.0293, 0.1684, 0.1073
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thigh.L']]
-    bones['ORG-shin.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-shin.R')
-    bone.head[:] = -0.0293, 0.1074, 0.1682
-    bone.tail[:] = -0.0293, 0.1684, 0.1073
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thigh.R']]
-    bones['ORG-shin.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tail.003')
-    bone.head[:] = 0.0000, 0.2460, 0.2324
-    bone.tail[:] = 0.0000, 0.2986, 0.2304
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-tail.002']]
-    bones['ORG-tail.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-upper_chest')
-    bone.head[:] = 0.0000, -0.0513, 0.2271
-    bone.tail[:] = 0.0000, -0.1571, 0.2355
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-chest']]
-    bones['ORG-upper_chest'] = bone.name
-    bone = arm.edit_bones.new('ORG-foot.L')
-    bone.head[:] = 0.0293, 0.1684, 0.1073
-    bone.tail[:] = 0.0293, 0.1530, 0.0167
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shin.L']]
-    bones['ORG-foot.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-foot.R')
-    bone.head[:] = -0.0293, 0.1684, 0.1073
-    bone.tail[:] = -0.0293, 0.1530, 0.0167
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shin.R']]
-    bones['ORG-foot.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tail.004')
-    bone.head[:] = 0.0000, 0.2986, 0.2304
-    bone.tail[:] = 0.0000, 0.3513, 0.2284
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-tail.003']]
-    bones['ORG-tail.004'] = bone.name
-    bone = arm.edit_bones.new('ORG-neck')
-    bone.head[:] = 0.0000, -0.1571, 0.2355
-    bone.tail[:] = 0.0000, -0.1860, 0.2445
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_chest']]
-    bones['ORG-neck'] = bone.name
-    bone = arm.edit_bones.new('ORG-shoulder.L')
-    bone.head[:] = 0.0111, -0.0973, 0.2645
-    bone.tail[:] = 0.0346, -0.1427, 0.2105
-    bone.roll = 2.2707
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_chest']]
-    bones['ORG-shoulder.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-shoulder.R')
-    bone.head[:] = -0.0111, -0.0973, 0.2645
-    bone.tail[:] = -0.0346, -0.1427, 0.2105
-    bone.roll = -2.2707
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_chest']]
-    bones['ORG-shoulder.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_toe.L')
-    bone.head[:] = 0.0293, 0.1530, 0.0167
-    bone.tail[:] = 0.0293, 0.1334, 0.0039
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-foot.L']]
-    bones['ORG-r_toe.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_toe.R')
-    bone.head[:] = -0.0293, 0.1530, 0.0167
-    bone.tail[:] = -0.0293, 0.1334, 0.0039
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-foot.R']]
-    bones['ORG-r_toe.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tail.005')
-    bone.head[:] = 0.0000, 0.3513, 0.2284
-    bone.tail[:] = 0.0000, 0.4028, 0.2303
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-tail.004']]
-    bones['ORG-tail.005'] = bone.name
-    bone = arm.edit_bones.new('ORG-head')
-    bone.head[:] = 0.0000, -0.1860, 0.2445
-    bone.tail[:] = -0.0000, -0.2424, 0.2743
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-neck']]
-    bones['ORG-head'] = bone.name
-    bone = arm.edit_bones.new('ORG-upper_arm.L')
-    bone.head[:] = 0.0313, -0.1292, 0.2018
-    bone.tail[:] = 0.0313, -0.0998, 0.1235
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shoulder.L']]
-    bones['ORG-upper_arm.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-upper_arm.R')
-    bone.head[:] = -0.0313, -0.1292, 0.2018
-    bone.tail[:] = -0.0313, -0.0998, 0.1235
-    bone.roll = -3.1416
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shoulder.R']]
-    bones['ORG-upper_arm.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-palm.001.L')
-    bone.head[:] = 0.0220, 0.1457, 0.0123
-    bone.tail[:] = 0.0215, 0.1401, 0.0123
-    bone.roll = 0.0014
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.L']]
-    bones['ORG-palm.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-palm.002.L')
-    bone.head[:] = 0.0297, 0.1458, 0.0123
-    bone.tail[:] = 0.0311, 0.1393, 0.0123
-    bone.roll = -0.0005
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.L']]
-    bones['ORG-palm.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-palm.003.L')
-    bone.head[:] = 0.0363, 0.1473, 0.0123
-    bone.tail[:] = 0.0376, 0.1407, 0.0123
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.L']]
-    bones['ORG-palm.003.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-palm.004.L')
-    bone.head[:] = 0.0449, 0.1501, 0.0123
-    bone.tail[:] = 0.0466, 0.1479, 0.0123
-    bone.roll = -0.0004
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.L']]
-    bones['ORG-palm.004.L'] = bone.name
-    bone = arm.edit_bones.new('JIG-r_heel.L')
-    bone.head[:] = 0.0203, 0.1548, 0.0000
-    bone.tail[:] = 0.0477, 0.1548, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.L']]
-    bones['JIG-r_heel.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_palm.001.R')
-    bone.head[:] = -0.0220, 0.1457, 0.0123
-    bone.tail[:] = -0.0215, 0.1401, 0.0123
-    bone.roll = -0.0014
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.R']]
-    bones['ORG-r_palm.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_palm.002.R')
-    bone.head[:] = -0.0297, 0.1458, 0.0123
-    bone.tail[:] = -0.0311, 0.1393, 0.0123
-    bone.roll = 0.0005
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.R']]
-    bones['ORG-r_palm.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_palm.003.R')
-    bone.head[:] = -0.0363, 0.1473, 0.0123
-    bone.tail[:] = -0.0376, 0.1407, 0.0123
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.R']]
-    bones['ORG-r_palm.003.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_palm.004.R')
-    bone.head[:] = -0.0449, 0.1501, 0.0123
-    bone.tail[:] = -0.0466, 0.1479, 0.0123
-    bone.roll = 0.0004
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.R']]
-    bones['ORG-r_palm.004.R'] = bone.name
-    bone = arm.edit_bones.new('JIG-r_heel.R')
-    bone.head[:] = -0.0203, 0.1548, 0.0000
-    bone.tail[:] = -0.0477, 0.1548, 0.0000
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_toe.R']]
-    bones['JIG-r_heel.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tail.006')
-    bone.head[:] = 0.0000, 0.4028, 0.2303
-    bone.tail[:] = 0.0000, 0.4543, 0.2321
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-tail.005']]
-    bones['ORG-tail.006'] = bone.name
-    bone = arm.edit_bones.new('nose')
-    bone.head[:] = 0.0000, -0.2709, 0.2463
-    bone.tail[:] = 0.0000, -0.2705, 0.2315
-    bone.roll = -0.0018
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['nose'] = bone.name
-    bone = arm.edit_bones.new('lip.T.L')
-    bone.head[:] = 0.0000, -0.2762, 0.2076
-    bone.tail[:] = 0.0142, -0.2683, 0.2053
-    bone.roll = 0.0739
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['lip.T.L'] = bone.name
-    bone = arm.edit_bones.new('lip.B.L')
-    bone.head[:] = 0.0000, -0.2748, 0.2025
-    bone.tail[:] = 0.0102, -0.2676, 0.2025
-    bone.roll = 0.0154
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['lip.B.L'] = bone.name
-    bone = arm.edit_bones.new('jaw')
-    bone.head[:] = 0.0000, -0.2126, 0.2262
-    bone.tail[:] = 0.0000, -0.2524, 0.1977
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['jaw'] = bone.name
-    bone = arm.edit_bones.new('ear.L')
-    bone.head[:] = 0.0361, -0.2279, 0.2662
-    bone.tail[:] = 0.0259, -0.2360, 0.2749
-    bone.roll = -2.7956
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ear.L'] = bone.name
-    bone = arm.edit_bones.new('ear.R')
-    bone.head[:] = -0.0361, -0.2279, 0.2662
-    bone.tail[:] = -0.0259, -0.2360, 0.2749
-    bone.roll = 2.7956
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ear.R'] = bone.name
-    bone = arm.edit_bones.new('lip.T.R')
-    bone.head[:] = 0.0000, -0.2762, 0.2076
-    bone.tail[:] = -0.0142, -0.2683, 0.2053
-    bone.roll = -0.0739
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['lip.T.R'] = bone.name
-    bone = arm.edit_bones.new('lip.B.R')
-    bone.head[:] = 0.0000, -0.2748, 0.2025
-    bone.tail[:] = -0.0102, -0.2676, 0.2025
-    bone.roll = -0.0154
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['lip.B.R'] = bone.name
-    bone = arm.edit_bones.new('brow.B.L')
-    bone.head[:] = 0.0450, -0.2472, 0.2375
-    bone.tail[:] = 0.0336, -0.2577, 0.2472
-    bone.roll = -0.4810
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['brow.B.L'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L')
-    bone.head[:] = 0.0398, -0.2525, 0.2396
-    bone.tail[:] = 0.0327, -0.2600, 0.2432
-    bone.roll = -0.4405
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['lid.T.L'] = bone.name
-    bone = arm.edit_bones.new('brow.B.R')
-    bone.head[:] = -0.0450, -0.2472, 0.2375
-    bone.tail[:] = -0.0336, -0.2577, 0.2472
-    bone.roll = 0.4810
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['brow.B.R'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R')
-    bone.head[:] = -0.0398, -0.2525, 0.2396
-    bone.tail[:] = -0.0327, -0.2600, 0.2432
-    bone.roll = 0.4405
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['lid.T.R'] = bone.name
-    bone = arm.edit_bones.new('forehead.L')
-    bone.head[:] = 0.0103, -0.2600, 0.2669
-    bone.tail[:] = 0.0097, -0.2694, 0.2527
-    bone.roll = 1.6514
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['forehead.L'] = bone.name
-    bone = arm.edit_bones.new('forehead.R')
-    bone.head[:] = -0.0103, -0.2600, 0.2669
-    bone.tail[:] = -0.0097, -0.2694, 0.2527
-    bone.roll = -1.6514
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['forehead.R'] = bone.name
-    bone = arm.edit_bones.new('eye.L')
-    bone.head[:] = 0.0170, -0.2441, 0.2385
-    bone.tail[:] = 0.0170, -0.2738, 0.2385
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['eye.L'] = bone.name
-    bone = arm.edit_bones.new('eye.R')
-    bone.head[:] = -0.0170, -0.2441, 0.2385
-    bone.tail[:] = -0.0170, -0.2738, 0.2385
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['eye.R'] = bone.name
-    bone = arm.edit_bones.new('cheek.T.L')
-    bone.head[:] = 0.0450, -0.2472, 0.2375
-    bone.tail[:] = 0.0308, -0.2584, 0.2187
-    bone.roll = 0.3924
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['cheek.T.L'] = bone.name
-    bone = arm.edit_bones.new('cheek.T.R')
-    bone.head[:] = -0.0450, -0.2472, 0.2375
-    bone.tail[:] = -0.0308, -0.2584, 0.2187
-    bone.roll = -0.3924
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['cheek.T.R'] = bone.name
-    bone = arm.edit_bones.new('teeth.T')
-    bone.head[:] = 0.0000, -0.2724, 0.2129
-    bone.tail[:] = 0.0000, -0.2477, 0.2129
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['teeth.T'] = bone.name
-    bone = arm.edit_bones.new('teeth.B')
-    bone.head[:] = 0.0000, -0.2709, 0.2076
-    bone.tail[:] = 0.0000, -0.2463, 0.2076
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['teeth.B'] = bone.name
-    bone = arm.edit_bones.new('tongue')
-    bone.head[:] = 0.0000, -0.2693, 0.2091
-    bone.tail[:] = 0.0000, -0.2610, 0.2098
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['tongue'] = bone.name
-    bone = arm.edit_bones.new('ORG-forearm.L')
-    bone.head[:] = 0.0313, -0.0998, 0.1235
-    bone.tail[:] = 0.0313, -0.1178, 0.0248
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_arm.L']]
-    bones['ORG-forearm.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-forearm.R')
-    bone.head[:] = -0.0313, -0.0998, 0.1235
-    bone.tail[:] = -0.0313, -0.1178, 0.0248
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_arm.R']]
-    bones['ORG-forearm.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-index.001.L')
-    bone.head[:] = 0.0215, 0.1367, 0.0087
-    bone.tail[:] = 0.0217, 0.1325, 0.0070
-    bone.roll = -0.3427
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-palm.001.L']]
-    bones['ORG-index.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-middle.001.L')
-    bone.head[:] = 0.0311, 0.1358, 0.0117
-    bone.tail[:] = 0.0324, 0.1297, 0.0092
-    bone.roll = -1.0029
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-palm.002.L']]
-    bones['ORG-middle.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-ring.001.L')
-    bone.head[:] = 0.0376, 0.1372, 0.0117
-    bone.tail[:] = 0.0389, 0.1311, 0.0092
-    bone.roll = -1.0029
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-palm.003.L']]
-    bones['ORG-ring.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-pinky.001.L')
-    bone.head[:] = 0.0466, 0.1444, 0.0083
-    bone.tail[:] = 0.0476, 0.1412, 0.0074
-    bone.roll = -1.7551
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-palm.004.L']]
-    bones['ORG-pinky.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_index.001.R')
-    bone.head[:] = -0.0215, 0.1367, 0.0087
-    bone.tail[:] = -0.0217, 0.1325, 0.0070
-    bone.roll = 0.3427
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_palm.001.R']]
-    bones['ORG-r_index.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_middle.001.R')
-    bone.head[:] = -0.0311, 0.1358, 0.0117
-    bone.tail[:] = -0.0324, 0.1297, 0.0092
-    bone.roll = 1.0029
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_palm.002.R']]
-    bones['ORG-r_middle.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_ring.001.R')
-    bone.head[:] = -0.0376, 0.1372, 0.0117
-    bone.tail[:] = -0.0389, 0.1311, 0.0092
-    bone.roll = 1.0029
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_palm.003.R']]
-    bones['ORG-r_ring.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_pinky.001.R')
-    bone.head[:] = -0.0466, 0.1444, 0.0083
-    bone.tail[:] = -0.0476, 0.1412, 0.0074
-    bone.roll = 1.7551
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_palm.004.R']]
-    bones['ORG-r_pinky.001.R'] = bone.name
-    bone = arm.edit_bones.new('nose.001')
-    bone.head[:] = 0.0000, -0.2705, 0.2315
-    bone.tail[:] = 0.0000, -0.2804, 0.2205
-    bone.roll = 0.0253
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['nose']]
-    bones['nose.001'] = bone.name
-    bone = arm.edit_bones.new('lip.T.L.001')
-    bone.head[:] = 0.0142, -0.2683, 0.2053
-    bone.tail[:] = 0.0314, -0.2428, 0.2103
-    bone.roll = -0.0306
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lip.T.L']]
-    bones['lip.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('lip.B.L.001')
-    bone.head[:] = 0.0102, -0.2676, 0.2025
-    bone.tail[:] = 0.0314, -0.2428, 0.2103
-    bone.roll = 0.1360
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lip.B.L']]
-    bones['lip.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('chin')
-    bone.head[:] = 0.0000, -0.2524, 0.1977
-    bone.tail[:] = 0.0000, -0.2681, 0.1948
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['jaw']]
-    bones['chin'] = bone.name
-    bone = arm.edit_bones.new('ear.L.001')
-    bone.head[:] = 0.0259, -0.2360, 0.2749
-    bone.tail[:] = 0.0367, -0.2346, 0.2792
-    bone.roll = 1.1038
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.L']]
-    bones['ear.L.001'] = bone.name
-    bone = arm.edit_bones.new('ear.R.001')
-    bone.head[:] = -0.0259, -0.2360, 0.2749
-    bone.tail[:] = -0.0367, -0.2346, 0.2792
-    bone.roll = -1.1038
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.R']]
-    bones['ear.R.001'] = bone.name
-    bone = arm.edit_bones.new('lip.T.R.001')
-    bone.head[:] = -0.0142, -0.2683, 0.2053
-    bone.tail[:] = -0.0314, -0.2428, 0.2103
-    bone.roll = 0.0306
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lip.T.R']]
-    bones['lip.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('lip.B.R.001')
-    bone.head[:] = -0.0102, -0.2676, 0.2025
-    bone.tail[:] = -0.0314, -0.2428, 0.2103
-    bone.roll = -0.1360
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lip.B.R']]
-    bones['lip.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('brow.B.L.001')
-    bone.head[:] = 0.0336, -0.2577, 0.2472
-    bone.tail[:] = 0.0242, -0.2642, 0.2478
-    bone.roll = -0.0715
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.B.L']]
-    bones['brow.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.001')
-    bone.head[:] = 0.0327, -0.2600, 0.2432
-    bone.tail[:] = 0.0236, -0.2656, 0.2440
-    bone.roll = 0.1058
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.L']]
-    bones['lid.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('brow.B.R.001')
-    bone.head[:] = -0.0336, -0.2577, 0.2472
-    bone.tail[:] = -0.0242, -0.2642, 0.2478
-    bone.roll = 0.0715
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.B.R']]
-    bones['brow.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.001')
-    bone.head[:] = -0.0327, -0.2600, 0.2432
-    bone.tail[:] = -0.0236, -0.2656, 0.2440
-    bone.roll = -0.1058
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.R']]
-    bones['lid.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.L.001')
-    bone.head[:] = 0.0287, -0.2477, 0.2649
-    bone.tail[:] = 0.0241, -0.2601, 0.2567
-    bone.roll = 2.1575
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['forehead.L']]
-    bones['forehead.L.001'] = bone.name
-    bone = arm.edit_bones.new('forehead.R.001')
-    bone.head[:] = -0.0287, -0.2477, 0.2649
-    bone.tail[:] = -0.0241, -0.2601, 0.2567
-    bone.roll = -2.1575
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['forehead.R']]
-    bones['forehead.R.001'] = bone.name
-    bone = arm.edit_bones.new('cheek.T.L.001')
-    bone.head[:] = 0.0308, -0.2584, 0.2187
-    bone.tail[:] = 0.0121, -0.2695, 0.2220
-    bone.roll = -0.5048
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.T.L']]
-    bones['cheek.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('cheek.T.R.001')
-    bone.head[:] = -0.0308, -0.2584, 0.2187
-    bone.tail[:] = -0.0121, -0.2695, 0.2220
-    bone.roll = 0.5048
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.T.R']]
-    bones['cheek.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('tongue.001')
-    bone.head[:] = 0.0000, -0.2610, 0.2098
-    bone.tail[:] = 0.0000, -0.2461, 0.2100
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['tongue']]
-    bones['tongue.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-hand.L')
-    bone.head[:] = 0.0313, -0.1178, 0.0248
-    bone.tail[:] = 0.0313, -0.1261, 0.0108
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forearm.L']]
-    bones['ORG-hand.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-hand.R')
-    bone.head[:] = -0.0313, -0.1178, 0.0248
-    bone.tail[:] = -0.0313, -0.1261, 0.0108
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forearm.R']]
-    bones['ORG-hand.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-index.002.L')
-    bone.head[:] = 0.0217, 0.1325, 0.0070
-    bone.tail[:] = 0.0221, 0.1271, 0.0038
-    bone.roll = -0.2465
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-index.001.L']]
-    bones['ORG-index.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-middle.002.L')
-    bone.head[:] = 0.0324, 0.1297, 0.0092
-    bone.tail[:] = 0.0343, 0.1210, 0.0039
-    bone.roll = -0.7479
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-middle.001.L']]
-    bones['ORG-middle.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-ring.002.L')
-    bone.head[:] = 0.0389, 0.1311, 0.0092
-    bone.tail[:] = 0.0407, 0.1229, 0.0042
-    bone.roll = -0.7479
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-ring.001.L']]
-    bones['ORG-ring.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-pinky.002.L')
-    bone.head[:] = 0.0476, 0.1412, 0.0074
-    bone.tail[:] = 0.0494, 0.1351, 0.0032
-    bone.roll = -0.8965
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-pinky.001.L']]
-    bones['ORG-pinky.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_index.002.R')
-    bone.head[:] = -0.0217, 0.1325, 0.0070
-    bone.tail[:] = -0.0221, 0.1271, 0.0038
-    bone.roll = 0.2465
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_index.001.R']]
-    bones['ORG-r_index.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_middle.002.R')
-    bone.head[:] = -0.0324, 0.1297, 0.0092
-    bone.tail[:] = -0.0343, 0.1210, 0.0039
-    bone.roll = 0.7479
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_middle.001.R']]
-    bones['ORG-r_middle.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_ring.002.R')
-    bone.head[:] = -0.0389, 0.1311, 0.0092
-    bone.tail[:] = -0.0407, 0.1229, 0.0042
-    bone.roll = 0.7479
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_ring.001.R']]
-    bones['ORG-r_ring.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-r_pinky.002.R')
-    bone.head[:] = -0.0476, 0.1412, 0.0074
-    bone.tail[:] = -0.0494, 0.1351, 0.0032
-    bone.roll = 0.8965
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-r_pinky.001.R']]
-    bones['ORG-r_pinky.002.R'] = bone.name
-    bone = arm.edit_bones.new('nose.002')
-    bone.head[:] = 0.0000, -0.2804, 0.2205
-    bone.tail[:] = 0.0000, -0.2787, 0.2155
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['nose.001']]
-    bones['nose.002'] = bone.name
-    bone = arm.edit_bones.new('chin.001')
-    bone.head[:] = 0.0000, -0.2681, 0.1948
-    bone.tail[:] = 0.0000, -0.2749, 0.2015
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['chin']]
-    bones['chin.001'] = bone.name
-    bone = arm.edit_bones.new('ear.L.002')
-    bone.head[:] = 0.0367, -0.2346, 0.2792
-    bone.tail[:] = 0.0513, -0.2371, 0.2879
-    bone.roll = 1.6702
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.L.001']]
-    bones['ear.L.002'] = bone.name
-    bone = arm.edit_bones.new('ear.R.002')
-    bone.head[:] = -0.0367, -0.2346, 0.2792
-    bone.tail[:] = -0.0513, -0.2371, 0.2879
-    bone.roll = -1.6702
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.R.001']]
-    bones['ear.R.002'] = bone.name
-    bone = arm.edit_bones.new('brow.B.L.002')
-    bone.head[:] = 0.0242, -0.2642, 0.2478
-    bone.tail[:] = 0.0131, -0.2694, 0.2432
-    bone.roll = -0.1515
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.B.L.001']]
-    bones['brow.B.L.002'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.002')
-    bone.head[:] = 0.0236, -0.2656, 0.2440
-    bone.tail[:] = 0.0137, -0.2665, 0.2401
-    bone.roll = -0.1882
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.001']]
-    bones['lid.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('brow.B.R.002')
-    bone.head[:] = -0.0242, -0.2642, 0.2478
-    bone.tail[:] = -0.0131, -0.2694, 0.2432
-    bone.roll = 0.1515
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.B.R.001']]
-    bones['brow.B.R.002'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.002')
-    bone.head[:] = -0.0236, -0.2656, 0.2440
-    bone.tail[:] = -0.0137, -0.2665, 0.2401
-    bone.roll = 0.1882
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.001']]
-    bones['lid.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('forehead.L.002')
-    bone.head[:] = 0.0405, -0.2354, 0.2607
-    bone.tail[:] = 0.0402, -0.2481, 0.2487
-    bone.roll = 0.5185
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['forehead.L.001']]
-    bones['forehead.L.002'] = bone.name
-    bone = arm.edit_bones.new('forehead.R.002')
-    bone.head[:] = -0.0405, -0.2354, 0.2607
-    bone.tail[:] = -0.0402, -0.2481, 0.2487
-    bone.roll = -0.5185
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['forehead.R.001']]
-    bones['forehead.R.002'] = bone.name
-    bone = arm.edit_bones.new('nose.L')
-    bone.head[:] = 0.0121, -0.2695, 0.2220
-    bone.tail[:] = 0.0062, -0.2742, 0.2210
-    bone.roll = 2.5249
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.T.L.001']]
-    bones['nose.L'] = bone.name
-    bone = arm.edit_bones.new('nose.R')
-    bone.head[:] = -0.0121, -0.2695, 0.2220
-    bone.tail[:] = -0.0062, -0.2742, 0.2210
-    bone.roll = -2.5249
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.T.R.001']]
-    bones['nose.R'] = bone.name
-    bone = arm.edit_bones.new('tongue.002')
-    bone.head[:] = 0.0000, -0.2461, 0.2100
-    bone.tail[:] = 0.0000, -0.2309, 0.2083
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['tongue.001']]
-    bones['tongue.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_toe.L')
-    bone.head[:] = 0.0313, -0.1261, 0.0108
-    bone.tail[:] = 0.0313, -0.1416, 0.0009
-    bone.roll = -3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['ORG-f_toe.L'] = bone.name
-    bone = arm.edit_bones.new('JIG-f_heel.L')
-    bone.head[:] = 0.0203, -0.1167, 0.0000
-    bone.tail[:] = 0.0477, -0.1167, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.L']]
-    bones['JIG-f_heel.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_toe.R')
-    bone.head[:] = -0.0313, -0.1261, 0.0108
-    bone.tail[:] = -0.0313, -0.1416, 0.0009
-    bone.roll = 3.1416
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['ORG-f_toe.R'] = bone.name
-    bone = arm.edit_bones.new('JIG-f_heel.R')
-    bone.head[:] = -0.0203, -0.1167, 0.0000
-    bone.tail[:] = -0.0477, -0.1167, 0.0000
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-hand.R']]
-    bones['JIG-f_heel.R'] = bone.name
-    bone = arm.edit_bones.new('nose.003')
-    bone.head[:] = 0.0000, -0.2787, 0.2155
-    bone.tail[:] = 0.0000, -0.2788, 0.2123
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['nose.002']]
-    bones['nose.003'] = bone.name
-    bone = arm.edit_bones.new('ear.L.003')
-    bone.head[:] = 0.0513, -0.2371, 0.2879
-    bone.tail[:] = 0.0498, -0.2277, 0.2690
-    bone.roll = -2.2767
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.L.002']]
-    bones['ear.L.003'] = bone.name
-    bone = arm.edit_bones.new('ear.R.003')
-    bone.head[:] = -0.0513, -0.2371, 0.2879
-    bone.tail[:] = -0.0498, -0.2277, 0.2690
-    bone.roll = 2.2767
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.R.002']]
-    bones['ear.R.003'] = bone.name
-    bone = arm.edit_bones.new('brow.B.L.003')
-    bone.head[:] = 0.0131, -0.2694, 0.2432
-    bone.tail[:] = 0.0086, -0.2691, 0.2358
-    bone.roll = -0.2157
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.B.L.002']]
-    bones['brow.B.L.003'] = bone.name
-    bone = arm.edit_bones.new('lid.T.L.003')
-    bone.head[:] = 0.0137, -0.2665, 0.2401
-    bone.tail[:] = 0.0097, -0.2657, 0.2291
-    bone.roll = -0.4253
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.002']]
-    bones['lid.T.L.003'] = bone.name
-    bone = arm.edit_bones.new('brow.B.R.003')
-    bone.head[:] = -0.0131, -0.2694, 0.2432
-    bone.tail[:] = -0.0086, -0.2691, 0.2358
-    bone.roll = 0.2157
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.B.R.002']]
-    bones['brow.B.R.003'] = bone.name
-    bone = arm.edit_bones.new('lid.T.R.003')
-    bone.head[:] = -0.0137, -0.2665, 0.2401
-    bone.tail[:] = -0.0097, -0.2657, 0.2291
-    bone.roll = 0.4253
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.002']]
-    bones['lid.T.R.003'] = bone.name
-    bone = arm.edit_bones.new('temple.L')
-    bone.head[:] = 0.0367, -0.2123, 0.2525
-    bone.tail[:] = 0.0380, -0.2135, 0.2277
-    bone.roll = -0.0789
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['forehead.L.002']]
-    bones['temple.L'] = bone.name
-    bone = arm.edit_bones.new('temple.R')
-    bone.head[:] = -0.0367, -0.2123, 0.2525
-    bone.tail[:] = -0.0380, -0.2135, 0.2277
-    bone.roll = 0.0789
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['forehead.R.002']]
-    bones['temple.R'] = bone.name
-    bone = arm.edit_bones.new('nose.L.001')
-    bone.head[:] = 0.0062, -0.2742, 0.2210
-    bone.tail[:] = 0.0000, -0.2804, 0.2205
-    bone.roll = 0.1646
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['nose.L']]
-    bones['nose.L.001'] = bone.name
-    bone = arm.edit_bones.new('nose.R.001')
-    bone.head[:] = -0.0062, -0.2742, 0.2210
-    bone.tail[:] = 0.0000, -0.2804, 0.2205
-    bone.roll = -0.1646
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['nose.R']]
-    bones['nose.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.004.L')
-    bone.head[:] = 0.0393, -0.1278, 0.0100
-    bone.tail[:] = 0.0406, -0.1304, 0.0100
-    bone.roll = -0.0006
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.L']]
-    bones['ORG-f_palm.004.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.001.L')
-    bone.head[:] = 0.0216, -0.1278, 0.0100
-    bone.tail[:] = 0.0199, -0.1331, 0.0100
-    bone.roll = 0.0004
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.L']]
-    bones['ORG-f_palm.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.002.L')
-    bone.head[:] = 0.0273, -0.1278, 0.0100
-    bone.tail[:] = 0.0273, -0.1345, 0.0100
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.L']]
-    bones['ORG-f_palm.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.003.L')
-    bone.head[:] = 0.0341, -0.1278, 0.0100
-    bone.tail[:] = 0.0340, -0.1345, 0.0100
-    bone.roll = 0.0101
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.L']]
-    bones['ORG-f_palm.003.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.004.R')
-    bone.head[:] = -0.0393, -0.1278, 0.0100
-    bone.tail[:] = -0.0406, -0.1304, 0.0100
-    bone.roll = 0.0006
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.R']]
-    bones['ORG-f_palm.004.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.001.R')
-    bone.head[:] = -0.0216, -0.1278, 0.0100
-    bone.tail[:] = -0.0199, -0.1331, 0.0100
-    bone.roll = -0.0004
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.R']]
-    bones['ORG-f_palm.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.002.R')
-    bone.head[:] = -0.0273, -0.1278, 0.0100
-    bone.tail[:] = -0.0273, -0.1345, 0.0100
-    bone.roll = -3.1416
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.R']]
-    bones['ORG-f_palm.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_palm.003.R')
-    bone.head[:] = -0.0341, -0.1278, 0.0100
-    bone.tail[:] = -0.0340, -0.1345, 0.0100
-    bone.roll = -0.0101
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_toe.R']]
-    bones['ORG-f_palm.003.R'] = bone.name
-    bone = arm.edit_bones.new('nose.004')
-    bone.head[:] = 0.0000, -0.2788, 0.2123
-    bone.tail[:] = 0.0000, -0.2785, 0.2091
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['nose.003']]
-    bones['nose.004'] = bone.name
-    bone = arm.edit_bones.new('ear.L.004')
-    bone.head[:] = 0.0498, -0.2277, 0.2690
-    bone.tail[:] = 0.0361, -0.2279, 0.2662
-    bone.roll = -3.8181
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.L.003']]
-    bones['ear.L.004'] = bone.name
-    bone = arm.edit_bones.new('ear.R.004')
-    bone.head[:] = -0.0498, -0.2277, 0.2690
-    bone.tail[:] = -0.0361, -0.2279, 0.2662
-    bone.roll = 3.8181
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ear.R.003']]
-    bones['ear.R.004'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L')
-    bone.head[:] = 0.0097, -0.2657, 0.2291
-    bone.tail[:] = 0.0150, -0.2661, 0.2277
-    bone.roll = 0.0693
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.L.003']]
-    bones['lid.B.L'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R')
-    bone.head[:] = -0.0097, -0.2657, 0.2291
-    bone.tail[:] = -0.0150, -0.2661, 0.2277
-    bone.roll = -0.0693
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.T.R.003']]
-    bones['lid.B.R'] = bone.name
-    bone = arm.edit_bones.new('jaw.L')
-    bone.head[:] = 0.0380, -0.2135, 0.2277
-    bone.tail[:] = 0.0284, -0.2162, 0.2076
-    bone.roll = 0.1964
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['temple.L']]
-    bones['jaw.L'] = bone.name
-    bone = arm.edit_bones.new('jaw.R')
-    bone.head[:] = -0.0380, -0.2135, 0.2277
-    bone.tail[:] = -0.0284, -0.2162, 0.2076
-    bone.roll = -0.1964
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['temple.R']]
-    bones['jaw.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.001.L')
-    bone.head[:] = 0.0406, -0.1304, 0.0074
-    bone.tail[:] = 0.0408, -0.1337, 0.0065
-    bone.roll = -0.6234
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.004.L']]
-    bones['ORG-f_pinky.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.001.L')
-    bone.head[:] = 0.0199, -0.1331, 0.0077
-    bone.tail[:] = 0.0193, -0.1372, 0.0060
-    bone.roll = 0.7154
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.001.L']]
-    bones['ORG-f_index.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.001.L')
-    bone.head[:] = 0.0273, -0.1345, 0.0107
-    bone.tail[:] = 0.0273, -0.1407, 0.0082
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.002.L']]
-    bones['ORG-f_middle.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.001.L')
-    bone.head[:] = 0.0340, -0.1345, 0.0107
-    bone.tail[:] = 0.0340, -0.1407, 0.0082
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.003.L']]
-    bones['ORG-f_ring.001.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.001.R')
-    bone.head[:] = -0.0406, -0.1304, 0.0074
-    bone.tail[:] = -0.0408, -0.1337, 0.0065
-    bone.roll = 0.6234
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.004.R']]
-    bones['ORG-f_pinky.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.001.R')
-    bone.head[:] = -0.0199, -0.1331, 0.0077
-    bone.tail[:] = -0.0193, -0.1372, 0.0060
-    bone.roll = -0.7154
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.001.R']]
-    bones['ORG-f_index.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.001.R')
-    bone.head[:] = -0.0273, -0.1345, 0.0107
-    bone.tail[:] = -0.0273, -0.1407, 0.0082
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.002.R']]
-    bones['ORG-f_middle.001.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.001.R')
-    bone.head[:] = -0.0340, -0.1345, 0.0107
-    bone.tail[:] = -0.0340, -0.1407, 0.0082
-    bone.roll = -0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_palm.003.R']]
-    bones['ORG-f_ring.001.R'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.001')
-    bone.head[:] = 0.0150, -0.2661, 0.2277
-    bone.tail[:] = 0.0221, -0.2652, 0.2262
-    bone.roll = 0.1759
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.B.L']]
-    bones['lid.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.001')
-    bone.head[:] = -0.0150, -0.2661, 0.2277
-    bone.tail[:] = -0.0221, -0.2652, 0.2262
-    bone.roll = -0.1759
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.B.R']]
-    bones['lid.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('jaw.L.001')
-    bone.head[:] = 0.0284, -0.2162, 0.2076
-    bone.tail[:] = 0.0235, -0.2371, 0.2014
-    bone.roll = -0.0005
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['jaw.L']]
-    bones['jaw.L.001'] = bone.name
-    bone = arm.edit_bones.new('jaw.R.001')
-    bone.head[:] = -0.0284, -0.2162, 0.2076
-    bone.tail[:] = -0.0235, -0.2371, 0.2014
-    bone.roll = 0.0005
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['jaw.R']]
-    bones['jaw.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.002.L')
-    bone.head[:] = 0.0408, -0.1337, 0.0065
-    bone.tail[:] = 0.0413, -0.1400, 0.0023
-    bone.roll = -0.2560
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_pinky.001.L']]
-    bones['ORG-f_pinky.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.002.L')
-    bone.head[:] = 0.0193, -0.1372, 0.0060
-    bone.tail[:] = 0.0186, -0.1427, 0.0028
-    bone.roll = 0.5229
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_index.001.L']]
-    bones['ORG-f_index.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.002.L')
-    bone.head[:] = 0.0273, -0.1407, 0.0082
-    bone.tail[:] = 0.0273, -0.1496, 0.0030
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_middle.001.L']]
-    bones['ORG-f_middle.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.002.L')
-    bone.head[:] = 0.0340, -0.1407, 0.0082
-    bone.tail[:] = 0.0340, -0.1491, 0.0033
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_ring.001.L']]
-    bones['ORG-f_ring.002.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_pinky.002.R')
-    bone.head[:] = -0.0408, -0.1337, 0.0065
-    bone.tail[:] = -0.0413, -0.1400, 0.0023
-    bone.roll = 0.2560
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_pinky.001.R']]
-    bones['ORG-f_pinky.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_index.002.R')
-    bone.head[:] = -0.0193, -0.1372, 0.0060
-    bone.tail[:] = -0.0186, -0.1427, 0.0028
-    bone.roll = -0.5229
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_index.001.R']]
-    bones['ORG-f_index.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_middle.002.R')
-    bone.head[:] = -0.0273, -0.1407, 0.0082
-    bone.tail[:] = -0.0273, -0.1496, 0.0030
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_middle.001.R']]
-    bones['ORG-f_middle.002.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-f_ring.002.R')
-    bone.head[:] = -0.0340, -0.1407, 0.0082
-    bone.tail[:] = -0.0340, -0.1491, 0.0033
-    bone.roll = -0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-f_ring.001.R']]
-    bones['ORG-f_ring.002.R'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.002')
-    bone.head[:] = 0.0221, -0.2652, 0.2262
-    bone.tail[:] = 0.0333, -0.2602, 0.2291
-    bone.roll = 0.0161
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.B.L.001']]
-    bones['lid.B.L.002'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.002')
-    bone.head[:] = -0.0221, -0.2652, 0.2262
-    bone.tail[:] = -0.0333, -0.2602, 0.2291
-    bone.roll = -0.0161
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.B.R.001']]
-    bones['lid.B.R.002'] = bone.name
-    bone = arm.edit_bones.new('chin.L')
-    bone.head[:] = 0.0235, -0.2371, 0.2014
-    bone.tail[:] = 0.0287, -0.2395, 0.2103
-    bone.roll = 0.4176
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['jaw.L.001']]
-    bones['chin.L'] = bone.name
-    bone = arm.edit_bones.new('chin.R')
-    bone.head[:] = -0.0235, -0.2371, 0.2014
-    bone.tail[:] = -0.0287, -0.2395, 0.2103
-    bone.roll = -0.4176
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['jaw.R.001']]
-    bones['chin.R'] = bone.name
-    bone = arm.edit_bones.new('lid.B.L.003')
-    bone.head[:] = 0.0333, -0.2602, 0.2291
-    bone.tail[:] = 0.0398, -0.2525, 0.2396
-    bone.roll = -0.0675
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.B.L.002']]
-    bones['lid.B.L.003'] = bone.name
-    bone = arm.edit_bones.new('lid.B.R.003')
-    bone.head[:] = -0.0333, -0.2602, 0.2291
-    bone.tail[:] = -0.0398, -0.2525, 0.2396
-    bone.roll = 0.0675
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['lid.B.R.002']]
-    bones['lid.B.R.003'] = bone.name
-    bone = arm.edit_bones.new('cheek.B.L')
-    bone.head[:] = 0.0287, -0.2395, 0.2103
-    bone.tail[:] = 0.0448, -0.2396, 0.2234
-    bone.roll = -0.3125
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['chin.L']]
-    bones['cheek.B.L'] = bone.name
-    bone = arm.edit_bones.new('cheek.B.R')
-    bone.head[:] = -0.0287, -0.2395, 0.2103
-    bone.tail[:] = -0.0448, -0.2396, 0.2234
-    bone.roll = 0.3125
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['chin.R']]
-    bones['cheek.B.R'] = bone.name
-    bone = arm.edit_bones.new('cheek.B.L.001')
-    bone.head[:] = 0.0448, -0.2396, 0.2234
-    bone.tail[:] = 0.0478, -0.2312, 0.2379
-    bone.roll = -0.0215
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.B.L']]
-    bones['cheek.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('cheek.B.R.001')
-    bone.head[:] = -0.0448, -0.2396, 0.2234
-    bone.tail[:] = -0.0478, -0.2312, 0.2379
-    bone.roll = 0.0215
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.B.R']]
-    bones['cheek.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L')
-    bone.head[:] = 0.0478, -0.2312, 0.2379
-    bone.tail[:] = 0.0402, -0.2481, 0.2487
-    bone.roll = -0.6301
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.B.L.001']]
-    bones['brow.T.L'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R')
-    bone.head[:] = -0.0478, -0.2312, 0.2379
-    bone.tail[:] = -0.0402, -0.2481, 0.2487
-    bone.roll = 0.6301
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['cheek.B.R.001']]
-    bones['brow.T.R'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.001')
-    bone.head[:] = 0.0402, -0.2481, 0.2487
-    bone.tail[:] = 0.0241, -0.2601, 0.2567
-    bone.roll = 0.3622
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.T.L']]
-    bones['brow.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.001')
-    bone.head[:] = -0.0402, -0.2481, 0.2487
-    bone.tail[:] = -0.0241, -0.2601, 0.2567
-    bone.roll = -0.3622
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.T.R']]
-    bones['brow.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.002')
-    bone.head[:] = 0.0241, -0.2601, 0.2567
-    bone.tail[:] = 0.0097, -0.2694, 0.2527
-    bone.roll = 0.0684
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.T.L.001']]
-    bones['brow.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.002')
-    bone.head[:] = -0.0241, -0.2601, 0.2567
-    bone.tail[:] = -0.0097, -0.2694, 0.2527
-    bone.roll = -0.0684
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.T.R.001']]
-    bones['brow.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('brow.T.L.003')
-    bone.head[:] = 0.0097, -0.2694, 0.2527
-    bone.tail[:] = 0.0000, -0.2709, 0.2463
-    bone.roll = 0.0020
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.T.L.002']]
-    bones['brow.T.L.003'] = bone.name
-    bone = arm.edit_bones.new('brow.T.R.003')
-    bone.head[:] = -0.0097, -0.2694, 0.2527
-    bone.tail[:] = 0.0000, -0.2709, 0.2463
-    bone.roll = -0.0020
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['brow.T.R.002']]
-    bones['brow.T.R.003'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-hips']]
-    pbone.gamerig_type = 'torso'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-tail.001']]
-    pbone.gamerig_type = 'tentacle'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.chain_length = 6
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.stretchable = False
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.mid_ik_lens = [3, 0, 0, 0]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-waist']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-thigh.L']]
-    pbone.gamerig_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-f_heel.L"
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-thigh.R']]
-    pbone.gamerig_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-r_heel.R"
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-tail.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-chest']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shin.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shin.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-tail.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-upper_chest']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-foot.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-foot.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-tail.004']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.chain_length = 3
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.stretchable = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-neck']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shoulder.L']]
-    pbone.gamerig_type = 'generic'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-shoulder.R']]
-    pbone.gamerig_type = 'generic'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_toe.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_toe.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-tail.005']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-head']]
-    pbone.gamerig_type = 'face'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-upper_arm.L']]
-    pbone.gamerig_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-f_heel.L"
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-upper_arm.R']]
-    pbone.gamerig_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-f_heel.R"
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-palm.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-palm.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-palm.003.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-palm.004.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['JIG-r_heel.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, True, False, True, False, True, False, False, True, False, False, True, False, False, True, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_palm.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_palm.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_palm.003.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_palm.004.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['JIG-r_heel.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, True, False, True, False, True, False, False, True, False, False, True, False, False, True, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-tail.006']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['jaw']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['forehead.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['forehead.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['eye.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['eye.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['teeth.T']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['teeth.B']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['tongue']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-forearm.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-forearm.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-index.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-middle.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-ring.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-pinky.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_index.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_middle.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_ring.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_pinky.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['chin']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lip.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['forehead.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['forehead.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['tongue.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-hand.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-hand.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-index.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-middle.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-ring.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-pinky.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_index.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_middle.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_ring.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-r_pinky.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['chin.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['forehead.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['forehead.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['tongue.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_toe.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['JIG-f_heel.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, True, False, True, False, True, False, False, True, False, False, True, False, False, True, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_toe.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['JIG-f_heel.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, True, False, True, False, True, False, False, True, False, False, True, False, False, True, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.B.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.T.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['temple.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['temple.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.004.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.003.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.004.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_palm.003.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['nose.004']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.L.004']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ear.R.004']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['jaw.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['jaw.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.001.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.001.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['jaw.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['jaw.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.002.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_pinky.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_index.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_middle.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['ORG-f_ring.002.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['chin.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['chin.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['lid.B.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['cheek.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    pbone = obj.pose.bones[bones['brow.T.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone.bone.layers = [True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
-
-    arm.layers = [(x in [0, 3, 5, 7, 10, 13, 16, 19]) for x in range(32)]
-
-if __name__ == "__main__":
-    create(bpy.context.active_object)
+    load_bundled_metarig(obj, __file__)
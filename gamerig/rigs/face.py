@@ -1,11 +1,15 @@
 import bpy, re
+from math import radians
 from mathutils import Vector
-from rna_prop_ui import rna_idprop_ui_prop_get
 from ..utils import (
-    MetarigError, copy_bone, flip_bone, connected_children_names, find_root_bone,
-    create_widget,
+    MetarigError, copy_edit_bone, copy_pose_bone, flip_bone, connected_children_names, find_root_bone,
+    tag_playback_optional,
     org, basename, mch, insert_before_first_period, MCH_PREFIX
 )
+from ..widget_builder import queue_library_widget
+from ..builder import add_property, add_driver
+from ..face_shapes import face_shape_output
+from ..metarig_data import load_sample
 from .widgets import create_face_widget, create_eye_widget, create_eyes_widget, create_ear_widget, create_jaw_widget
 
 def mch_target(name):
@@ -17,6 +21,20 @@ def mch_target(name):
     else:
         return MCH_PREFIX + 'target_' + name
 
+# Optional feature groups of the face: (parameter, ORG bone base name prefixes).
+# The jaw, eyes, brows and temples are always generated. The bones of the
+# excluded features don't deform, their weights are to be merged into the
+# face root.
+FACE_FEATURES = (
+    ('face_lips',   ('lip.',)),
+    ('face_lids',   ('lid.',)),
+    ('face_tongue', ('tongue',)),
+    ('face_cheeks', ('cheek.',)),
+    ('face_nose',   ('nose',)),
+    ('face_ears',   ('ear.',)),
+    ('face_chin',   ('chin',)),
+)
+
 class Rig:
 
     def __init__(self, obj, bone_name, params):
@@ -58,7 +76,16 @@ class Rig:
         self.add_chained_to_bone_name_map(c if c else root,     'nose.R')
         self.add_chained_to_bone_name_map(root,                 'tongue')
 
+        # ORG bones of the excluded features get neither controls nor mechanism,
+        # nor deformation, they just follow the face.
+        self.static_bones = []
+        excluded = tuple( prefix for param, prefixes in FACE_FEATURES if not getattr(params, param) for prefix in prefixes )
+        if excluded:
+            for key in [ key for key in self.bone_name_map.keys() if basename(key).startswith(excluded) ]:
+                self.static_bones.append( self.bone_name_map.pop(key) )
+
         self.org_bones   = [bone for bone in self.bone_name_map.keys()]
+        self.unique_basebonenames = {}
         self.face_length = obj.data.edit_bones[ bone_name ].length
         self.params      = params
 
@@ -95,16 +122,25 @@ class Rig:
         return int(match.group(1)) if match else None
     
     def make_unique_basebonename(self, bonename):
-        if bonename in self.bone_name_map.keys():
-            num = self.get_number_suffix(bonename)
-            return self.make_unique_basebonename(bonename[:-3] + ('%03d' % (num + 1)) if num else bonename + '.001')
-        else:
-            return bonename
+        """ Returns bonename, or its first numbered successor not in use.
+            Names are never released, so the search for a name resumes
+            from the last name handed out for it.
+        """
+        name = self.unique_basebonenames.get(bonename, bonename)
+        while name in self.bone_name_map:
+            num = self.get_number_suffix(name)
+            name = name[:-3] + ('%03d' % (num + 1)) if num else name + '.001'
+        self.unique_basebonenames[bonename] = name
+        return name
 
     def copy_bone(self, obj, bone_name, assign_name):
+        """ Copies the edit bone, its pose bone attributes are copied
+            by setup_pose_bones() once out of edit mode.
+        """
         assign_name = self.make_unique_basebonename(assign_name) if assign_name else bone_name
-        ret = copy_bone(obj, self.rbn(bone_name), assign_name)
+        ret = copy_edit_bone(obj, self.rbn(bone_name), assign_name)
         self.bone_name_map[assign_name] = ret
+        self.pose_copies.append( (self.rbn(bone_name), ret) )
         return assign_name
 
     def rbn(self, bonebasename):
@@ -133,7 +169,6 @@ class Rig:
         ret = {}
 
         ## create control bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         # eyes ctrls
@@ -227,37 +262,37 @@ class Rig:
             
             ret['tongue'] = [ tongue_ctrl_name ]
 
-        ## Assign widgets
-        bpy.ops.object.mode_set(mode ='OBJECT')
+        ## Assign widgets (created by setup_pose_bones())
+        widgets = self.pending_widgets
 
         # Assign each eye widgets
         if 'eyes' in ret:
-            create_eye_widget( self.obj, rbn(ret['eyes'][0]) )
-            create_eye_widget( self.obj, rbn(ret['eyes'][1]) )
+            widgets.append( ( create_eye_widget, rbn(ret['eyes'][0]), {} ) )
+            widgets.append( ( create_eye_widget, rbn(ret['eyes'][1]), {} ) )
 
             # Assign eyes widgets
-            create_eyes_widget( self.obj, rbn(ret['eyes'][2]) )
+            widgets.append( ( create_eyes_widget, rbn(ret['eyes'][2]), {} ) )
 
         # Assign each eye_master widgets
         for master in eye_master_names:
-            create_square_widget(self.obj, rbn(master))
+            widgets.append( ( create_square_widget, rbn(master), {} ) )
 
         # Assign nose_master widget
         if 'nose' in ret:
-            create_square_widget( self.obj, rbn(master_nose), size = 1 )
+            widgets.append( ( create_square_widget, rbn(master_nose), { 'size' : 1 } ) )
 
         # Assign ears widget
         if 'ears' in ret:
-            create_ear_widget( self.obj, rbn(earL_ctrl_name) )
-            create_ear_widget( self.obj, rbn(earR_ctrl_name) )
+            widgets.append( ( create_ear_widget, rbn(earL_ctrl_name), {} ) )
+            widgets.append( ( create_ear_widget, rbn(earR_ctrl_name), {} ) )
 
         # Assign jaw widget
         if 'jaw' in ret:
-            create_jaw_widget( self.obj, rbn(jaw_ctrl_name) )
+            widgets.append( ( create_jaw_widget, rbn(jaw_ctrl_name), {} ) )
 
         # Assign tongue widget ( using the jaw widget )
         if 'tongue' in ret:
-            create_jaw_widget( self.obj, rbn(tongue_ctrl_name) )
+            widgets.append( ( create_jaw_widget, rbn(tongue_ctrl_name), {} ) )
 
         return ret
 
@@ -267,7 +302,6 @@ class Rig:
         rbn = self.rbn
 
         ## create tweak bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         tweaks = []
@@ -319,19 +353,17 @@ class Rig:
 
                     tweaks.append( tweak_name )
 
-        bpy.ops.object.mode_set(mode ='OBJECT')
-        pb = self.obj.pose.bones
-
+        # Layers and widgets (set by setup_pose_bones())
         for bone in tweaks:
             if bone in self.bone_name_map:
                 if bone in primary_tweaks:
                     if self.primary_layers:
-                        pb[rbn(bone)].bone.layers = self.primary_layers
-                    create_face_widget( self.obj, rbn(bone), size = 1.5 )
+                        self.pending_layers.append( ( rbn(bone), self.primary_layers ) )
+                    self.pending_widgets.append( ( create_face_widget, rbn(bone), { 'size' : 1.5 } ) )
                 else:
                     if self.secondary_layers:
-                        pb[rbn(bone)].bone.layers = self.secondary_layers
-                    create_face_widget( self.obj, rbn(bone) )
+                        self.pending_layers.append( ( rbn(bone), self.secondary_layers ) )
+                    self.pending_widgets.append( ( create_face_widget, rbn(bone), {} ) )
 
         return { 'all' : tweaks }
 
@@ -392,7 +424,6 @@ class Rig:
     def create_mch( self, jaw_ctrl, tongue_ctrl, chin_ctrl ):
         org_bones = self.org_bones
         rbn = self.rbn
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         # Create eyes mch bones
@@ -515,7 +546,6 @@ class Rig:
     def create_mch_targets( self ):
         org_bones = self.org_bones
         rbn = self.rbn
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         mchts = []
@@ -532,7 +562,6 @@ class Rig:
 
     def parent_bones( self, all_bones, tweak_unique, mchts ):
         rbn = self.rbn
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         face_name = org('face')
@@ -748,10 +777,16 @@ class Rig:
             if bone != face_name and eb[ rbn(bone) ].parent is None:
                 eb[ rbn(bone) ].parent = eb[ rbn(face_name) ]
 
+        # Parent the org bones of the excluded features to the ORG-face as static,
+        # non deforming bones
+        for bone in self.static_bones:
+            eb[ bone ].use_connect = False
+            eb[ bone ].parent      = eb[ rbn(face_name) ]
+            eb[ bone ].use_deform  = False
+
 
     def make_constraits( self, constraint_type, bone, subtarget, influence = 1 ):
         rbn = self.rbn
-        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
         
         if not (bone in self.bone_name_map and subtarget in self.bone_name_map):
@@ -764,10 +799,12 @@ class Rig:
             const = owner_pb.constraints.new( 'DAMPED_TRACK' )
             const.target    = self.obj
             const.subtarget = rbn(subtarget)
+            tag_playback_optional( owner_pb, const )
 
             const = owner_pb.constraints.new( 'STRETCH_TO' )
             const.target    = self.obj
             const.subtarget = rbn(subtarget)
+            tag_playback_optional( owner_pb, const )
 
         elif constraint_type == 'mch_target':
 
@@ -784,11 +821,13 @@ class Rig:
             const.target    = self.obj
             const.subtarget = rbn(subtarget)
             const.head_tail = 1.0
+            tag_playback_optional( owner_pb, const )
 
             const = owner_pb.constraints.new( 'STRETCH_TO' )
             const.target    = self.obj
             const.subtarget = rbn(subtarget)
             const.head_tail = 1.0
+            tag_playback_optional( owner_pb, const )
 
         elif constraint_type == 'mch_eyes':
 
@@ -1063,7 +1102,6 @@ class Rig:
 
     def drivers_and_props( self, all_bones ):
         rbn = self.rbn
-        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
 
         # Mouse Lock
@@ -1071,105 +1109,61 @@ class Rig:
         if ctrl and 'jaw' in all_bones['mch']:
             ctrl_bone = rbn(ctrl)
             prop_name = 'Mouth Lock'
-            pb[ ctrl_bone ][ prop_name ] = 0.0
-            prop = rna_idprop_ui_prop_get( pb[ ctrl_bone ], prop_name )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = "Mouth bones don't move if jaw moves"
+            add_property( self, ctrl_bone, prop_name, 0.0, "Mouth bones don't move if jaw moves" )
             mch_jaws = all_bones['mch']['jaw'][1:-1]
 
             # Jaw drivers
             for bone in mch_jaws:
-                drv = pb[ rbn(bone) ].constraints[1].driver_add("influence").driver
-                drv.type='SUM'
-
-                var = drv.variables.new()
-                var.name = 'mouth_lock'
-                var.type = "SINGLE_PROP"
-                var.targets[0].id = self.obj
-                var.targets[0].data_path = pb[ ctrl_bone ].path_from_id() + '['+ '"' + prop_name + '"' + ']'
+                add_driver(
+                    self, rbn(bone), pb[ rbn(bone) ].constraints[1].name, ctrl_bone, prop_name, 'mouth_lock',
+                    driver_type='SUM'
+                )
 
         # Eyes Follow
         ctrl = all_bones['ctrls']['eyes'][2] if 'eyes' in all_bones['ctrls'] else None
         if ctrl and 'eyes_parent' in all_bones['mch']:
             ctrl_bone = rbn(ctrl)
             prop_name = 'Eyes Follow'
-            pb[ ctrl_bone ][ prop_name ] = 1.0
-            prop = rna_idprop_ui_prop_get( pb[ ctrl_bone ], prop_name )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = 'Switch eyes follow to face'
+            add_property( self, ctrl_bone, prop_name, 1.0, 'Switch eyes follow to face' )
 
             # Eyes driver
-            mch_eyes_parent = all_bones['mch']['eyes_parent'][0]
-
-            drv = pb[ rbn(mch_eyes_parent) ].constraints[0].driver_add("influence").driver
-            drv.type='SUM'
-
-            var = drv.variables.new()
-            var.name = 'eyes_follow'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[ ctrl_bone ].path_from_id() + '['+ '"' + prop_name + '"' + ']'
+            mch_eyes_parent = rbn( all_bones['mch']['eyes_parent'][0] )
+            add_driver(
+                self, mch_eyes_parent, pb[ mch_eyes_parent ].constraints[0].name, ctrl_bone, prop_name, 'eyes_follow',
+                driver_type='SUM'
+            )
 
         # Tongue Follow
         ctrl = all_bones['ctrls']['tongue'][0] if 'tongue' in all_bones['ctrls'] else None
         if ctrl and 'tongue_parent' in all_bones['mch']:
             ctrl_bone = rbn(ctrl)
             prop_name = 'Tongue Follow'
-            pb[ ctrl_bone ][ 'Tongue Follow' ] = 1.0
-            prop = rna_idprop_ui_prop_get( pb[ ctrl_bone ], 'Tongue Follow' )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = 'Switch tongue follow to jaw or face'
+            add_property( self, ctrl_bone, prop_name, 1.0, 'Switch tongue follow to jaw or face' )
 
             # Tongue driver
-            mch_tongue_parent = all_bones['mch']['tongue_parent'][0]
-
-            drv = pb[ rbn(mch_tongue_parent) ].constraints[0].driver_add("influence").driver
-            drv.type='SUM'
-
-            var = drv.variables.new()
-            var.name = 'tongue_follow'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[ ctrl_bone ].path_from_id() + '['+ '"' + prop_name + '"' + ']'
+            mch_tongue_parent = rbn( all_bones['mch']['tongue_parent'][0] )
+            add_driver(
+                self, mch_tongue_parent, pb[ mch_tongue_parent ].constraints[0].name, ctrl_bone, prop_name, 'tongue_follow',
+                driver_type='SUM'
+            )
 
         # Chin Follow
         ctrl = 'chin' if 'chin' in all_bones['tweaks']['all'] else None
         if ctrl and 'chin_parent' in all_bones['mch']:
             ctrl_bone = rbn(ctrl)
             prop_name = 'Chin Follow'
-            pb[ ctrl_bone ][ 'Chin Follow' ] = 1.0
-            prop = rna_idprop_ui_prop_get( pb[ ctrl_bone ], 'Chin Follow' )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = 'Switch chin follow to jaw or face'
-
-            # Tongue driver
-            mch_chin_parent = all_bones['mch']['chin_parent'][0]
+            add_property( self, ctrl_bone, prop_name, 1.0, 'Switch chin follow to jaw or face' )
 
-            drv = pb[ rbn(mch_chin_parent) ].constraints[0].driver_add("influence").driver
-            drv.type='SUM'
-
-            var = drv.variables.new()
-            var.name = 'chin_follow'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[ ctrl_bone ].path_from_id() + '['+ '"' + prop_name + '"' + ']'
+            # Chin driver
+            mch_chin_parent = rbn( all_bones['mch']['chin_parent'][0] )
+            add_driver(
+                self, mch_chin_parent, pb[ mch_chin_parent ].constraints[0].name, ctrl_bone, prop_name, 'chin_follow',
+                driver_type='SUM'
+            )
 
 
     def create_bones(self):
         rbn = self.rbn
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         face_name = org('face')
@@ -1200,10 +1194,62 @@ class Rig:
         }, tweak_unique, mch_targets
 
 
+    def setup_pose_bones(self):
+        """ Copies the pose bone attributes of the bones copied in edit mode,
+            then assigns the tweak layers and creates the widgets.
+        """
+        for bone_name_1, bone_name_2 in self.pose_copies:
+            copy_pose_bone( self.obj, bone_name_1, bone_name_2 )
+
+        pb = self.obj.pose.bones
+        for bone, layers in self.pending_layers:
+            pb[bone].bone.layers = layers
+
+        for create, bone, kwargs in self.pending_widgets:
+            create( self.obj, bone, **kwargs )
+
+
+    def shape_output( self, all_bones, all_ctrls ):
+        """ Drops the ORG bones but the face root and the eyes from the deformation,
+            and records the extreme values of the controls to bake them as shape keys.
+        """
+        rbn = self.rbn
+        face_name = org('face')
+
+        eyes  = [ rbn(bone) for bone in self.org_bones if 'eye' in bone ]
+        bones = [ rbn(bone) for bone in self.org_bones if bone != face_name and rbn(bone) not in eyes ]
+
+        for bone in bones:
+            self.obj.data.bones[bone].use_deform = False
+
+        distance = self.face_length / 10
+        controls = []
+        for ctrl in all_ctrls:
+            for channel in ( 'LOC_X', 'LOC_Y', 'LOC_Z' ):
+                controls.append( [ rbn(ctrl), channel,  distance ] )
+                controls.append( [ rbn(ctrl), channel, -distance ] )
+
+        # the jaw opens and closes
+        for ctrl in all_bones['ctrls'].get('jaw', []):
+            controls.append( [ rbn(ctrl), 'ROT_X',  radians(30) ] )
+            controls.append( [ rbn(ctrl), 'ROT_X', -radians(10) ] )
+
+        face_shape_output( self.obj.pose.bones[ rbn(face_name) ], controls, bones, eyes )
+
+
     def generate(self, context):
+        self.pose_copies     = []
+        self.pending_layers  = []
+        self.pending_widgets = []
 
+        # All the edit work in a single edit mode pass
+        bpy.ops.object.mode_set(mode ='EDIT')
         all_bones, tweak_unique, mchts = self.create_bones()
         self.parent_bones( all_bones, tweak_unique, mchts )
+
+        # then the pose work in a single object mode pass
+        bpy.ops.object.mode_set(mode ='OBJECT')
+        self.setup_pose_bones()
         self.constraints( all_bones, mchts )
         self.drivers_and_props( all_bones )
 
@@ -1216,6 +1262,9 @@ class Rig:
             for bone in group:
                 all_ctrls.append( bone )
 
+        if self.params.face_output == 'SHAPE_KEYS':
+            self.shape_output( all_bones, all_ctrls )
+
         controls_string = ", ".join(["'" + x + "'" for x in all_ctrls])
         jaw_ctrl = all_bones['ctrls']['jaw'][0] if 'jaw' in all_bones['ctrls'] else None
         eyes_ctrl = all_bones['ctrls']['eyes'][2] if 'eyes' in all_bones['ctrls'] else None
@@ -1264,6 +1313,23 @@ def add_parameters(params):
         default     = tuple( [ i == 2 for i in range(0, 32) ] )
     )
 
+    params.face_output = bpy.props.EnumProperty(
+        items       = [ ('BONES',      'Bones',      'The face ORG bones deform the face'),
+                        ('SHAPE_KEYS', 'Shape Keys', 'The face controls drive shape keys baked into the meshes, only the face root and the eyes deform') ],
+        name        = "Output",
+        default     = 'BONES',
+        description = "How the face controls deform the meshes"
+    )
+
+    # Feature groups to generate
+    for param, prefixes in FACE_FEATURES:
+        feature = param[len('face_'):]
+        setattr(params, param, bpy.props.BoolProperty(
+            name        = feature.capitalize(),
+            default     = True,
+            description = "Generate the controls, mechanism and deformation of the %s, otherwise their bones just follow the face without deforming (merge their weights into the face root)" % feature
+        ))
+
 
 def parameters_ui(layout, params):
     """ Create the ui for the rig parameters."""
@@ -1293,1185 +1359,23 @@ def parameters_ui(layout, params):
         for i in range(24,32):
             row.prop(params, layer, index=i, toggle=True, text="")
 
+    layout.row().prop(params, "face_output", expand=True)
 
-def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-head')
-    bone.head[:] = 0.0000, -0.0247, 0.0694
-    bone.tail[:] = 0.0000, -0.0247, 0.2677
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bones['ORG-head'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose')
-    bone.head[:] = 0.0000, -0.1576, 0.1913
-    bone.tail[:] = 0.0000, -0.1550, 0.1723
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-nose'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.T.L')
-    bone.head[:] = 0.0000, -0.1710, 0.1021
-    bone.tail[:] = 0.0195, -0.1656, 0.1027
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-lip.T.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.B.L')
-    bone.head[:] = 0.0000, -0.1667, 0.0859
-    bone.tail[:] = 0.0185, -0.1585, 0.0909
-    bone.roll = -0.0789
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-lip.B.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-jaw')
-    bone.head[:] = 0.0000, -0.0945, 0.0372
-    bone.tail[:] = 0.0000, -0.1519, 0.0273
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-jaw'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.L')
-    bone.head[:] = 0.0919, -0.0309, 0.1503
-    bone.tail[:] = 0.0989, -0.0295, 0.1898
-    bone.roll = -0.0324
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-ear.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.T.R')
-    bone.head[:] = 0.0000, -0.1710, 0.1021
-    bone.tail[:] = -0.0195, -0.1656, 0.1027
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-lip.T.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.B.R')
-    bone.head[:] = 0.0000, -0.1667, 0.0859
-    bone.tail[:] = -0.0185, -0.1585, 0.0909
-    bone.roll = 0.0789
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-lip.B.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.L')
-    bone.head[:] = 0.0791, -0.1237, 0.1927
-    bone.tail[:] = 0.0704, -0.1349, 0.1983
-    bone.roll = 0.0132
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-brow.B.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.L')
-    bone.head[:] = 0.0768, -0.1218, 0.1828
-    bone.tail[:] = 0.0678, -0.1356, 0.1876
-    bone.roll = -0.2079
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-lid.T.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.R')
-    bone.head[:] = -0.0791, -0.1237, 0.1927
-    bone.tail[:] = -0.0704, -0.1349, 0.1983
-    bone.roll = -0.0132
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-brow.B.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.R')
-    bone.head[:] = -0.0768, -0.1218, 0.1828
-    bone.tail[:] = -0.0678, -0.1356, 0.1876
-    bone.roll = 0.2079
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-lid.T.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-temple.L')
-    bone.head[:] = 0.0873, -0.0597, 0.2404
-    bone.tail[:] = 0.0881, -0.0611, 0.1569
-    bone.roll = -0.0312
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-temple.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-temple.R')
-    bone.head[:] = -0.0873, -0.0597, 0.2404
-    bone.tail[:] = -0.0881, -0.0611, 0.1569
-    bone.roll = 0.0312
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-temple.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-eye.L')
-    bone.head[:] = 0.0516, -0.1209, 0.1822
-    bone.tail[:] = 0.0516, -0.1451, 0.1822
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-eye.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-eye.R')
-    bone.head[:] = -0.0516, -0.1209, 0.1822
-    bone.tail[:] = -0.0516, -0.1451, 0.1822
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-eye.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.T.L')
-    bone.head[:] = 0.0848, -0.0940, 0.1751
-    bone.tail[:] = 0.0565, -0.1430, 0.1398
-    bone.roll = -0.0096
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-cheek.T.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.T.R')
-    bone.head[:] = -0.0848, -0.0940, 0.1751
-    bone.tail[:] = -0.0565, -0.1430, 0.1398
-    bone.roll = 0.0096
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-cheek.T.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tongue')
-    bone.head[:] = 0.0000, -0.1354, 0.0827
-    bone.tail[:] = 0.0000, -0.1101, 0.0883
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-tongue'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.R')
-    bone.head[:] = -0.0919, -0.0309, 0.1503
-    bone.tail[:] = -0.0989, -0.0295, 0.1898
-    bone.roll = 0.0324
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['ORG-head']]
-    bones['ORG-ear.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.001')
-    bone.head[:] = 0.0000, -0.1550, 0.1723
-    bone.tail[:] = 0.0000, -0.1965, 0.1331
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-nose']]
-    bones['ORG-nose.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.T.L.001')
-    bone.head[:] = 0.0195, -0.1656, 0.1027
-    bone.tail[:] = 0.0352, -0.1494, 0.0955
-    bone.roll = 0.0236
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lip.T.L']]
-    bones['ORG-lip.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.B.L.001')
-    bone.head[:] = 0.0185, -0.1585, 0.0909
-    bone.tail[:] = 0.0352, -0.1494, 0.0955
-    bone.roll = 0.0731
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lip.B.L']]
-    bones['ORG-lip.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-chin')
-    bone.head[:] = 0.0000, -0.1519, 0.0273
-    bone.tail[:] = 0.0000, -0.1634, 0.0573
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-jaw']]
-    bones['ORG-chin'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.L.001')
-    bone.head[:] = 0.0989, -0.0295, 0.1898
-    bone.tail[:] = 0.1200, -0.0026, 0.1955
-    bone.roll = 0.0656
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-ear.L']]
-    bones['ORG-ear.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.T.R.001')
-    bone.head[:] = -0.0195, -0.1656, 0.1027
-    bone.tail[:] = -0.0352, -0.1494, 0.0955
-    bone.roll = -0.0236
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lip.T.R']]
-    bones['ORG-lip.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lip.B.R.001')
-    bone.head[:] = -0.0185, -0.1585, 0.0909
-    bone.tail[:] = -0.0352, -0.1494, 0.0955
-    bone.roll = -0.0731
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lip.B.R']]
-    bones['ORG-lip.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.L.001')
-    bone.head[:] = 0.0704, -0.1349, 0.1983
-    bone.tail[:] = 0.0577, -0.1427, 0.2007
-    bone.roll = 0.1269
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.B.L']]
-    bones['ORG-brow.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.L.001')
-    bone.head[:] = 0.0678, -0.1356, 0.1876
-    bone.tail[:] = 0.0550, -0.1436, 0.1903
-    bone.roll = 0.1837
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.L']]
-    bones['ORG-lid.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.R.001')
-    bone.head[:] = -0.0704, -0.1349, 0.1983
-    bone.tail[:] = -0.0577, -0.1427, 0.2007
-    bone.roll = -0.1269
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.B.R']]
-    bones['ORG-brow.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.R.001')
-    bone.head[:] = -0.0678, -0.1356, 0.1876
-    bone.tail[:] = -0.0550, -0.1436, 0.1903
-    bone.roll = -0.1837
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.R']]
-    bones['ORG-lid.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-jaw.L')
-    bone.head[:] = 0.0881, -0.0611, 0.1569
-    bone.tail[:] = 0.0764, -0.0689, 0.0856
-    bone.roll = -0.1138
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-temple.L']]
-    bones['ORG-jaw.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-jaw.R')
-    bone.head[:] = -0.0881, -0.0611, 0.1569
-    bone.tail[:] = -0.0764, -0.0689, 0.0856
-    bone.roll = 0.1138
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-temple.R']]
-    bones['ORG-jaw.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.T.L.001')
-    bone.head[:] = 0.0565, -0.1430, 0.1398
-    bone.tail[:] = 0.0188, -0.1448, 0.1703
-    bone.roll = 0.1387
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.T.L']]
-    bones['ORG-cheek.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.T.R.001')
-    bone.head[:] = -0.0565, -0.1430, 0.1398
-    bone.tail[:] = -0.0188, -0.1448, 0.1703
-    bone.roll = -0.1387
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.T.R']]
-    bones['ORG-cheek.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-tongue.001')
-    bone.head[:] = 0.0000, -0.1101, 0.0883
-    bone.tail[:] = 0.0000, -0.0761, 0.0830
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-tongue']]
-    bones['ORG-tongue.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.R.001')
-    bone.head[:] = -0.0989, -0.0295, 0.1898
-    bone.tail[:] = -0.1200, -0.0026, 0.1955
-    bone.roll = -0.0656
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-ear.R']]
-    bones['ORG-ear.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.002')
-    bone.head[:] = 0.0000, -0.1965, 0.1331
-    bone.tail[:] = 0.0000, -0.1722, 0.1201
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-nose.001']]
-    bones['ORG-nose.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-chin.001')
-    bone.head[:] = 0.0000, -0.1634, 0.0573
-    bone.tail[:] = 0.0000, -0.1599, 0.0790
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-chin']]
-    bones['ORG-chin.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.L.002')
-    bone.head[:] = 0.1200, -0.0026, 0.1955
-    bone.tail[:] = 0.1044, -0.0190, 0.1427
-    bone.roll = 0.2876
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-ear.L.001']]
-    bones['ORG-ear.L.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.L.002')
-    bone.head[:] = 0.0577, -0.1427, 0.2007
-    bone.tail[:] = 0.0388, -0.1418, 0.1975
-    bone.roll = 0.0436
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.B.L.001']]
-    bones['ORG-brow.B.L.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.L.002')
-    bone.head[:] = 0.0550, -0.1436, 0.1903
-    bone.tail[:] = 0.0383, -0.1449, 0.1868
-    bone.roll = -0.0320
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.L.001']]
-    bones['ORG-lid.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.R.002')
-    bone.head[:] = -0.0577, -0.1427, 0.2007
-    bone.tail[:] = -0.0388, -0.1418, 0.1975
-    bone.roll = -0.0436
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.B.R.001']]
-    bones['ORG-brow.B.R.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.R.002')
-    bone.head[:] = -0.0550, -0.1436, 0.1903
-    bone.tail[:] = -0.0383, -0.1449, 0.1868
-    bone.roll = 0.0320
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.R.001']]
-    bones['ORG-lid.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-jaw.L.001')
-    bone.head[:] = 0.0764, -0.0689, 0.0856
-    bone.tail[:] = 0.0387, -0.1315, 0.0417
-    bone.roll = 0.0793
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-jaw.L']]
-    bones['ORG-jaw.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-jaw.R.001')
-    bone.head[:] = -0.0764, -0.0689, 0.0856
-    bone.tail[:] = -0.0387, -0.1315, 0.0417
-    bone.roll = -0.0793
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-jaw.R']]
-    bones['ORG-jaw.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.L')
-    bone.head[:] = 0.0188, -0.1448, 0.1703
-    bone.tail[:] = 0.0176, -0.1627, 0.1310
-    bone.roll = 0.0997
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.T.L.001']]
-    bones['ORG-nose.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.R')
-    bone.head[:] = -0.0188, -0.1448, 0.1703
-    bone.tail[:] = -0.0176, -0.1627, 0.1310
-    bone.roll = -0.0997
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.T.R.001']]
-    bones['ORG-nose.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-tongue.002')
-    bone.head[:] = 0.0000, -0.0761, 0.0830
-    bone.tail[:] = 0.0000, -0.0538, 0.0554
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-tongue.001']]
-    bones['ORG-tongue.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.R.002')
-    bone.head[:] = -0.1200, -0.0026, 0.1955
-    bone.tail[:] = -0.1044, -0.0190, 0.1427
-    bone.roll = -0.2876
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-ear.R.001']]
-    bones['ORG-ear.R.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.003')
-    bone.head[:] = 0.0000, -0.1722, 0.1201
-    bone.tail[:] = 0.0000, -0.1706, 0.1069
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-nose.002']]
-    bones['ORG-nose.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.L.003')
-    bone.head[:] = 0.1044, -0.0190, 0.1427
-    bone.tail[:] = 0.0919, -0.0309, 0.1503
-    bone.roll = 1.7681
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-ear.L.002']]
-    bones['ORG-ear.L.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.L.003')
-    bone.head[:] = 0.0388, -0.1418, 0.1975
-    bone.tail[:] = 0.0221, -0.1397, 0.1860
-    bone.roll = 0.1555
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.B.L.002']]
-    bones['ORG-brow.B.L.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.L.003')
-    bone.head[:] = 0.0383, -0.1449, 0.1868
-    bone.tail[:] = 0.0262, -0.1418, 0.1772
-    bone.roll = 0.0895
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.L.002']]
-    bones['ORG-lid.T.L.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.B.R.003')
-    bone.head[:] = -0.0388, -0.1418, 0.1975
-    bone.tail[:] = -0.0221, -0.1397, 0.1860
-    bone.roll = -0.1555
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.B.R.002']]
-    bones['ORG-brow.B.R.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.T.R.003')
-    bone.head[:] = -0.0383, -0.1449, 0.1868
-    bone.tail[:] = -0.0262, -0.1418, 0.1772
-    bone.roll = -0.0895
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.R.002']]
-    bones['ORG-lid.T.R.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-chin.L')
-    bone.head[:] = 0.0387, -0.1315, 0.0417
-    bone.tail[:] = 0.0352, -0.1494, 0.0955
-    bone.roll = -0.2078
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-jaw.L.001']]
-    bones['ORG-chin.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-chin.R')
-    bone.head[:] = -0.0387, -0.1315, 0.0417
-    bone.tail[:] = -0.0352, -0.1494, 0.0955
-    bone.roll = 0.2078
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-jaw.R.001']]
-    bones['ORG-chin.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.L.001')
-    bone.head[:] = 0.0176, -0.1627, 0.1310
-    bone.tail[:] = 0.0000, -0.1965, 0.1331
-    bone.roll = 0.1070
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-nose.L']]
-    bones['ORG-nose.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-nose.R.001')
-    bone.head[:] = -0.0176, -0.1627, 0.1310
-    bone.tail[:] = 0.0000, -0.1965, 0.1331
-    bone.roll = -0.1070
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-nose.R']]
-    bones['ORG-nose.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-ear.R.003')
-    bone.head[:] = -0.1044, -0.0190, 0.1427
-    bone.tail[:] = -0.0919, -0.0309, 0.1503
-    bone.roll = -1.7681
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-ear.R.002']]
-    bones['ORG-ear.R.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.L')
-    bone.head[:] = 0.0262, -0.1418, 0.1772
-    bone.tail[:] = 0.0393, -0.1425, 0.1735
-    bone.roll = 0.0756
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.L.003']]
-    bones['ORG-lid.B.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.R')
-    bone.head[:] = -0.0262, -0.1418, 0.1772
-    bone.tail[:] = -0.0393, -0.1425, 0.1735
-    bone.roll = -0.0756
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.T.R.003']]
-    bones['ORG-lid.B.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.B.L')
-    bone.head[:] = 0.0352, -0.1494, 0.0955
-    bone.tail[:] = 0.0736, -0.1216, 0.1124
-    bone.roll = 0.0015
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-chin.L']]
-    bones['ORG-cheek.B.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.B.R')
-    bone.head[:] = -0.0352, -0.1494, 0.0955
-    bone.tail[:] = -0.0736, -0.1216, 0.1124
-    bone.roll = -0.0015
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-chin.R']]
-    bones['ORG-cheek.B.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.L.001')
-    bone.head[:] = 0.0393, -0.1425, 0.1735
-    bone.tail[:] = 0.0553, -0.1418, 0.1714
-    bone.roll = 0.1015
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.B.L']]
-    bones['ORG-lid.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.R.001')
-    bone.head[:] = -0.0393, -0.1425, 0.1735
-    bone.tail[:] = -0.0553, -0.1418, 0.1714
-    bone.roll = -0.1015
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.B.R']]
-    bones['ORG-lid.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.B.L.001')
-    bone.head[:] = 0.0736, -0.1216, 0.1124
-    bone.tail[:] = 0.0848, -0.0940, 0.1751
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.B.L']]
-    bones['ORG-cheek.B.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-cheek.B.R.001')
-    bone.head[:] = -0.0736, -0.1216, 0.1124
-    bone.tail[:] = -0.0848, -0.0940, 0.1751
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.B.R']]
-    bones['ORG-cheek.B.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.L.002')
-    bone.head[:] = 0.0553, -0.1418, 0.1714
-    bone.tail[:] = 0.0694, -0.1351, 0.1770
-    bone.roll = -0.0748
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.B.L.001']]
-    bones['ORG-lid.B.L.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.R.002')
-    bone.head[:] = -0.0553, -0.1418, 0.1714
-    bone.tail[:] = -0.0694, -0.1351, 0.1770
-    bone.roll = 0.0748
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.B.R.001']]
-    bones['ORG-lid.B.R.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.L')
-    bone.head[:] = 0.0848, -0.0940, 0.1751
-    bone.tail[:] = 0.0830, -0.1213, 0.2045
-    bone.roll = 0.1990
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.B.L.001']]
-    bones['ORG-brow.T.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.R')
-    bone.head[:] = -0.0848, -0.0940, 0.1751
-    bone.tail[:] = -0.0830, -0.1213, 0.2045
-    bone.roll = -0.1990
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-cheek.B.R.001']]
-    bones['ORG-brow.T.R'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.L.003')
-    bone.head[:] = 0.0694, -0.1351, 0.1770
-    bone.tail[:] = 0.0768, -0.1218, 0.1828
-    bone.roll = -0.0085
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.B.L.002']]
-    bones['ORG-lid.B.L.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-lid.B.R.003')
-    bone.head[:] = -0.0694, -0.1351, 0.1770
-    bone.tail[:] = -0.0768, -0.1218, 0.1828
-    bone.roll = 0.0085
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-lid.B.R.002']]
-    bones['ORG-lid.B.R.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.L.001')
-    bone.head[:] = 0.0830, -0.1213, 0.2045
-    bone.tail[:] = 0.0588, -0.1450, 0.2164
-    bone.roll = 0.3974
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.T.L']]
-    bones['ORG-brow.T.L.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.R.001')
-    bone.head[:] = -0.0830, -0.1213, 0.2045
-    bone.tail[:] = -0.0588, -0.1450, 0.2164
-    bone.roll = -0.3974
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.T.R']]
-    bones['ORG-brow.T.R.001'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.L.002')
-    bone.head[:] = 0.0588, -0.1450, 0.2164
-    bone.tail[:] = 0.0215, -0.1586, 0.2062
-    bone.roll = 0.0995
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.T.L.001']]
-    bones['ORG-brow.T.L.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.R.002')
-    bone.head[:] = -0.0588, -0.1450, 0.2164
-    bone.tail[:] = -0.0215, -0.1586, 0.2062
-    bone.roll = -0.0995
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.T.R.001']]
-    bones['ORG-brow.T.R.002'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.L.003')
-    bone.head[:] = 0.0215, -0.1586, 0.2062
-    bone.tail[:] = 0.0000, -0.1576, 0.1913
-    bone.roll = 0.0065
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.T.L.002']]
-    bones['ORG-brow.T.L.003'] = bone.name
-    bone = arm.edit_bones.new('ORG-brow.T.R.003')
-    bone.head[:] = -0.0215, -0.1586, 0.2062
-    bone.tail[:] = 0.0000, -0.1576, 0.1913
-    bone.roll = -0.0065
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['ORG-brow.T.R.002']]
-    bones['ORG-brow.T.R.003'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-head']]
-    pbone.gamerig_type = 'face'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.secondary_layers = [False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-nose']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-jaw']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-temple.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-temple.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-eye.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-eye.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-tongue']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-chin']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lip.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-jaw.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-jaw.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-tongue.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-chin.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-jaw.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-jaw.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-tongue.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.B.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.T.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-chin.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-chin.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-nose.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-ear.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.B.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.B.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.B.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-cheek.B.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.R']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-lid.B.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.L.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.R.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.L.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.R.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.L.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-brow.T.R.003']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    layout.label(text="Features:")
+    col = layout.column(align=True)
+    row = col.row(align=True)
+    for i, (param, prefixes) in enumerate(FACE_FEATURES):
+        if i == 4:
+            row = col.row(align=True)
+        row.prop(params, param, toggle=True)
 
 
-def create_square_widget(rig, bone_name, size=1.0, bone_transform_name=None):
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj is not None:
-        verts = [
-            (  0.5 * size, 0 * size,  0.5 * size ),
-            ( -0.5 * size, 0 * size,  0.5 * size ),
-            (  0.5 * size, 0 * size, -0.5 * size ),
-            ( -0.5 * size, 0 * size, -0.5 * size ),
-        ]
+def create_sample(obj):
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
 
-        edges = [(0, 1), (2, 3), (0, 2), (3, 1) ]
-        faces = []
 
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
-        mesh.update()
-        return obj
-    else:
-        return None
+def create_square_widget(rig, bone_name, size=1.0, bone_transform_name=None):
+    queue_library_widget(rig, bone_name, 'square', size=size, bone_transform_name=bone_transform_name)
 
@@ -19,10 +19,13 @@
 # <pep8 compliant>
 
 import bpy
-from rna_prop_ui import rna_idprop_ui_prop_get
-from ..utils import copy_bone, basename
+from ..utils import copy_edit_bone, basename, generate_in_passes
+from ..builder import add_property, add_driver, recorded_property
+from ..metarig_data import load_sample
 from .widgets import create_bone_widget, create_circle_widget
 
+CLONEABLE = True
+
 class Rig:
     """ A "copy" rig.  All it does is duplicate the original bone and
         constrain it.
@@ -37,6 +40,10 @@ class Rig:
         self.basename            = basename(bone)
         self.params              = params
         self.control_widget_type = params.control_widget_type
+        self.physics_group       = params.physics_group.strip()
+
+        # Grouped instances share the switch of another control
+        self.cloneable = not self.physics_group
 
     def generate(self, context):
         """ Generate the rig.
@@ -44,19 +51,36 @@ class Rig:
             The main armature should be selected and active before this is called.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
+        return generate_in_passes([self]) or None
+
+    @classmethod
+    def generate_batch(cls, rigs, context):
+        """ Generate all the generic rigs of the armature at once,
+            with a single edit pass and a single pose pass.
+        """
+        return generate_in_passes(rigs)
+
+    def create_bones(self):
+        """ Edit mode part of the rig generation.
+        """
+        self.bone = None
 
         # Make a control bone (copy of original).
         if self.control_widget_type != 'None':
-            bone = copy_bone(self.obj, self.org_bone, self.basename)
-        
-        # Get edit bones
-        eb = self.obj.data.edit_bones
+            self.bone = copy_edit_bone(self.obj, self.org_bone, self.basename)
+            return [(self.org_bone, self.bone)]
+
+        return []
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+    def setup_pose(self):
+        """ Object mode part of the rig generation.
+        """
+        bone = self.bone
         pb = self.obj.pose.bones
+        rig_phy = bone is not None and 'Rig/Phy' in pb[bone]
+        grouped = False
 
-        if self.control_widget_type != 'None':
+        if bone is not None:
             stashed = self.stash_constraint()
 
             # Constrain the original bone.
@@ -68,32 +92,32 @@ class Rig:
             self.unstash_constraint(stashed)
 
             if len(pb[self.org_bone].constraints) > 1:
-                if not 'Rig/Phy' in pb[bone]:
-                    # Create Rig/Physics switch property
-                    pb[bone]['Rig/Phy'] = 0.0
-                    prop = rna_idprop_ui_prop_get( pb[bone], 'Rig/Phy', create=True )
-                    prop["min"]         = 0.0
-                    prop["max"]         = 1.0
-                    prop["soft_min"]    = 0.0
-                    prop["soft_max"]    = 1.0
-                    prop["description"] = 'Rig/Phy Switch'
-                
-                # Add driver to relevant constraint
-                drv = pb[self.org_bone].constraints[-1].driver_add("influence").driver
-                drv.type = 'AVERAGE'
-
-                var = drv.variables.new()
-                var.name = 'rig_phy_switch'
-                var.type = "SINGLE_PROP"
-                var.targets[0].id = self.obj
-                var.targets[0].data_path = pb[bone].path_from_id() + '["Rig/Phy"]'
-
-                drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-                drv_modifier.mode            = 'POLYNOMIAL'
-                drv_modifier.poly_order      = 1
-                drv_modifier.coefficients[0] = 0.0
-                drv_modifier.coefficients[1] = 1.0
+                if self.physics_group:
+                    self.switch_prop = 'Rig/Phy %s' % self.physics_group
+                    self.switch_bone = recorded_property(self.switch_prop)
+                    if self.switch_bone is None:
+                        # First control of the group holds the group switch
+                        add_property( self, bone, self.switch_prop, description='Rig/Phy Switch of %s' % self.physics_group )
+                        self.switch_bone = bone
+
+                    # Plain SUM of the shared switch, no modifier to evaluate
+                    add_driver(
+                        self, self.org_bone, pb[self.org_bone].constraints[-1].name, self.switch_bone, self.switch_prop,
+                        'rig_phy_switch', driver_type='SUM'
+                    )
+                    grouped = True
+
+                else:
+                    if not rig_phy:
+                        # Create Rig/Physics switch property
+                        add_property( self, bone, 'Rig/Phy', description='Rig/Phy Switch' )
+                        rig_phy = True
+
+                    # Add driver to relevant constraint
+                    add_driver(
+                        self, self.org_bone, pb[self.org_bone].constraints[-1].name, bone, 'Rig/Phy', 'rig_phy_switch',
+                        coefficients=(0.0, 1.0)
+                    )
 
             # Create control widget
             if self.control_widget_type == 'Circle':
@@ -101,7 +125,10 @@ class Rig:
             else:
                 create_bone_widget(self.obj, bone)
         
-        if self.control_widget_type != 'None' and 'Rig/Phy' in pb[bone]:
+        if grouped:
+            return [self.group_script(bone)]
+
+        if rig_phy:
             return ["""
 control = '%s'
 
@@ -111,6 +138,20 @@ if is_selected( control ):
 """ % bone]
     
 
+    def group_script(self, bone):
+        """ UI of the physics group switch, drawn once whichever controls of
+            the group are selected.
+        """
+        return """
+control = '%s'
+
+# Rig/Phy Switch of the physics group
+if is_selected( control ) and '%s' not in drawn_properties:
+    drawn_properties.add( '%s' )
+    layout.prop( pose_bones[ '%s' ], '["%s"]', text='Rig/Phy (%s)', slider = True )
+""" % (bone, self.switch_prop, self.switch_prop, self.switch_bone, self.switch_prop, self.physics_group)
+
+
     def stash_constraint( self ):
         pb = self.obj.pose.bones[self.org_bone]
         stashed = []
@@ -161,47 +202,23 @@ def add_parameters(params):
         items = [('None', 'None', ''), ('Frustum', 'Frustum', ''), ('Circle', 'Circle', '')]
     )
 
+    params.physics_group = bpy.props.StringProperty(
+        name        = "Physics Group",
+        default     = "",
+        description = "Generic bones of the same physics group share a single Rig/Phy switch"
+    )
+
 
 def parameters_ui(layout, params):
     """ Create the ui for the rig parameters.
     """
     r = layout.row()
     r.prop(params, "control_widget_type")
+    r = layout.row()
+    r.prop(params, "physics_group")
 
 
 def create_sample(obj):
     """ Create a sample metarig for this rig type.
     """
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('Bone')
-    bone.head[:] = 0.0000, 0.0000, 0.0000
-    bone.tail[:] = 0.0000, 0.0000, 0.2000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bones['Bone'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['Bone']]
-    pbone.gamerig_type = 'generic'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    load_sample(obj, __file__)
@@ -0,0 +1,222 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+from math import radians
+
+import bpy
+
+from ..utils import (
+    copy_edit_bone, basename, mch,
+    insert_before_first_period, generate_in_passes
+)
+from ..builder import add_constraint, add_property
+from ..metarig_data import load_sample
+from . import palm, finger, thumb
+
+CURL_ANGLE   = radians(90.0)  # Rotation of every finger joint at Curl 1.0
+SPREAD_ANGLE = radians(20.0)  # Rotation of the outer fingers at Spread 1.0
+
+
+class Rig:
+    """ A hand rig. Rigs the palm bones (the rig bone and its siblings) and the
+        digit chains starting on them in shared edit and pose passes, with the
+        controls of the palm, finger and thumb rigs. Digit chains whose name
+        starts with the Thumb Prefix parameter ("thumb") get the thumb rig.
+        Optional Curl and Spread properties of the palm control drive all the
+        fingers of the hand.
+        Digits typed with their own rig type are left to that rig.
+    """
+    def __init__(self, obj, bone, params):
+        """ Gather and validate data about the rig.
+        """
+        self.obj         = obj
+        self.params      = params
+        self.hand_props  = params.hand_curl_spread
+        self.palm        = palm.Rig(obj, bone, params, palm.sorted_siblings(obj, bone))
+
+        thumb_prefix = params.hand_thumb_prefix.strip()
+
+        eb = obj.data.edit_bones
+        pb = obj.pose.bones
+
+        self.fingers = []
+        self.thumbs  = []
+        for palm_bone in self.palm.org_bones:
+            for child in eb[palm_bone].children:
+                if pb[child.name].gamerig_type:
+                    continue
+                if thumb_prefix and basename(child.name).startswith(thumb_prefix):
+                    self.thumbs.append(thumb.Rig(obj, child.name, params))
+                else:
+                    self.fingers.append(finger.Rig(obj, child.name, params))
+
+    def generate(self, context):
+        """ Generate the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+            The main armature should be selected and active before this is called.
+
+        """
+        return generate_in_passes([self]) or None
+
+    def create_bones(self):
+        """ Edit mode part of the rig generation.
+        """
+        copies = []
+        for rig in [self.palm] + self.fingers + self.thumbs:
+            copies += rig.create_bones()
+
+        self.curl = self.spread = None
+        if self.hand_props:
+            ctrl = self.palm.ctrl
+            self.curl   = copy_edit_bone(self.obj, ctrl, mch(insert_before_first_period(ctrl, '_curl')))
+            self.spread = copy_edit_bone(self.obj, ctrl, mch(insert_before_first_period(ctrl, '_spread')))
+            copies += [(ctrl, self.curl), (ctrl, self.spread)]
+
+        return copies
+
+    def setup_pose(self):
+        """ Object mode part of the rig generation.
+        """
+        scripts = []
+        for rig in [self.palm] + self.fingers + self.thumbs:
+            scripts += rig.setup_pose() or []
+
+        if self.hand_props:
+            scripts += self.setup_curl_spread()
+
+        return scripts
+
+    def setup_curl_spread(self):
+        """ Curl and Spread properties, each driving a single mechanism bone
+            whose rotation all the fingers add to their own.
+        """
+        pb   = self.obj.pose.bones
+        ctrl = self.palm.ctrl
+
+        curl_axis   = self.params.primary_rotation_axis
+        spread_axis = 'Z' if curl_axis == 'X' else 'X'
+
+        for name in (self.curl, self.spread):
+            pb[name].rotation_mode = 'XYZ'
+
+        # Every joint curls, the thumb metacarpal excepted
+        chains = [rig.mch_chain for rig in self.fingers] + [rig.mch_chain[1:] for rig in self.thumbs]
+        for chain in chains:
+            for bone in chain:
+                add_constraint(self, bone, {
+                    'constraint'   : 'COPY_ROTATION',
+                    'name'         : 'curl',
+                    'subtarget'    : self.curl,
+                    'use_x'        : curl_axis == 'X',
+                    'use_y'        : curl_axis == 'Y',
+                    'use_z'        : curl_axis == 'Z',
+                    'mix_mode'     : 'ADD',
+                    'use_offset'   : True,
+                    'target_space' : 'LOCAL',
+                    'owner_space'  : 'LOCAL',
+                })
+
+        # Fingers fan out from the middle of the palm
+        count = len(self.fingers)
+        for i, rig in enumerate(self.fingers):
+            factor = 1.0 - 2.0 * i / (count - 1) if count > 1 else 0.0
+            if factor == 0.0:
+                continue
+            add_constraint(self, rig.mch_chain[0], {
+                'constraint'             : 'COPY_ROTATION',
+                'name'                   : 'spread',
+                'subtarget'              : self.spread,
+                'use_x'                  : spread_axis == 'X',
+                'use_y'                  : False,
+                'use_z'                  : spread_axis == 'Z',
+                'invert_' + spread_axis.lower() : factor < 0.0,
+                'mix_mode'               : 'ADD',
+                'use_offset'             : True,
+                'target_space'           : 'LOCAL',
+                'owner_space'            : 'LOCAL',
+                'influence'              : abs(factor),
+            })
+
+        add_property(self, ctrl, 'Curl',   0.0, minimum=-0.25, maximum=1.0)
+        add_property(self, ctrl, 'Spread', 0.0, minimum=-1.0,  maximum=1.0)
+
+        for name, prop, axis, angle in (
+            (self.curl,   'Curl',   curl_axis,   CURL_ANGLE),
+            (self.spread, 'Spread', spread_axis, SPREAD_ANGLE),
+        ):
+            fcurve = pb[name].driver_add('rotation_euler', 'XYZ'.index(axis))
+            drv = fcurve.driver
+            drv.type = 'SCRIPTED'
+            drv.expression = '%s * %f' % (prop.lower(), angle)
+
+            var = drv.variables.new()
+            var.name = prop.lower()
+            var.type = 'SINGLE_PROP'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = pb[ctrl].path_from_id() + '["%s"]' % prop
+
+        controls = [ctrl] \
+            + [rig.master_name for rig in self.fingers + self.thumbs] \
+            + [bone for rig in self.fingers + self.thumbs for bone in rig.ctrl_chain]
+
+        return ["""
+controls = %s
+hand     = '%s'
+if is_selected( controls ):
+    layout.prop( pose_bones[ hand ], '["Curl"]', text='Curl (' + hand + ')', slider = True )
+    layout.prop( pose_bones[ hand ], '["Spread"]', text='Spread (' + hand + ')', slider = True )
+""" % (controls, ctrl)]
+
+
+def add_parameters(params):
+    """ Add the parameters of this rig type to the
+        GameRigParameters PropertyGroup
+    """
+    params.hand_curl_spread = bpy.props.BoolProperty(
+        name        = "Curl and Spread",
+        default     = True,
+        description = "Add Curl and Spread properties driving all the fingers of the hand"
+    )
+    params.hand_thumb_prefix = bpy.props.StringProperty(
+        name        = "Thumb Prefix",
+        default     = "thumb",
+        description = "Digit chains whose first bone name starts with this get the thumb rig, the others the finger rig"
+    )
+
+
+def parameters_ui(layout, params):
+    """ Create the ui for the rig parameters.
+    """
+    r = layout.row()
+    r.label(text="Primary rotation axis:")
+    r.prop(params, "palm_rotation_axis", text="")
+    r = layout.row()
+    r.label(text="Bend rotation axis:")
+    r.prop(params, "primary_rotation_axis", text="")
+    r = layout.row()
+    r.prop(params, "hand_curl_spread")
+    r = layout.row()
+    r.prop(params, "hand_thumb_prefix")
+
+
+def create_sample(obj):
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -20,9 +20,12 @@
 import bpy
 from rna_prop_ui import rna_idprop_ui_prop_get
 from ...utils import MetarigError, copy_bone
+from ...metarig_data import load_sample
 from ..widgets import create_hand_widget
 from .limb import *
 
+CLONEABLE = True
+
 class Rig(Limb):
 
     def __init__(self, obj, bone_name, params):
@@ -85,24 +88,10 @@ if is_selected( fk_ctrl ):
         mch_ik_socket = self.make_ik_follow_bone(eb, ctrl)
 
         # Set up constraints
-        # Constrain mch target bone to the ik control and mch stretch
-
-        self.make_constraint(bones['ik']['mch_target'], {
-            'constraint'  : 'COPY_LOCATION',
-            'subtarget'   : bones['ik']['mch_str'],
-            'head_tail'   : 1.0
-        })
-
-        # Constrain mch ik stretch bone to the ik control
-        self.make_constraint(bones['ik']['mch_str'], {
-            'constraint'  : 'DAMPED_TRACK',
-            'subtarget'   : ctrl,
-        })
-        self.make_constraint(bones['ik']['mch_str'], {
-            'constraint'  : 'STRETCH_TO',
-            'subtarget'   : ctrl,
-        })
+        # Constrain mch target bone to the ik control
+        self.setup_ik_target(bones, ctrl)
 
+        bpy.ops.object.mode_set(mode='OBJECT')
         pb = self.obj.pose.bones
 
         # Modify rotation mode for ik and tweak controls
@@ -248,79 +237,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-upper_arm.L')
-    bone.head[:] = 0.0000, 0.0000, 0.0000
-    bone.tail[:] = 0.2588, 0.0148, 0.0000
-    bone.roll = 1.5232
-    bone.use_connect = False
-    bone.use_deform = True
-    bones['ORG-upper_arm.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-forearm.L')
-    bone.head[:] = 0.2588, 0.0148, 0.0000
-    bone.tail[:] = 0.4940, 0.0000, 0.0000
-    bone.roll = 1.5232
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-upper_arm.L']]
-    bones['ORG-forearm.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-hand.L')
-    bone.head[:] = 0.4940, 0.0000, 0.0000
-    bone.tail[:] = 0.5657, 0.0000, 0.0000
-    bone.roll = -3.1196
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forearm.L']]
-    bones['ORG-hand.L'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-upper_arm.L']]
-    pbone.gamerig_type = 'limbs.arm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-forearm.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-hand.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -20,9 +20,13 @@
 import bpy, math
 from rna_prop_ui import rna_idprop_ui_prop_get
 from ...utils import MetarigError, connected_children_names, new_bone, copy_bone, put_bone, flip_bone
+from ...builder import add_driver
+from ...metarig_data import load_sample
 from ..widgets import create_foot_widget, create_ballsocket_widget, create_toe_widget
 from .limb import *
 
+CLONEABLE = True
+
 class Rig(Limb):
 
     def __init__(self, obj, bone_name, params):
@@ -189,6 +193,7 @@ if is_selected( fk_ctrl ):
             'owner_space' : 'LOCAL'
         })
 
+        bpy.ops.object.mode_set(mode='OBJECT')
         pb = self.obj.pose.bones
         for i,b in enumerate([ rock1_mch, rock2_mch ]):
             head_tail = pb[b].head - pb[self.footprint_bone].head
@@ -225,25 +230,8 @@ if is_selected( fk_ctrl ):
             })
 
         # Set up constraints
-        # Constrain mch target bone to the ik control and mch stretch
-
-        self.make_constraint(bones['ik']['mch_target'], {
-            'constraint'  : 'COPY_LOCATION',
-            'subtarget'   : bones['ik']['mch_str'],
-            'head_tail'   : 1.0
-        })
-
-        # Constrain mch ik stretch bone to the ik control
-        self.make_constraint(bones['ik']['mch_str'], {
-            'constraint'  : 'DAMPED_TRACK',
-            'subtarget'   : roll1_mch,
-            'head_tail'   : 1.0
-        })
-        self.make_constraint(bones['ik']['mch_str'], {
-            'constraint'  : 'STRETCH_TO',
-            'subtarget'   : roll1_mch,
-            'head_tail'   : 1.0
-        })
+        # Constrain mch target bone to the ik control
+        self.setup_ik_target(bones, roll1_mch, 1.0)
 
         # Modify rotation mode for ik and tweak controls
         pb[bones['ik']['ctrl']['limb']].rotation_mode = 'ZXY'
@@ -279,7 +267,7 @@ if is_selected( fk_ctrl ):
             eb[ toeik ].parent      = eb[ roll2_mch ]
 
             # Constrain toeik
-            self.make_constraint(org_bones[3], {
+            con = self.make_constraint(org_bones[3], {
                 'constraint'  : 'COPY_TRANSFORMS',
                 'subtarget'   : toeik
             })
@@ -291,29 +279,15 @@ if is_selected( fk_ctrl ):
                 'head_tail'   : 0.0
             })
 
+            bpy.ops.object.mode_set(mode='OBJECT')
             pb   = self.obj.pose.bones
             #pb[ toeik ].lock_location = True, True, True
 
-            # Find IK/FK switch property
-            prop = rna_idprop_ui_prop_get( pb_master, 'IK/FK' )
-
-            # Add driver to limit scale constraint influence
-            b        = org_bones[3]
-            drv      = pb[b].constraints[-1].driver_add("influence").driver
-            drv.type = 'SUM'
-
-            var = drv.variables.new()
-            var.name = 'ik_fk_switch'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb_master.path_from_id() + '['+ '"' + prop.name + '"' + ']'
-
-            drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-            drv_modifier.mode            = 'POLYNOMIAL'
-            drv_modifier.poly_order      = 1
-            drv_modifier.coefficients[0] = 1.0
-            drv_modifier.coefficients[1] = -1.0
+            # Add driver to the toe constraint influence
+            add_driver(
+                self, org_bones[3], con, pb_master.name, 'IK/FK', 'ik_fk_switch',
+                driver_type='SUM', coefficients=(1.0, -1.0)
+            )
 
             # Create toe circle widget
             create_toe_widget(self.obj, toeik)
@@ -486,113 +460,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-thigh.L')
-    bone.head[:] = 0.0000, -0.0039, 0.9470
-    bone.tail[:] = 0.0000, -0.0310, 0.4738
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bones['ORG-thigh.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-shin.L')
-    bone.head[:] = 0.0000, -0.0310, 0.4738
-    bone.tail[:] = 0.0000, 0.0145, 0.0747
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-thigh.L']]
-    bones['ORG-shin.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-foot.L')
-    bone.head[:] = 0.0000, 0.0145, 0.0747
-    bone.tail[:] = 0.0000, -0.0836, 0.0148
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-shin.L']]
-    bones['ORG-foot.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-toe.L')
-    bone.head[:] = 0.0000, -0.0836, 0.0148
-    bone.tail[:] = 0.0000, -0.1437, 0.0143
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-foot.L']]
-    bones['ORG-toe.L'] = bone.name
-    bone = arm.edit_bones.new('JIG-heel.L')
-    bone.head[:] = -0.0363, 0.0411, 0.0000
-    bone.tail[:] = 0.0363, 0.0411, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = False
-    bone.parent = arm.edit_bones[bones['ORG-foot.L']]
-    bones['JIG-heel.L'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-thigh.L']]
-    pbone.gamerig_type = 'limbs.leg'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = True
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-heel.L"
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-shin.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-foot.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-toe.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['JIG-heel.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -1,13 +1,12 @@
 import bpy, itertools
-from rna_prop_ui import rna_idprop_ui_prop_get
 from math import trunc
 from mathutils import Vector
 from ...utils import (
     copy_bone, org, mch, basename, insert_before_first_period,
     connected_children_names, find_root_bone,
-    create_widget,
-    MetarigError
+    create_widget, MetarigError
 )
+from ...builder import add_constraint, add_property, add_driver
 from ..widgets import create_sphere_widget, create_limb_widget, create_ikarrow_widget, create_directed_circle_widget
 
 class Limb:
@@ -19,6 +18,7 @@ class Limb:
 
         self.rot_axis  = params.rotation_axis
         self.allow_ik_stretch = params.allow_ik_stretch
+        self.lean = params.lean_limb
 
         # Assign values to FK layers props if opted by user
         if params.fk_extra_layers:
@@ -28,6 +28,9 @@ class Limb:
         
         self.root_bone = find_root_bone(obj, bone_name)
 
+        # The lean limb has no IK Follow, the IK control just follows the root
+        self.ik_follow = self.root_bone if not self.lean else None
+
 
     def create_parent( self ):
         org_bones = self.org_bones
@@ -91,21 +94,24 @@ class Limb:
             if org_bones.index(o) == len( org_bones ) - 1:
                 eb[ bone ].length /= 4
 
-        # Create MCH Stretch
-        mch_str = copy_bone(
-            self.obj,
-            org_bones[0],
-            get_bone_name( org_bones[0], 'mch', 'ik_stretch' )
-        )
+        # Create MCH Stretch, which the lean limb without IK stretch does without
+        mch_str = None
+        if not self.lean or self.allow_ik_stretch:
+            mch_str = copy_bone(
+                self.obj,
+                org_bones[0],
+                get_bone_name( org_bones[0], 'mch', 'ik_stretch' )
+            )
+
+            if self.limb_type == 'arm':
+                eb[ mch_str ].tail = eb[ org_bones[-1] ].head
+            else:
+                eb[ mch_str ].tail = eb[ org_bones[-2] ].head
 
-        if self.limb_type == 'arm':
-            eb[ mch_str ].tail = eb[ org_bones[-1] ].head
-        else:
-            eb[ mch_str ].tail = eb[ org_bones[-2] ].head
+            eb[ mch_str ].parent = eb[ parent ]
 
         # Parenting
         eb[ ctrl    ].parent = eb[ parent ]
-        eb[ mch_str ].parent = eb[ parent ]
         eb[ mch_ik  ].parent = eb[ ctrl   ]
         
         self.make_constraint( mch_ik, {
@@ -115,6 +121,7 @@ class Limb:
             'use_stretch' : self.allow_ik_stretch,
         })
 
+        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
         pb[ mch_ik ].ik_stretch = 0.1
         pb[ ctrl   ].ik_stretch = 0.1
@@ -187,10 +194,9 @@ class Limb:
                 'constraint'  : 'COPY_SCALE',
                 'subtarget'   : self.root_bone
             })
-        else:
-            bpy.ops.object.mode_set(mode ='OBJECT')
 
         # Locks and widgets
+        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
         pb[ ctrls[2] ].lock_location = True, True, True
         pb[ ctrls[2] ].lock_scale = True, True, True
@@ -225,32 +231,11 @@ class Limb:
         pb = self.obj.pose.bones
 
         # Limb Follow Driver
-        pb[fk[0]]['FK Limb Follow'] = 0.0
-        prop = rna_idprop_ui_prop_get( pb[fk[0]], 'FK Limb Follow', create = True )
-
-        prop["min"]         = 0.0
-        prop["max"]         = 1.0
-        prop["soft_min"]    = 0.0
-        prop["soft_max"]    = 1.0
-        prop["description"] = 'FK Limb Follow'
-
-        drv = pb[ parent ].constraints[ 0 ].driver_add("influence").driver
-
-        drv.type = 'AVERAGE'
-        var = drv.variables.new()
-        var.name = 'fk_limb_follow'
-        var.type = "SINGLE_PROP"
-        var.targets[0].id = self.obj
-        var.targets[0].data_path = pb[fk[0]].path_from_id() + '[' + '"' + prop.name + '"' + ']'
+        add_property( self, fk[0], 'FK Limb Follow' )
+        add_driver( self, parent, 0, fk[0], 'FK Limb Follow', 'fk_limb_follow' )
 
         # Create IK/FK switch property
-        pb[fk[0]]['IK/FK']  = 0.0
-        prop = rna_idprop_ui_prop_get( pb[fk[0]], 'IK/FK', create=True )
-        prop["min"]         = 0.0
-        prop["max"]         = 1.0
-        prop["soft_min"]    = 0.0
-        prop["soft_max"]    = 1.0
-        prop["description"] = 'IK/FK Switch'
+        add_property( self, fk[0], 'IK/FK', description='IK/FK Switch' )
 
         # Constrain org to IK and FK bones
         iks =  [ ik['ctrl']['limb'] ]
@@ -262,24 +247,19 @@ class Limb:
                     'constraint'  : 'COPY_TRANSFORMS',
                     'subtarget'   : i
                 })
-            self.make_constraint(o, {
+            con = self.make_constraint(o, {
                 'constraint'  : 'COPY_TRANSFORMS',
                 'subtarget'   : f
             })
 
             # Add driver to relevant constraint
-            drv = pb[o].constraints[-1].driver_add("influence").driver
-            drv.type = 'AVERAGE'
-
-            var = drv.variables.new()
-            var.name = 'ik_fk_switch'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[fk[0]].path_from_id() + '['+ '"' + prop.name + '"' + ']'
+            add_driver( self, o, con, fk[0], 'IK/FK', 'ik_fk_switch' )
 
-            self.make_constraint(o, {
-                'constraint'  : 'MAINTAIN_VOLUME'
-            })
+            if not self.lean:
+                self.make_constraint(o, {
+                    'constraint'        : 'MAINTAIN_VOLUME',
+                    'playback_optional' : True
+                })
 
 
     def generate(self, create_terminal, script_template):
@@ -322,68 +302,68 @@ class Limb:
 
 
     def make_constraint( self, bone, constraint ):
-        bpy.ops.object.mode_set(mode = 'OBJECT')
-        pb = self.obj.pose.bones
+        """ Records the constraint, created by the generator after all the rigs.
+            Returns the record, to reference the constraint in add_driver().
+        """
+        return add_constraint( self, bone, constraint )
 
-        owner_pb = pb[bone]
-        const    = owner_pb.constraints.new( constraint['constraint'] )
 
-        constraint['target'] = self.obj
+    def setup_ik_target(self, bones, target, head_tail=0.0):
+        """ Constrains the mch ik target to the target through the mch stretch bone,
+            which the lean limb without IK stretch does without.
+        """
+        if self.lean and not self.allow_ik_stretch:
+            self.make_constraint(bones['ik']['mch_target'], {
+                'constraint'  : 'COPY_LOCATION',
+                'subtarget'   : target,
+                'head_tail'   : head_tail
+            })
+            return
 
-        # filter contraint props to those that actually exist in the currnet
-        # type of constraint, then assign values to each
-        for p in [ k for k in constraint.keys() if k in dir(const) ]:
-            if p in dir( const ):
-                setattr( const, p, constraint[p] )
-            else:
-                raise MetarigError(
-                    "GAMERIG ERROR: property %s does not exist in %s constraint" % (
-                        p, constraint['constraint']
-                ))
+        self.make_constraint(bones['ik']['mch_target'], {
+            'constraint'  : 'COPY_LOCATION',
+            'subtarget'   : bones['ik']['mch_str'],
+            'head_tail'   : 1.0
+        })
+
+        # Constrain mch ik stretch bone to the target
+        self.make_constraint(bones['ik']['mch_str'], {
+            'constraint'  : 'DAMPED_TRACK',
+            'subtarget'   : target,
+            'head_tail'   : head_tail
+        })
+        self.make_constraint(bones['ik']['mch_str'], {
+            'constraint'  : 'STRETCH_TO',
+            'subtarget'   : target,
+            'head_tail'   : head_tail
+        })
 
 
     def setup_ik_stretch(self, bones, pb, pb_master):
         if self.allow_ik_stretch:
-            self.make_constraint(bones['ik']['mch_str'], {
-                'constraint'  : 'LIMIT_SCALE',
-                'use_min_y'   : True,
-                'use_max_y'   : True,
-                'max_y'       : 1.05,
-                'owner_space' : 'LOCAL'
+            con = self.make_constraint(bones['ik']['mch_str'], {
+                'constraint'        : 'LIMIT_SCALE',
+                'use_min_y'         : True,
+                'use_max_y'         : True,
+                'max_y'             : 1.05,
+                'owner_space'       : 'LOCAL',
+                'playback_optional' : True
             })
             
             # Create ik stretch property
-            pb_master['IK Stretch'] = 1.0
-            prop = rna_idprop_ui_prop_get( pb_master, 'IK Stretch', create=True )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = 'IK Stretch'
+            add_property( self, pb_master.name, 'IK Stretch', 1.0 )
 
             # Add driver to limit scale constraint influence
-            b        = bones['ik']['mch_str']
-            drv      = pb[b].constraints[-1].driver_add("influence").driver
-            drv.type = 'AVERAGE'
-
-            var = drv.variables.new()
-            var.name = 'ik_stretch'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb_master.path_from_id() + '['+ '"' + prop.name + '"' + ']'
-
-            drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-            drv_modifier.mode            = 'POLYNOMIAL'
-            drv_modifier.poly_order      = 1
-            drv_modifier.coefficients[0] = 1.0
-            drv_modifier.coefficients[1] = -1.0
+            add_driver(
+                self, bones['ik']['mch_str'], con, pb_master.name, 'IK Stretch', 'ik_stretch',
+                coefficients=(1.0, -1.0)
+            )
 
 
     def make_ik_follow_bone(self, eb, ctrl):
         """ add IK Follow feature
         """
-        if self.root_bone:
+        if self.ik_follow:
             mch_ik_socket = copy_bone( self.obj, self.root_bone, mch('socket_' + ctrl) )
             eb[ mch_ik_socket ].length /= 4
             eb[ mch_ik_socket ].use_connect = False
@@ -395,30 +375,16 @@ class Limb:
     def setup_ik_follow(self, pb, pb_master, mch_ik_socket):
         """ Add IK Follow constrain and property and driver
         """
-        if self.root_bone:
-            self.make_constraint(mch_ik_socket, {
+        if self.ik_follow:
+            con = self.make_constraint(mch_ik_socket, {
                 'constraint'   : 'COPY_TRANSFORMS',
                 'subtarget'    : self.root_bone,
                 'target_space' : 'WORLD',
                 'owner_space'  : 'WORLD',
             })
 
-            pb_master['IK Follow'] = 1.0
-            prop = rna_idprop_ui_prop_get( pb_master, 'IK Follow', create=True )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = 'IK Follow'
-
-            drv      = pb[mch_ik_socket].constraints[-1].driver_add("influence").driver
-            drv.type = 'SUM'
-
-            var = drv.variables.new()
-            var.name = 'ik_follow'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb_master.path_from_id() + '['+ '"' + prop.name + '"' + ']'
+            add_property( self, pb_master.name, 'IK Follow', 1.0 )
+            add_driver( self, mch_ik_socket, con, pb_master.name, 'IK Follow', 'ik_follow', driver_type='SUM' )
 
 
     def create_script(self, bones, script_template):
@@ -445,7 +411,7 @@ class Limb:
             bones['fk']['ctrl'][0]
         )
 
-        if self.allow_ik_stretch or self.root_bone:
+        if self.allow_ik_stretch or self.ik_follow:
             code += """
 if is_selected( ik_ctrl ):
 """
@@ -454,7 +420,7 @@ if is_selected( ik_ctrl ):
     # IK Stretch on IK Control bone
     layout.prop( pose_bones[ parent ], '["IK Stretch"]', text = 'IK Stretch (%s)', slider = True )
 """ % bones['fk']['ctrl'][0]
-            if self.root_bone:
+            if self.ik_follow:
                 code += """
     # IK Follow on IK Control bone
     layout.prop( pose_bones[ parent ], '["IK Follow"]', text = 'IK Follow (%s)', slider = True )
@@ -483,6 +449,12 @@ if is_selected( ik_ctrl ):
             description = "Allow IK Stretch"
         )
 
+        params.lean_limb = bpy.props.BoolProperty(
+            name        = "Lean",
+            default     = False,
+            description = "Minimal constraint stack for game runtime: no volume preservation, no IK Follow, and no stretch mechanism without IK stretch"
+        )
+
         # Setting up extra layers for the FK
         params.fk_extra_layers = bpy.props.BoolProperty(
             name        = "FK Extra Layers",
@@ -506,6 +478,9 @@ if is_selected( ik_ctrl ):
         r = layout.row()
         r.prop(params, "allow_ik_stretch")
 
+        r = layout.row()
+        r.prop(params, "lean_limb")
+
         r = layout.row()
         r.prop(params, "fk_extra_layers")
         r.active = params.fk_extra_layers
@@ -24,9 +24,13 @@ from ...utils import (
     flip_bone, copy_bone,
     MetarigError
 )
+from ...builder import add_driver
+from ...metarig_data import load_sample
 from ..widgets import create_paw_widget, create_ballsocket_widget, create_toe_widget
 from .limb import *
 
+CLONEABLE = True
+
 class Rig(Limb):
 
     def __init__(self, obj, bone_name, params):
@@ -119,26 +123,10 @@ if is_selected( fk_ctrl ):
         mch_ik_socket = self.make_ik_follow_bone( eb, ctrl )
 
         # Set up constraints
-        # Constrain mch target bone to the ik control and mch stretch
-
-        self.make_constraint(bones['ik']['mch_target'], {
-            'constraint'  : 'COPY_LOCATION',
-            'subtarget'   : bones['ik']['mch_str'],
-            'head_tail'   : 1.0
-        })
-
-        # Constrain mch ik stretch bone to the ik control
-        self.make_constraint( bones['ik']['mch_str'], {
-            'constraint'  : 'DAMPED_TRACK',
-            'subtarget'   : heel,
-            'head_tail'   : 1.0
-        })
-        self.make_constraint( bones['ik']['mch_str'], {
-            'constraint'  : 'STRETCH_TO',
-            'subtarget'   : heel,
-            'head_tail'   : 1.0
-        })
+        # Constrain mch target bone to the ik control
+        self.setup_ik_target(bones, heel, 1.0)
 
+        bpy.ops.object.mode_set(mode='OBJECT')
         pb = self.obj.pose.bones
 
         # Modify rotation mode for ik and tweak controls
@@ -173,32 +161,16 @@ if is_selected( fk_ctrl ):
             eb[ toes_mch ].parent      = eb[ ctrl ]
 
             # Constrain toe bone to toes_mch
-            self.make_constraint(org_bones[3], {
+            con = self.make_constraint(org_bones[3], {
                 'constraint'  : 'COPY_TRANSFORMS',
                 'subtarget'   : toes_mch
             })
 
-            # Find IK/FK switch property
-            pb   = self.obj.pose.bones
-            prop = rna_idprop_ui_prop_get( pb_master, 'IK/FK' )
-
-            # Add driver to limit scale constraint influence
-            b        = org_bones[3]
-            drv      = pb[b].constraints[-1].driver_add("influence").driver
-            drv.type = 'AVERAGE'
-
-            var = drv.variables.new()
-            var.name = 'ik_fk_switch'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb_master.path_from_id() + '['+ '"' + prop.name + '"' + ']'
-
-            drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-            drv_modifier.mode            = 'POLYNOMIAL'
-            drv_modifier.poly_order      = 1
-            drv_modifier.coefficients[0] = 1.0
-            drv_modifier.coefficients[1] = -1.0
+            # Add driver to the toe constraint influence
+            add_driver(
+                self, org_bones[3], con, pb_master.name, 'IK/FK', 'ik_fk_switch',
+                coefficients=(1.0, -1.0)
+            )
 
         bones['ik']['ctrl']['terminal'] += [ heel, toes_mch, ctrl ]
 
@@ -298,113 +270,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-forelimb.01.L')
-    bone.head[:] = 0.0000, 0.0000, 0.6649
-    bone.tail[:] = -0.0000, 0.0572, 0.3784
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bones['ORG-forelimb.01.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-forelimb.02.L')
-    bone.head[:] = -0.0000, 0.0572, 0.3784
-    bone.tail[:] = -0.0000, 0.0000, 0.1024
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forelimb.01.L']]
-    bones['ORG-forelimb.02.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-forelimb.03.L')
-    bone.head[:] = -0.0000, 0.0000, 0.1024
-    bone.tail[:] = -0.0000, -0.0507, 0.0492
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forelimb.02.L']]
-    bones['ORG-forelimb.03.L'] = bone.name
-    bone = arm.edit_bones.new('ORG-forepaw.L')
-    bone.head[:] = -0.0000, -0.0507, 0.0492
-    bone.tail[:] = 0.0000, -0.1405, 0.0227
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forelimb.03.L']]
-    bones['ORG-forepaw.L'] = bone.name
-    bone = arm.edit_bones.new('JIG-forepawstamp.L')
-    bone.head[:] = -0.0400, -0.0526, 0.0000
-    bone.tail[:] = 0.0400, -0.0526, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-forelimb.03.L']]
-    bones['JIG-forepawstamp.L'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-forelimb.01.L']]
-    pbone.gamerig_type = 'limbs.paw'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.fk_layers = [False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.allow_ik_stretch = True
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.footprint_bone = "JIG-forepawstamp.L"
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-forelimb.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-forelimb.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-forepaw.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['JIG-forepawstamp.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -23,7 +23,8 @@ from math import cos, pi
 
 import bpy
 
-from ..utils import MetarigError, copy_bone, basename
+from ..utils import MetarigError, copy_edit_bone, basename, generate_in_passes
+from ..metarig_data import load_sample
 from .widgets import create_palm_widget
 
 def bone_siblings(obj, bone):
@@ -45,12 +46,14 @@ def bone_siblings(obj, bone):
     return bones
 
 
-def bone_distance(obj, bone1, bone2):
-    """ Returns the distance between two bones.
+def sorted_siblings(obj, bone):
+    """ Returns the siblings of the given bone sorted by distance, then by
+        name, the distance of each sibling being computed once.
 
     """
-    vec = obj.data.bones[bone1].head - obj.data.bones[bone2].head
-    return vec.length
+    bones = obj.data.bones
+    head = bones[bone].head
+    return sorted(bone_siblings(obj, bone), key=lambda b: ((bones[b].head - head).length, b))
 
 
 class Rig:
@@ -58,13 +61,15 @@ class Rig:
         This is a control and deformation rig.
 
     """
-    def __init__(self, obj, bone, params):
+    def __init__(self, obj, bone, params, siblings=None):
         """ Gather and validate data about the rig.
+            siblings are the sibling bones already sorted by sorted_siblings().
         """
         self.obj = obj
         self.params = params
 
-        siblings = bone_siblings(obj, bone)
+        if siblings is None:
+            siblings = sorted_siblings(obj, bone)
 
         if len(siblings) == 0:
             raise MetarigError(
@@ -72,10 +77,6 @@ class Rig:
                 (basename(bone))
             )
 
-        # Sort list by name and distance
-        siblings.sort()
-        siblings.sort(key=lambda b: bone_distance(obj, bone, b))
-
         self.org_bones = [bone] + siblings
 
         # Get rig parameters
@@ -87,14 +88,25 @@ class Rig:
             The main armature should be selected and active before this is called.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
+        return generate_in_passes([self]) or None
+
+    @classmethod
+    def generate_batch(cls, rigs, context):
+        """ Generate all the palm rigs of the armature at once,
+            with a single edit pass and a single pose pass.
+        """
+        return generate_in_passes(rigs)
 
+    def create_bones(self):
+        """ Edit mode part of the rig generation.
+        """
         # Figure out the name for the control bone (remove the last .##)
         last_bone = self.org_bones[-1:][0]
         ctrl_name = re.sub("([0-9]+\.)", "", basename(last_bone)[::-1], count=1)[::-1]
 
         # Make control bone
-        ctrl = copy_bone(self.obj, last_bone, ctrl_name)
+        ctrl = copy_edit_bone(self.obj, last_bone, ctrl_name)
+        self.ctrl = ctrl
 
         # Parenting
         eb = self.obj.data.edit_bones
@@ -110,14 +122,22 @@ class Rig:
 
         # Get ORG parent bone
         org_parent = eb[self.org_bones[0]].parent.name
+        self.org_parent = org_parent
 
         # Switch parent
         for o in self.org_bones:
             eb[o].parent = eb[org_parent]
         eb[ctrl].parent = eb[org_parent]
 
+        return [(last_bone, ctrl)]
+
+    def setup_pose(self):
+        """ Object mode part of the rig generation.
+        """
+        ctrl = self.ctrl
+        org_parent = self.org_parent
+
         # Constraints
-        bpy.ops.object.mode_set(mode='OBJECT')
         pb = self.obj.pose.bones
 
         ctrlbone = pb[ctrl]
@@ -190,92 +210,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('palm.parent')
-    bone.head[:] = 0.0000, 0.0000, 0.0000
-    bone.tail[:] = 0.0577, 0.0000, -0.0000
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bones['palm.parent'] = bone.name
-    bone = arm.edit_bones.new('palm.04')
-    bone.head[:] = 0.0577, 0.0315, -0.0000
-    bone.tail[:] = 0.1627, 0.0315, -0.0000
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.parent']]
-    bones['palm.04'] = bone.name
-    bone = arm.edit_bones.new('palm.03')
-    bone.head[:] = 0.0577, 0.0105, -0.0000
-    bone.tail[:] = 0.1627, 0.0105, -0.0000
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.parent']]
-    bones['palm.03'] = bone.name
-    bone = arm.edit_bones.new('palm.02')
-    bone.head[:] = 0.0577, -0.0105, -0.0000
-    bone.tail[:] = 0.1627, -0.0105, -0.0000
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.parent']]
-    bones['palm.02'] = bone.name
-    bone = arm.edit_bones.new('palm.01')
-    bone.head[:] = 0.0577, -0.0315, -0.0000
-    bone.tail[:] = 0.1627, -0.0315, -0.0000
-    bone.roll = 3.1416
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.parent']]
-    bones['palm.01'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['palm.parent']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['palm.04']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, True, True)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['palm.03']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, True, True)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['palm.02']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, True, True)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['palm.01']]
-    pbone.gamerig_type = 'palm'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, True, True)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
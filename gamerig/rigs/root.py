@@ -18,9 +18,9 @@
 
 # <pep8 compliant>
 
-import bpy
-
-from ..utils import copy_bone, basename, create_widget
+from ..utils import copy_edit_bone, basename, generate_in_passes
+from ..widget_builder import queue_library_widget
+from ..metarig_data import load_sample
 
 
 class Rig:
@@ -40,73 +40,44 @@ class Rig:
             The main armature should be selected and active before this is called.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
+        return generate_in_passes([self]) or None
+
+    @classmethod
+    def generate_batch(cls, rigs, context):
+        """ Generate all the root rigs of the armature at once,
+            with a single edit pass and a single pose pass.
+        """
+        return generate_in_passes(rigs)
 
+    def create_bones(self):
+        """ Edit mode part of the rig generation.
+        """
         # Make a control bone (copy of original).
-        bone = copy_bone(self.obj, self.org_bone, self.basename)
-        
-        # Get edit bones
-        eb = self.obj.data.edit_bones
+        self.bone = copy_edit_bone(self.obj, self.org_bone, self.basename)
+        return [(self.org_bone, self.bone)]
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+    def setup_pose(self):
+        """ Object mode part of the rig generation.
+        """
         pb = self.obj.pose.bones
 
         # Constrain the original bone.
         con = pb[self.org_bone].constraints.new('COPY_TRANSFORMS')
         con.name = "copy_transforms"
         con.target = self.obj
-        con.subtarget = bone
+        con.subtarget = self.bone
 
         # Create control widget
-        create_root_widget(self.obj, bone)
+        create_root_widget(self.obj, self.bone)
 
 
 def create_root_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a widget for the root bone.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(0.70711, 0.70711, 0.0), (0.70711, -0.70711, 0.0), (-0.70711, 0.70711, 0.0), (-0.70711, -0.70711, 0.0), (0.83147, 0.55557, 0.0), (0.83147, -0.55557, 0.0), (-0.83147, 0.55557, 0.0), (-0.83147, -0.55557, 0.0), (0.92388, 0.38268, 0.0), (0.92388, -0.38268, 0.0), (-0.92388, 0.38268, 0.0), (-0.92388, -0.38268, 0.0), (0.98079, 0.19509, 0.0), (0.98079, -0.19509, 0.0), (-0.98079, 0.19509, 0.0), (-0.98079, -0.19509, 0.0), (0.19509, 0.98078, 0.0), (0.19509, -0.98078, 0.0), (-0.19509, 0.98078, 0.0), (-0.19509, -0.98078, 0.0), (0.38269, 0.92388, 0.0), (0.38269, -0.92388, 0.0), (-0.38269, 0.92388, 0.0), (-0.38269, -0.92388, 0.0), (0.55557, 0.83147, 0.0), (0.55557, -0.83147, 0.0), (-0.55557, 0.83147, 0.0), (-0.55557, -0.83147, 0.0), (0.19509, 1.2808, 0.0), (0.19509, -1.2808, 0.0), (-0.19509, 1.2808, 0.0), (-0.19509, -1.2808, 0.0), (1.2808, 0.19509, 0.0), (1.2808, -0.19509, 0.0), (-1.2808, 0.19509, 0.0), (-1.2808, -0.19509, 0.0), (0.39509, 1.2808, 0.0), (0.39509, -1.2808, 0.0), (-0.39509, 1.2808, 0.0), (-0.39509, -1.2808, 0.0), (1.2808, 0.39509, 0.0), (1.2808, -0.39509, 0.0), (-1.2808, 0.39509, 0.0), (-1.2808, -0.39509, 0.0), (0.0, 1.5808, 0.0), (0.0, -1.5808, 0.0), (1.5808, 0.0, 0.0), (-1.5808, 0.0, 0.0), ]
-        edges = [(0, 4), (1, 5), (2, 6), (3, 7), (4, 8), (5, 9), (6, 10), (7, 11), (8, 12), (9, 13), (10, 14), (11, 15), (16, 20), (17, 21), (18, 22), (19, 23), (20, 24), (21, 25), (22, 26), (23, 27), (0, 24), (1, 25), (2, 26), (3, 27), (16, 28), (17, 29), (18, 30), (19, 31), (12, 32), (13, 33), (14, 34), (15, 35), (28, 36), (29, 37), (30, 38), (31, 39), (32, 40), (33, 41), (34, 42), (35, 43), (36, 44), (37, 45), (38, 44), (39, 45), (40, 46), (41, 46), (42, 47), (43, 47), ]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    queue_library_widget(rig, bone_name, 'root', bone_transform_name=bone_transform_name)
 
 
 def create_sample(obj):
     """ Create a sample metarig for this rig type.
     """
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('Bone')
-    bone.head[:] = 0.0000, 0.0000, 0.0000
-    bone.tail[:] = 0.0000, 1.0000, 0.0000
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = False
-    bones['Bone'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['Bone']]
-    pbone.gamerig_type = 'root'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    load_sample(obj, __file__)
@@ -0,0 +1,184 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+import bpy
+import numpy as np
+
+from ..utils import basename, MetarigError
+from ..builder import add_constraint, add_property, add_driver
+from ..widget_builder import share_widget
+from ..metarig_data import load_sample
+from .widgets import create_circle_widget, create_bone_widget
+
+
+class Rig:
+    """ A strand rig for hair, cloth and accessory chains.
+        Rigs every descendant chain of the root bone in a single instance: an
+        FK control per bone following the original hierarchy, all of them
+        sharing one widget, and one Rig/Phy switch for the whole group.
+        Descendants typed with another rig type are left to that rig.
+    """
+    def __init__(self, obj, bone, params):
+        """ Gather and validate data about the rig.
+        """
+        self.obj          = obj
+        self.org_bone     = bone
+        self.params       = params
+        self.widget_type  = params.strand_widget_type
+        self.include_root = params.strand_root_control
+
+        eb = obj.data.edit_bones
+        pb = obj.pose.bones
+
+        # Bones of the strands, parents first
+        self.org_bones = [bone]
+        queue = [bone]
+        while queue:
+            children = [
+                child.name for name in queue for child in eb[name].children
+                if not pb[child.name].gamerig_type
+            ]
+            self.org_bones += children
+            queue = children
+
+        if len(self.org_bones) < 2:
+            raise MetarigError("GAMERIG ERROR: Bone '%s': strand rig needs child bones" % basename(bone))
+
+    def generate(self, context):
+        """ Generate the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+            The main armature should be selected and active before this is called.
+
+        """
+        self.create_bones()
+        bpy.ops.object.mode_set(mode='OBJECT')
+        return self.setup_pose()
+
+    def create_bones(self):
+        """ Edit mode part of the rig generation.
+            All the controls are created first, then placed with bulk writes.
+        """
+        bpy.ops.object.mode_set(mode='EDIT')
+        eb = self.obj.data.edit_bones
+
+        org_bones = self.org_bones if self.include_root else self.org_bones[1:]
+        self.controls = [eb.new(basename(name)).name for name in org_bones]
+        control_map = dict(zip(org_bones, self.controls))
+
+        # Head, tail and roll of the controls from those of the originals
+        index = dict((name, i) for i, name in enumerate(eb.keys()))
+        src = np.array([index[name] for name in org_bones])
+        dst = np.array([index[name] for name in self.controls])
+        for attr, size in (('head', 3), ('tail', 3), ('roll', 1)):
+            values = np.empty(len(eb) * size, dtype=np.float32)
+            eb.foreach_get(attr, values)
+            values = values.reshape(-1, size)
+            values[dst] = values[src]
+            eb.foreach_set(attr, values.ravel())
+
+        for org_name, ctrl_name in zip(org_bones, self.controls):
+            org_ebone = eb[org_name]
+            ctrl      = eb[ctrl_name]
+            parent    = org_ebone.parent
+            if parent is not None:
+                ctrl.parent = eb[control_map.get(parent.name, parent.name)]
+                ctrl.use_connect = org_ebone.use_connect
+            ctrl.layers = org_ebone.layers
+
+        self.control_map = control_map
+
+    def setup_pose(self):
+        """ Object mode part of the rig generation.
+        """
+        pb = self.obj.pose.bones
+
+        # The ORG bones follow their controls, or blend with their own
+        # (physics) constraints through the group switch
+        switch_bone = self.controls[0]
+        rig_phy = False
+        for org_name, ctrl_name in self.control_map.items():
+            pb[ctrl_name].rotation_mode = pb[org_name].rotation_mode
+
+            physics = len(pb[org_name].constraints) > 0
+            record = add_constraint(self, org_name, {
+                'constraint' : 'COPY_TRANSFORMS',
+                'name'       : 'copy_transforms',
+                'subtarget'  : ctrl_name,
+            })
+
+            if physics:
+                if not rig_phy:
+                    add_property(self, switch_bone, 'Rig/Phy', description='Rig/Phy Switch of the strands')
+                    rig_phy = True
+                add_driver(
+                    self, org_name, record, switch_bone, 'Rig/Phy', 'rig_phy_switch',
+                    coefficients=(1.0, -1.0)
+                )
+
+        # One widget for all the controls
+        if self.widget_type == 'Circle':
+            create_circle_widget(self.obj, switch_bone, radius=0.5)
+        else:
+            create_bone_widget(self.obj, switch_bone)
+
+        for ctrl_name in self.controls[1:]:
+            share_widget(self.obj, ctrl_name, switch_bone)
+
+        if rig_phy:
+            return ["""
+controls = %s
+
+# Rig/Phy Switch of the strands
+if is_selected( controls ):
+    layout.prop( pose_bones[ '%s' ], '["Rig/Phy"]', text='Rig/Phy (%s)', slider = True )
+""" % (self.controls, switch_bone, switch_bone)]
+
+
+def add_parameters(params):
+    """ Add the parameters of this rig type to the
+        GameRigParameters PropertyGroup
+    """
+    params.strand_widget_type = bpy.props.EnumProperty(
+        name        = "Strand Widget Type",
+        default     = 'Circle',
+        description = "Choose the widget shared by all the strand controls",
+        items = [('Frustum', 'Frustum', ''), ('Circle', 'Circle', '')]
+    )
+
+    params.strand_root_control = bpy.props.BoolProperty(
+        name        = "Root Control",
+        default     = True,
+        description = "Create a control for the root bone of the strands"
+    )
+
+
+def parameters_ui(layout, params):
+    """ Create the ui for the rig parameters.
+    """
+    r = layout.row()
+    r.prop(params, "strand_widget_type")
+    r = layout.row()
+    r.prop(params, "strand_root_control")
+
+
+def create_sample(obj):
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -1,13 +1,16 @@
 import bpy
-from rna_prop_ui import rna_idprop_ui_prop_get
+from mathutils import Matrix, Vector
 from ..utils import (
-    copy_bone, flip_bone, org, mch, basename, children_names,
+    copy_bone, copy_edit_bone, copy_pose_bone, flip_bone, org, mch, basename, children_names,
     insert_before_first_period,
     create_widget,
     MetarigError
 )
+from ..builder import make_constraint, add_constraint, add_property, add_driver
+from ..metarig_data import load_sample
 from .widgets import create_sphere_widget, create_cube_widget
 
+CLONEABLE = True
 
 class Rig:
 
@@ -18,6 +21,12 @@ class Rig:
         self.chain_length = params.chain_length
         self.mid_ik_lens = params.mid_ik_lens
         self.stretchable = params.stretchable
+        self.spline = params.tentacle_mode == 'SPLINE'
+        self.spline_hooks = params.spline_hooks
+        self.spline_fk = params.spline_fk
+
+        # Each spline instance has its own curve object
+        self.cloneable = not self.spline
 
         # Assign values to tweak layers props if opted by user
         if params.tweak_extra_layers:
@@ -160,31 +169,10 @@ class Rig:
         ik_chain = all_bones['ik_chain']
 
         # Create IK/FK switch property
-        pb[fk_ctrls[0]]['IK/FK'] = 1.0
-        prop = rna_idprop_ui_prop_get( pb[fk_ctrls[0]], 'IK/FK', create=True )
-        prop["min"]         = 0.0
-        prop["max"]         = 1.0
-        prop["soft_min"]    = 0.0
-        prop["soft_max"]    = 1.0
-        prop["description"] = 'IK/FK Switch'
+        add_property( self, fk_ctrls[0], 'IK/FK', 1.0, description='IK/FK Switch' )
 
         # fk chain
-        for mchb, ctrl in zip( fk_chain, fk_ctrls ):
-            self.make_constraint( mchb, {
-                'constraint'  : 'DAMPED_TRACK',
-                'subtarget'   : ctrl,
-            })
-
-            if self.stretchable:
-                self.make_constraint( mchb, {
-                    'constraint'  : 'STRETCH_TO',
-                    'subtarget'   : ctrl,
-                })
-
-                self.make_constraint( mchb, {
-                    'constraint'  : 'MAINTAIN_VOLUME'
-                })
-                pb[ mchb ].ik_stretch = 0.01
+        self.make_fk_constraints( fk_chain, fk_ctrls )
 
         # ik chain
         ik_chain_target = []
@@ -232,64 +220,68 @@ class Rig:
             })
 
         # bind original bone
-        for org, fkmch, ikmch in zip( org_bones, fk_chain, ik_chain ):
-            stashed = self.stash_constraint(org)
+        self.bind_org_bones( fk_ctrls[0], fk_chain, ik_chain )
 
-            self.make_constraint( org, {
-                'constraint'  : 'COPY_TRANSFORMS',
-                'subtarget'   : fkmch
+
+    def make_fk_constraints( self, fk_chain, fk_ctrls ):
+        pb = self.obj.pose.bones
+
+        for mchb, ctrl in zip( fk_chain, fk_ctrls ):
+            self.make_constraint( mchb, {
+                'constraint'  : 'DAMPED_TRACK',
+                'subtarget'   : ctrl,
             })
-            self.make_constraint( org, {
+
+            if self.stretchable:
+                self.make_constraint( mchb, {
+                    'constraint'  : 'STRETCH_TO',
+                    'subtarget'   : ctrl,
+                })
+
+                self.make_constraint( mchb, {
+                    'constraint'  : 'MAINTAIN_VOLUME'
+                })
+                pb[ mchb ].ik_stretch = 0.01
+
+
+    def bind_org_bones( self, prop_bone, fk_chain, ik_chain ):
+        """ Constrains the org bones to the ik chain, switched to the fk chain by
+            the IK/FK property if there is one.
+            (created right away, the stashed constraints of the org bones go after them)
+        """
+        pb = self.obj.pose.bones
+
+        rig_phy = 'Rig/Phy' in pb[prop_bone]
+        for i, (org, ikmch) in enumerate( zip( self.org_bones, ik_chain ) ):
+            stashed = self.stash_constraint(org)
+
+            if fk_chain:
+                make_constraint( self.obj, pb[org], {
+                    'constraint'  : 'COPY_TRANSFORMS',
+                    'subtarget'   : fk_chain[i]
+                })
+            con = make_constraint( self.obj, pb[org], {
                 'constraint'  : 'COPY_TRANSFORMS',
                 'subtarget'   : ikmch
             })
 
             # Add driver to relevant constraint
-            drv = pb[org].constraints[-1].driver_add("influence").driver
-            drv.type = 'AVERAGE'
-
-            var = drv.variables.new()
-            var.name = 'ik_fk_switch'
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[fk_ctrls[0]].path_from_id() + '["IK/FK"]'
-
-            drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-            drv_modifier.mode            = 'POLYNOMIAL'
-            drv_modifier.poly_order      = 1
-            drv_modifier.coefficients[0] = 1.0
-            drv_modifier.coefficients[1] = -1.0
+            if fk_chain:
+                add_driver( self, org, con.name, prop_bone, 'IK/FK', 'ik_fk_switch', coefficients=(1.0, -1.0) )
 
             self.unstash_constraint( org, stashed )
 
-            if len(pb[org].constraints) > 2:
-                if not 'Rig/Phy' in pb[fk_ctrls[0]]:
+            if len(pb[org].constraints) > (2 if fk_chain else 1):
+                if not rig_phy:
                     # Create Rig/Physics switch property
-                    pb[fk_ctrls[0]]['Rig/Phy'] = 0.0
-                    prop = rna_idprop_ui_prop_get( pb[fk_ctrls[0]], 'Rig/Phy', create=True )
-                    prop["min"]         = 0.0
-                    prop["max"]         = 1.0
-                    prop["soft_min"]    = 0.0
-                    prop["soft_max"]    = 1.0
-                    prop["description"] = 'Rig/Phy Switch'
+                    add_property( self, prop_bone, 'Rig/Phy', description='Rig/Phy Switch' )
+                    rig_phy = True
                 
                 # Add driver to relevant constraint
-                drv = pb[org].constraints[-1].driver_add("influence").driver
-                drv.type = 'AVERAGE'
-
-                var = drv.variables.new()
-                var.name = 'rig_phy_switch'
-                var.type = "SINGLE_PROP"
-                var.targets[0].id = self.obj
-                var.targets[0].data_path = pb[fk_ctrls[0]].path_from_id() + '["Rig/Phy"]'
-
-                drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-                drv_modifier.mode            = 'POLYNOMIAL'
-                drv_modifier.poly_order      = 1
-                drv_modifier.coefficients[0] = 0.0
-                drv_modifier.coefficients[1] = 1.0
+                add_driver(
+                    self, org, pb[org].constraints[-1].name, prop_bone, 'Rig/Phy', 'rig_phy_switch',
+                    coefficients=(0.0, 1.0)
+                )
 
 
     def stash_constraint( self, bone ):
@@ -332,22 +324,216 @@ class Rig:
                         pass
 
 
-    def make_constraint( self, bone, constraint ):
-        bpy.ops.object.mode_set(mode = 'OBJECT')
+    def copy_spline_bone( self, name, new_name, flip=False, parent=None ):
+        """ Copies an org bone in edit mode, disconnected and parented to the
+            parent bone name, its pose bone is set up by setup_spline_pose().
+        """
+        eb = self.obj.data.edit_bones
+
+        bone = copy_edit_bone( self.obj, name, new_name )
+        self.pose_copies.append( (name, bone) )
+
+        ebone = eb[bone]
+        ebone.use_connect = False
+        ebone.parent = eb[parent] if parent else None
+        if flip:
+            head = Vector(ebone.head)
+            tail = Vector(ebone.tail)
+            ebone.tail = head + tail
+            ebone.head = tail
+            ebone.tail = head
+
+        return bone
+
+
+    def make_spline_bones( self ):
+        """ Creates, in a single edit mode pass, the hook controls at evenly spaced
+            joints of the chain, the spline ik chain and with the FK overrides the
+            fk controls and chain.
+        """
+        eb = self.obj.data.edit_bones
+        org_bones = self.org_bones
+        count  = len(org_bones)
+        parent = eb[org_bones[0]].parent.name if eb[org_bones[0]].parent else None
+
+        # hooks at the joints, the last one at the tip of the chain
+        joints = sorted(set( round( i * count / (self.spline_hooks - 1) ) for i in range(self.spline_hooks) ))
+        hooks = []
+        for j in joints:
+            name = org_bones[min(j, count - 1)]
+            hook = self.copy_spline_bone( name, insert_before_first_period(basename(name), '_hook'), flip=(j == count), parent=parent )
+            eb[hook].length /= 4
+            hooks.append( hook )
+
+        def make_chain( suffix ):
+            chain = []
+            for name in org_bones:
+                chain.append( self.copy_spline_bone( name, insert_before_first_period(mch(basename(name)), suffix), parent=chain[-1] if chain else parent ) )
+            term = self.copy_spline_bone( org_bones[-1], insert_before_first_period(mch(basename(org_bones[-1])), suffix + '_term'), flip=True, parent=chain[-1] )
+            eb[term].length /= 4
+            return chain + [ term ]
+
+        ik_chain = make_chain( '_ik' )
+
+        fk_ctrls = []
+        fk_chain = []
+        if self.spline_fk:
+            for name in org_bones:
+                ctrl = self.copy_spline_bone( name, insert_before_first_period(basename(name), '_fk'), flip=True, parent=parent )
+                eb[ctrl].length /= 4
+                fk_ctrls.append( ctrl )
+            fk_chain = make_chain( '_fk' )
+
+        return {
+            'hooks'    : hooks,
+            'joints'   : joints,
+            'ik_chain' : ik_chain,
+            'fk_ctrls' : fk_ctrls,
+            'fk_chain' : fk_chain,
+        }
+
+
+    def make_spline_curve( self, hooks, joints ):
+        """ Creates the curve of the chain, a NURBS with a point hooked to each hook control.
+            The curve object is a child of the rig, its points are in armature space.
+        """
+        bones = self.obj.data.bones
+        org_bones = self.org_bones
+        count = len(org_bones)
+
+        name = 'spline_%s_%s' % (self.obj.name, basename(org_bones[0]))
+        curve = bpy.data.curves.new(name, 'CURVE')
+        curve.dimensions = '3D'
+
+        spline = curve.splines.new('NURBS')
+        spline.points.add(len(joints) - 1)
+        for point, j in zip(spline.points, joints):
+            co = bones[org_bones[j]].head_local if j < count else bones[org_bones[-1]].tail_local
+            point.co = (co.x, co.y, co.z, 1.0)
+        spline.order_u = min(4, len(joints))
+        spline.use_endpoint_u = True
+
+        # Regenerate in the same curve object
+        curve_obj = bpy.data.objects.get(name)
+        if curve_obj is not None and curve_obj.type == 'CURVE':
+            old_curve = curve_obj.data
+            curve_obj.data = curve
+            if old_curve.users == 0:
+                bpy.data.curves.remove(old_curve)
+            curve_obj.modifiers.clear()
+        else:
+            if curve_obj is not None:
+                bpy.data.objects.remove(curve_obj)
+            curve_obj = bpy.data.objects.new(name, curve)
+        if name not in bpy.context.scene.objects:
+            bpy.context.collection.objects.link(curve_obj)
+
+        curve_obj.parent = self.obj
+        curve_obj.matrix_parent_inverse = Matrix.Identity(4)
+        curve_obj.matrix_basis = Matrix.Identity(4)
+        curve_obj.hide_select = True
+        curve_obj.hide_render = True
+        curve_obj['gamerig_spline'] = name
+
+        for i, hook in enumerate(hooks):
+            mod = curve_obj.modifiers.new(hook, 'HOOK')
+            mod.object = self.obj
+            mod.subtarget = hook
+            mod.vertex_indices_set([i])
+            mod.matrix_inverse = bones[hook].matrix_local.inverted()
+
+        return curve_obj
+
+
+    def setup_spline_pose( self, bones ):
         pb = self.obj.pose.bones
 
-        owner_pb = pb[bone]
-        const    = owner_pb.constraints.new( constraint['constraint'] )
+        for bone_name_1, bone_name_2 in self.pose_copies:
+            copy_pose_bone( self.obj, bone_name_1, bone_name_2 )
+
+        for ctrl in bones['hooks']:
+            create_cube_widget(self.obj, ctrl)
+        for ctrl in bones['fk_ctrls']:
+            if self.fk_layers:
+                pb[ctrl].bone.layers = self.fk_layers
+            create_sphere_widget(self.obj, ctrl)
+
+        curve_obj = self.make_spline_curve( bones['hooks'], bones['joints'] )
+
+        # spline ik on the ik chain (y_scale_mode since 2.81, use_y_stretch before)
+        self.make_constraint( bones['ik_chain'][len(self.org_bones) - 1], {
+            'constraint'       : 'SPLINE_IK',
+            'target'           : curve_obj,
+            'chain_count'      : len(self.org_bones),
+            'use_curve_radius' : False,
+            'use_y_stretch'    : self.stretchable,
+            'y_scale_mode'     : 'FIT_CURVE' if self.stretchable else 'BONE_ORIGINAL',
+            'xz_scale_mode'    : 'VOLUME_PRESERVE' if self.stretchable else 'NONE',
+        })
+
+        prop_bone = bones['fk_ctrls'][0] if bones['fk_ctrls'] else bones['hooks'][0]
+        if bones['fk_ctrls']:
+            # Create IK/FK switch property
+            add_property( self, prop_bone, 'IK/FK', 1.0, description='IK/FK Switch' )
+            self.make_fk_constraints( bones['fk_chain'], bones['fk_ctrls'] )
+
+        # bind original bone
+        self.bind_org_bones( prop_bone, bones['fk_chain'], bones['ik_chain'] )
+
+
+    def make_constraint( self, bone, constraint ):
+        """ Records the constraint, created by the generator after all the rigs.
+        """
+        return add_constraint( self, bone, constraint )
+
+
+    def generate_spline(self, context):
+        self.pose_copies = []
+
+        bpy.ops.object.mode_set(mode ='EDIT')
+        bones = self.make_spline_bones()
+
+        bpy.ops.object.mode_set(mode ='OBJECT')
+        self.setup_spline_pose( bones )
+
+        controls = bones['fk_ctrls'] + bones['hooks']
+        fk_chain = bones['fk_chain']
+        return [ self.create_script(
+            controls, bones['fk_ctrls'], bones['ik_chain'][1:], bones['hooks'], [ fk_chain[j] for j in bones['joints'] ] if fk_chain else []
+        ) ]
+
+
+    def create_script(self, controls, fk_ctrls, ik_chain, ik_ctrls, fk_chain):
+        code = """
+controls = %s
+orgs = %s
+
+# IK/FK Switch on all Control Bones
+if is_selected( controls ):
+""" % (controls, self.org_bones[1:])
 
-        constraint['target'] = self.obj
+        if fk_ctrls:
+            code += """    layout.prop( pose_bones[ controls[0] ], '["IK/FK"]', text='IK/FK (' + controls[0] + ')', slider = True )
+"""
+        code += """    if 'Rig/Phy' in pose_bones[ controls[0] ]:
+        layout.prop( pose_bones[ controls[0] ], '["Rig/Phy"]', text='Rig/Phy (' + controls[0] + ')', slider = True )
+"""
+        if fk_ctrls:
+            code += """    props = layout.operator("pose.gamerig_tentacle_fk2ik_" + rig_id, text="Snap FK->IK (" + controls[0] + ")")
+    props.fk_ctrls = "%s"
+    props.ik_chain = "%s"
+    props = layout.operator("pose.gamerig_tentacle_ik2fk_" + rig_id, text="Snap IK->FK (" + controls[0] + ")")
+    props.ik_ctrls = "%s"
+    props.fk_chain = "%s"
+""" % (fk_ctrls, ik_chain, ik_ctrls, fk_chain)
 
-        # filter contraint props to those that actually exist in the currnet
-        # type of constraint, then assign values to each
-        for p in [ k for k in constraint.keys() if k in dir(const) ]:
-            setattr( const, p, constraint[p] )
+        return code
 
 
     def generate(self, context):
+        if self.spline:
+            return self.generate_spline(context)
+
         bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
@@ -380,22 +566,7 @@ class Rig:
 
         self.make_constraints(context, all_bones)
 
-        return ["""
-controls = %s
-orgs = %s
-
-# IK/FK Switch on all Control Bones
-if is_selected( controls ):
-    layout.prop( pose_bones[ controls[0] ], '["IK/FK"]', text='IK/FK (' + controls[0] + ')', slider = True )
-    if 'Rig/Phy' in pose_bones[ controls[0] ]:
-        layout.prop( pose_bones[ controls[0] ], '["Rig/Phy"]', text='Rig/Phy (' + controls[0] + ')', slider = True )
-    props = layout.operator("pose.gamerig_tentacle_fk2ik_" + rig_id, text="Snap FK->IK (" + controls[0] + ")")
-    props.fk_ctrls = "%s"
-    props.ik_chain = "%s"
-    props = layout.operator("pose.gamerig_tentacle_ik2fk_" + rig_id, text="Snap IK->FK (" + controls[0] + ")")
-    props.ik_ctrls = "%s"
-    props.fk_chain = "%s"
-""" % (ctrls[0] + ctrls[1], self.org_bones[1:], ctrls[0], mchs[1][1:], ctrls[1], ik_fk_snap_target)]
+        return [ self.create_script( ctrls[0] + ctrls[1], ctrls[0], mchs[1][1:], ctrls[1], ik_fk_snap_target ) ]
 
 def operator_script(rig_id):
     return '''
@@ -499,6 +670,27 @@ def add_parameters(params):
         description = "Allow stretch to controllers"
     )
 
+    params.tentacle_mode = bpy.props.EnumProperty(
+        items        = [ ('CHAIN',  'Chain',  'FK and IK chains with a control per bone'),
+                         ('SPLINE', 'Spline', 'Spline IK along a curve moved by a few hook controls') ],
+        name         = 'Mode',
+        default      = 'CHAIN',
+        description  = 'How the tentacle is controlled'
+    )
+
+    params.spline_hooks = bpy.props.IntProperty(
+        name         = 'Hooks',
+        default      = 4,
+        min          = 2,
+        description  = 'Number of hook controls of the spline'
+    )
+
+    params.spline_fk = bpy.props.BoolProperty(
+        name        = "FK Overrides",
+        default     = False,
+        description = "Add FK controls switched with the spline by the IK/FK property"
+    )
+
     # Setting up extra layers for the FK
     params.fk_extra_layers = bpy.props.BoolProperty(
         name        = "FK Extra Layers",
@@ -520,7 +712,15 @@ def parameters_ui(layout, params):
     r.prop(params, "chain_length")
 
     r = layout.row()
-    r.prop(params, "mid_ik_lens")
+    r.prop(params, "tentacle_mode", expand=True)
+
+    if params.tentacle_mode == 'SPLINE':
+        r = layout.row()
+        r.prop(params, "spline_hooks")
+        r.prop(params, "spline_fk")
+    else:
+        r = layout.row()
+        r.prop(params, "mid_ik_lens")
     
     r = layout.row()
     r.prop(params, "stretchable")
@@ -553,77 +753,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('ORG-Bone')
-    bone.head[:] = 0.0000, 0.0000, 0.0000
-    bone.tail[:] = 0.0000, 0.0000, 0.3333
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bone.use_deform = True
-    bones['ORG-Bone'] = bone.name
-
-    bone = arm.edit_bones.new('ORG-Bone.001')
-    bone.head[:] = 0.0000, 0.0000, 0.3333
-    bone.tail[:] = 0.0000, 0.0000, 0.6667
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-Bone']]
-    bones['ORG-Bone.001'] = bone.name
-
-    bone = arm.edit_bones.new('ORG-Bone.002')
-    bone.head[:] = 0.0000, 0.0000, 0.6667
-    bone.tail[:] = 0.0000, 0.0000, 1.0000
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.use_deform = True
-    bone.parent = arm.edit_bones[bones['ORG-Bone.001']]
-    bones['ORG-Bone.002'] = bone.name
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['ORG-Bone']]
-    pbone.gamerig_type = 'tentacle'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.chain_length = 3
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.stretchable = True
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['ORG-Bone.001']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['ORG-Bone.002']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -2,11 +2,13 @@ import bpy
 from mathutils import Vector
 from rna_prop_ui import rna_idprop_ui_prop_get
 from ..utils import (
-    copy_bone, connected_children_names,
-    create_widget,
+    copy_edit_bone, connected_children_names,
+    generate_in_passes,
     MetarigError,
     basename, mch
 )
+from ..widget_builder import queue_widget
+from ..metarig_data import load_sample
 from .widgets import create_circle_widget, create_sphere_widget, create_thumb_widget
 
 
@@ -22,9 +24,20 @@ class Rig:
 
 
     def generate(self, context):
+        return generate_in_passes([self]) or None
+
+    @classmethod
+    def generate_batch(cls, rigs, context):
+        """ Generate all the thumb rigs of the armature at once,
+            with a single edit pass and a single pose pass.
+        """
+        return generate_in_passes(rigs)
+
+    def create_bones(self):
+        """ Edit mode part of the rig generation.
+        """
         org_bones = self.org_bones
 
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         # Bone name lists
@@ -41,10 +54,10 @@ class Rig:
         # Creating the bone chains
         for name in org_bones:
             # Create control bones
-            ctrl_bone = copy_bone( self.obj, name, basename(name) )
+            ctrl_bone = copy_edit_bone( self.obj, name, basename(name) )
 
             # Create mechanism bones
-            mch_bone  = copy_bone( self.obj, name, mch(basename(name)) )
+            mch_bone  = copy_edit_bone( self.obj, name, mch(basename(name)) )
 
             # Adding to lists
             ctrl_chain.append(ctrl_bone)
@@ -61,7 +74,7 @@ class Rig:
 
         suffix = temp_name[-2:]
         master_name      = temp_name[:-5] + "_master" + suffix
-        master_name      = copy_bone( self.obj, self.org_bones[1], master_name )
+        master_name      = copy_edit_bone( self.obj, self.org_bones[1], master_name )
         ctrl_bone_master = eb[ master_name ]
 
         ## Parenting bug fix ??
@@ -95,7 +108,18 @@ class Rig:
         ctrl_bone_master = eb[ master_name ]
         ctrl_bone_master.parent = eb[ ctrl_chain[0] ]
 
-        bpy.ops.object.mode_set(mode ='OBJECT')
+        self.master_name = master_name
+        self.ctrl_chain  = ctrl_chain
+        self.mch_chain   = mch_chain
+
+        return [(org_bones[1], master_name)] + list(zip(org_bones, ctrl_chain)) + list(zip(org_bones, mch_chain))
+
+    def setup_pose(self):
+        """ Object mode part of the rig generation.
+        """
+        master_name = self.master_name
+        ctrl_chain  = self.ctrl_chain
+        mch_chain   = self.mch_chain
 
         pb = self.obj.pose.bones
 
@@ -137,19 +161,12 @@ class Rig:
                 create_circle_widget(self.obj, ctrl, radius=0.3, head_tail=0.5)
 
         # Create ctrl master widget
-        w = create_widget(self.obj, master_name)
-        if w is not None:
-            mesh = w.data
-            verts = [(0, 0, 0), (0, 1, 0), (0.05, 1, 0), (0.05, 1.1, 0), (-0.05, 1.1, 0), (-0.05, 1, 0)]
-            if 'Z' in self.params.primary_rotation_axis:
-                # Flip x/z coordinates
-                temp = []
-                for v in verts:
-                    temp += [(v[2], v[1], v[0])]
-                verts = temp
-            edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 1)]
-            mesh.from_pydata(verts, edges, [])
-            mesh.update()
+        verts = [(0, 0, 0), (0, 1, 0), (0.05, 1, 0), (0.05, 1.1, 0), (-0.05, 1.1, 0), (-0.05, 1, 0)]
+        if 'Z' in self.params.primary_rotation_axis:
+            # Flip x/z coordinates
+            verts = [v[::-1] for v in verts]
+        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 1)]
+        queue_widget(self.obj, master_name, verts, edges)
 
 
 def add_parameters(params):
@@ -169,90 +186,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('palm.04.L')
-    bone.head[:] = 0.0043, -0.0030, -0.0026
-    bone.tail[:] = 0.0642, 0.0030, -0.0469
-    bone.roll = -2.5155
-    bone.use_connect = False
-    bones['palm.04.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.01.L')
-    bone.head[:] = 0.0642, 0.0030, -0.0469
-    bone.tail[:] = 0.0825, 0.0039, -0.0679
-    bone.roll = -2.3110
-    bone.use_connect = False
-    bone.parent = arm.edit_bones[bones['palm.04.L']]
-    bones['f_pinky.01.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.02.L')
-    bone.head[:] = 0.0825, 0.0039, -0.0679
-    bone.tail[:] = 0.0958, 0.0044, -0.0862
-    bone.roll = -2.2257
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.01.L']]
-    bones['f_pinky.02.L'] = bone.name
-    bone = arm.edit_bones.new('f_pinky.03.L')
-    bone.head[:] = 0.0958, 0.0044, -0.0862
-    bone.tail[:] = 0.1023, 0.0046, -0.0997
-    bone.roll = -2.0532
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['f_pinky.02.L']]
-    bones['f_pinky.03.L'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['palm.04.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'YXZ'
-    pbone = obj.pose.bones[bones['f_pinky.01.L']]
-    pbone.gamerig_type = 'finger'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.separate_extra_layers = True
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.extra_layers = [False, False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_extra_layers = False
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['f_pinky.02.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['f_pinky.03.L']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -1,12 +1,14 @@
 import bpy
+import numpy as np
 from mathutils import Vector
-from rna_prop_ui import rna_idprop_ui_prop_get
 from ..utils import (
     copy_bone, put_bone,
     org, basename, make_mechanism_name, connected_children_names,
-    create_widget,
     MetarigError
 )
+from ..widget_builder import queue_library_widget
+from ..builder import add_constraint, add_property, add_driver
+from ..metarig_data import load_sample
 from .widgets import create_sphere_widget, create_directed_circle_widget
 
 class Rig:
@@ -48,6 +50,13 @@ class Rig:
 
         self.stretchable_tweak = params.stretchable_tweak
 
+        # Target deform bone count of each segment, 0 keeps the original bones
+        self.deform_counts = {
+            'lower' : params.hips_deform_count,
+            'upper' : params.chest_deform_count,
+            'neck'  : params.neck_deform_count,
+        }
+
         # Assign values to tweak layers props if opted by user
         if params.tweak_extra_layers:
             self.tweak_layers = list(params.tweak_layers)
@@ -357,18 +366,106 @@ class Rig:
                 eb[twk].parent = eb[ bones['hips']['mch'][i-1] ]
 
 
-    def make_constraint( self, bone, constraint ):
-        bpy.ops.object.mode_set(mode = 'OBJECT')
-        pb = self.obj.pose.bones
+    def resample_deform( self, bone_chains ):
+        """ Replace the deform bones of the segments with a deform count by
+            as many bones evenly spaced along the segment, following the
+            original bones which keep driving the controls.
+        """
+        segments = [
+            ('hips',  bone_chains['lower']),
+            ('chest', bone_chains['upper']),
+            ('neck',  bone_chains['neck'][:-1]), # Head keeps its own bone
+        ]
+        counts = [ self.deform_counts['lower'], self.deform_counts['upper'], self.deform_counts['neck'] ]
+
+        # Nothing to resample, by default
+        if not any( chain and count not in (0, len(chain)) for (name, chain), count in zip(segments, counts) ):
+            return
+
+        bpy.ops.object.mode_set(mode ='EDIT')
+        eb = self.obj.data.edit_bones
+
+        resampled = []
+        replaced  = {}
+        parent    = eb[ self.root_bone_parent ] if self.root_bone_parent else None
+
+        for (name, chain), count in zip(segments, counts):
+            if not chain or count == 0 or count == len(chain):
+                if chain:
+                    if parent is not None and eb[ chain[0] ].parent != parent:
+                        eb[ chain[0] ].use_connect = False
+                        eb[ chain[0] ].parent      = parent
+                    parent = eb[ chain[-1] ]
+                continue
+
+            points = [ eb[b].head for b in chain ] + [ eb[ chain[-1] ].tail ]
+            joints, index, fraction = resample_chain( points, count )
+
+            new_bones = []
+            for i in range(count):
+                bone = eb.new( org( name + '_def' ) )
+                bone.head[:]    = joints[i]
+                bone.tail[:]    = joints[i + 1]
+                bone.align_roll( eb[ chain[ index[i] ] ].z_axis )
+                bone.layers     = eb[ chain[0] ].layers
+                bone.use_deform = True
+                bone.parent     = parent
+                bone.use_connect = i > 0
+                parent = bone
+                new_bones.append( bone.name )
+
+                resampled.append( (
+                    bone.name,
+                    chain[ index[i]     ], fraction[i],
+                    chain[ index[i + 1] ], fraction[i + 1],
+                ) )
+
+            # Each original bone hands its children to the last new bone starting
+            # on or before it, the nearest its tail
+            covering = np.maximum( np.searchsorted( index[:count], np.arange( len(chain) ), side='right' ) - 1, 0 )
+            for b, j in zip(chain, covering):
+                eb[b].use_deform = False
+                replaced[b] = new_bones[j]
+
+        if not resampled:
+            return
+
+        # Keep the deform hierarchy whole for the engine
+        for b, new_bone in replaced.items():
+            for child in eb[b].children:
+                if child.name not in self.org_bones:
+                    child.use_connect = False
+                    child.parent      = eb[ new_bone ]
+
+        head = self.org_bones[-1]
+        if eb[ head ].parent is not None and not eb[ head ].parent.use_deform:
+            eb[ head ].use_connect = False
+            eb[ head ].parent      = parent
+
+        for bone, head_bone, head_tail, tail_bone, tail_head_tail in resampled:
+            self.make_constraint( bone, {
+                'constraint'  : 'COPY_TRANSFORMS',
+                'subtarget'   : head_bone,
+                'head_tail'   : head_tail,
+            })
+            self.make_constraint( bone, {
+                'constraint'  : 'DAMPED_TRACK',
+                'subtarget'   : tail_bone,
+                'head_tail'   : tail_head_tail,
+            })
+            if self.stretchable_tweak:
+                self.make_constraint( bone, {
+                    'constraint'        : 'STRETCH_TO',
+                    'subtarget'         : tail_bone,
+                    'head_tail'         : tail_head_tail,
+                    'playback_optional' : True,
+                })
 
-        owner_pb     = pb[bone]
-        const        = owner_pb.constraints.new( constraint['constraint'] )
-        const.target = self.obj
 
-        # filter contraint props to those that actually exist in the currnet
-        # type of constraint, then assign values to each
-        for p in [ k for k in constraint.keys() if k in dir(const) ]:
-            setattr( const, p, constraint[p] )
+    def make_constraint( self, bone, constraint ):
+        """ Records the constraint, created by the generator after all the rigs.
+        """
+        return add_constraint( self, bone, constraint )
 
 
     def constrain_bones( self, bones ):
@@ -443,10 +540,12 @@ class Rig:
 
                 if self.stretchable_tweak:
                     self.make_constraint( d, {
-                        'constraint'  : 'STRETCH_TO',
-                        'subtarget'   : tweaks[ tidx + 1 ],
+                        'constraint'        : 'STRETCH_TO',
+                        'subtarget'         : tweaks[ tidx + 1 ],
+                        'playback_optional' : True,
                     })
 
+        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
 
         for t in tweaks:
@@ -465,60 +564,25 @@ class Rig:
         owners = [ bones['neck']['mch_head'], bones['neck']['mch_neck'] ]
 
         for pname in props:
-            if pname == 'Neck Follow':
-                torso[pname] = 0.5
-            else:
-                torso[pname] = 0.0
-
-            prop = rna_idprop_ui_prop_get( torso, pname, create=True )
-            prop["min"]         = 0.0
-            prop["max"]         = 1.0
-            prop["soft_min"]    = 0.0
-            prop["soft_max"]    = 1.0
-            prop["description"] = pname
+            add_property( self, torso.name, pname, 0.5 if pname == 'Neck Follow' else 0.0 )
 
         # driving the follow rotation switches for neck and head
         for bone, prop, in zip( owners, props ):
             # Add driver to copy rotation constraint
-            drv = pb[ bone ].constraints[ 0 ].driver_add("influence").driver
-            drv.type = 'AVERAGE'
-
-            var = drv.variables.new()
-            var.name = prop.replace(' ', '_').lower()
-            var.type = "SINGLE_PROP"
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = torso.path_from_id() + '['+ '"' + prop + '"' + ']'
-
-            drv_modifier = self.obj.animation_data.drivers[-1].modifiers[0]
-
-            drv_modifier.mode            = 'POLYNOMIAL'
-            drv_modifier.poly_order      = 1
-            drv_modifier.coefficients[0] = 1.0
-            drv_modifier.coefficients[1] = -1.0
+            add_driver(
+                self, bone, 0, torso.name, prop, prop.replace(' ', '_').lower(),
+                coefficients=(1.0, -1.0)
+            )
 
         if self.stretchable_tweak:
             # Add driver to stretch constraint
             tweaks =  bones['hips']['tweak'] + bones['chest']['tweak'] + bones['neck']['tweak'] + [ bones['neck']['ctrl'] ]
             for bone, t in zip(self.org_bones, tweaks):
-                pb[t]['Tweak Stretch'] = 1.0
-
-                prop = rna_idprop_ui_prop_get( pb[t], 'Tweak Stretch', create=True )
-                prop["min"]         = 0.0
-                prop["max"]         = 1.0
-                prop["soft_min"]    = 0.0
-                prop["soft_max"]    = 1.0
-                prop["description"] = 'Tweak Stretch'
+                add_property( self, t, 'Tweak Stretch', 1.0 )
 
                 tidx = tweaks.index(t)
                 if tidx != len(tweaks) - 1:
-                    drv = pb[ bone ].constraints[ 'Stretch To' ].driver_add("influence").driver
-                    drv.type = 'SUM'
-
-                    var = drv.variables.new()
-                    var.name = 'tweak_stretch'
-                    var.type = "SINGLE_PROP"
-                    var.targets[0].id = self.obj
-                    var.targets[0].data_path = pb[t].path_from_id() + '['+ '"' + prop.name + '"' + ']'
+                    add_driver( self, bone, 'Stretch To', t, 'Tweak Stretch', 'tweak_stretch', driver_type='SUM' )
 
 
     def locks_and_widgets( self, bones ):
@@ -606,6 +670,7 @@ class Rig:
             self.constrain_bones(   bones )
             self.create_drivers(    bones )
             self.locks_and_widgets( bones )
+            self.resample_deform(   bone_chains )
 
 
         controls = [
@@ -631,6 +696,24 @@ for tweak in tweaks:
 """ % (bones['hips']['tweak'] + bones['chest']['tweak'] + bones['neck']['tweak'] + [ bones['neck']['ctrl'] ])
         return [code]
 
+def resample_chain( points, count ):
+    """ Resample the polyline of points into count segments of equal length.
+        Returns the count + 1 joints, and for each joint the index of the
+        original segment it lies on with its fraction along that segment.
+    """
+    points  = np.array( [ tuple(p) for p in points ], dtype=np.float64 )
+    lengths = np.linalg.norm( np.diff( points, axis=0 ), axis=1 )
+    arc     = np.concatenate( ( [0.0], np.cumsum( lengths ) ) )
+
+    targets = np.linspace( 0.0, arc[-1], count + 1 )
+    joints  = np.stack( [ np.interp( targets, arc, points[:, i] ) for i in range(3) ], axis=1 )
+
+    index    = np.clip( np.searchsorted( arc, targets, side='right' ) - 1, 0, len(lengths) - 1 )
+    fraction = np.clip( ( targets - arc[index] ) / np.maximum( lengths[index], 1e-9 ), 0.0, 1.0 )
+
+    return joints, index, fraction
+
+
 def add_parameters( params ):
     """ Add the parameters of this rig type to the
         GameRigParameters PropertyGroup
@@ -649,6 +732,27 @@ def add_parameters( params ):
         description  = 'Position of the torso control and pivot point'
     )
 
+    params.hips_deform_count = bpy.props.IntProperty(
+        name        = 'Hips',
+        default     = 0,
+        min         = 0,
+        description = 'Number of deform bones resampled along the hips, 0 keeps the metarig bones'
+    )
+
+    params.chest_deform_count = bpy.props.IntProperty(
+        name        = 'Chest',
+        default     = 0,
+        min         = 0,
+        description = 'Number of deform bones resampled along the chest, 0 keeps the metarig bones'
+    )
+
+    params.neck_deform_count = bpy.props.IntProperty(
+        name        = 'Neck',
+        default     = 0,
+        min         = 0,
+        description = 'Number of deform bones resampled along the neck, 0 keeps the metarig bones'
+    )
+
     params.stretchable_tweak = bpy.props.BoolProperty(
         name        = "Stretchable Tweak",
         default     = True,
@@ -672,18 +776,7 @@ def add_parameters( params ):
 def create_torso_widget(rig, bone_name, size=1, bone_transform_name=None):
     """ Creates a torso cube widget.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(0.5*size, 0.5*size, 0.5*size), (0.5*size, -0.5*size, 0.5*size), (-0.5*size, -0.5*size, 0.5*size), (-0.5*size, 0.5*size, 0.5*size), (0.5*size, 0.5*size, -0.5*size), (0.5*size, -0.5*size, -0.5*size), (-0.5*size, -0.5*size, -0.5*size), (-0.5*size, 0.5*size, -0.5*size), (-0.049471*size, -0.54198*size, 0.4719*size), (0.047116*size, -0.54198*size, 0.4719*size), (-0.0002994*size, -0.59993*size, 0.4719*size), ]
-        edges = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7), (8, 9), (9, 10), (10, 8), ]
-        faces = []
-
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
-        return obj
-    else:
-        return None
+    queue_library_widget(rig, bone_name, 'torso', size=size, bone_transform_name=bone_transform_name)
 
 
 def parameters_ui(layout, params):
@@ -695,6 +788,12 @@ def parameters_ui(layout, params):
     r = layout.row()
     r.prop(params, "pivot_pos")
 
+    layout.label(text="Deform Bones:")
+    r = layout.row(align=True)
+    r.prop(params, "hips_deform_count")
+    r.prop(params, "chest_deform_count")
+    r.prop(params, "neck_deform_count")
+
     r = layout.row()
     r.prop(params, "stretchable_tweak")
 
@@ -726,126 +825,6 @@ def parameters_ui(layout, params):
 
 
 def create_sample(obj):
-    # generated by gamerig.utils.write_metarig
-    bpy.ops.object.mode_set(mode='EDIT')
-    arm = obj.data
-
-    bones = {}
-
-    bone = arm.edit_bones.new('hips')
-    bone.head[:] = 0.0000, 0.0552, -0.0007
-    bone.tail[:] = 0.0000, -0.0037, 0.2256
-    bone.roll = 0.0000
-    bone.use_connect = False
-    bones['hips'] = bone.name
-    bone = arm.edit_bones.new('waist')
-    bone.head[:] = 0.0000, -0.0037, 0.2256
-    bone.tail[:] = -0.0000, -0.0099, 0.3598
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['hips']]
-    bones['waist'] = bone.name
-    bone = arm.edit_bones.new('chest')
-    bone.head[:] = -0.0000, -0.0099, 0.3598
-    bone.tail[:] = -0.0000, -0.0045, 0.4748
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['waist']]
-    bones['chest'] = bone.name
-    bone = arm.edit_bones.new('upper_chest')
-    bone.head[:] = -0.0000, -0.0045, 0.4748
-    bone.tail[:] = 0.0000, 0.0114, 0.6476
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['chest']]
-    bones['upper_chest'] = bone.name
-    bone = arm.edit_bones.new('neck')
-    bone.head[:] = 0.0000, 0.0114, 0.6476
-    bone.tail[:] = 0.0000, -0.0247, 0.7707
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['upper_chest']]
-    bones['neck'] = bone.name
-    bone = arm.edit_bones.new('head')
-    bone.head[:] = 0.0000, -0.0247, 0.7707
-    bone.tail[:] = 0.0000, -0.0247, 0.9690
-    bone.roll = 0.0000
-    bone.use_connect = True
-    bone.parent = arm.edit_bones[bones['neck']]
-    bones['head'] = bone.name
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    pbone = obj.pose.bones[bones['hips']]
-    pbone.gamerig_type = 'torso'
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    try:
-        pbone.gamerig_parameters.pivot_pos = 2
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.neck_pos = 5
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.stretchable_tweak = True
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.tweak_layers = [False, False, False, False, True, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False, False]
-    except AttributeError:
-        pass
-    try:
-        pbone.gamerig_parameters.chain_bone_controls = ""
-    except AttributeError:
-        pass
-    pbone = obj.pose.bones[bones['waist']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['chest']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['upper_chest']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['neck']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-    pbone = obj.pose.bones[bones['head']]
-    pbone.gamerig_type = ''
-    pbone.lock_location = (False, False, False)
-    pbone.lock_rotation = (False, False, False)
-    pbone.lock_rotation_w = False
-    pbone.lock_scale = (False, False, False)
-    pbone.rotation_mode = 'QUATERNION'
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in arm.edit_bones:
-        bone.select = False
-        bone.select_head = False
-        bone.select_tail = False
-    for b in bones:
-        bone = arm.edit_bones[bones[b]]
-        bone.select = True
-        bone.select_head = True
-        bone.select_tail = True
-        arm.edit_bones.active = bone
+    """ Create a sample metarig for this rig type.
+    """
+    load_sample(obj, __file__)
@@ -23,6 +23,7 @@ UI_TEMPLATE = '''
 # for gamerig
 #
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector
 from math import acos, pi, radians
 from bpy.utils import register_class
@@ -213,6 +214,305 @@ def correct_rotation(bone_ik, bone_fk):
     bone_ik.rotation_mode = rot_mod
 
 
+#########################################
+## Pose tools over the rig control set ##
+#########################################
+
+CONTROLS     = {controls}
+MIRROR_PAIRS = {mirror_pairs}
+
+# (channel, size, rest value, x-mirror factors)
+POSE_CHANNELS = (
+    ('location',            3, (0.0, 0.0, 0.0),      (-1.0, 1.0, 1.0)),
+    ('rotation_quaternion', 4, (1.0, 0.0, 0.0, 0.0), (1.0, 1.0, -1.0, -1.0)),
+    ('rotation_euler',      3, (0.0, 0.0, 0.0),      (1.0, -1.0, -1.0)),
+    ('rotation_axis_angle', 4, (0.0, 0.0, 1.0, 0.0), (1.0, 1.0, -1.0, -1.0)),
+    ('scale',               3, (1.0, 1.0, 1.0),      (1.0, 1.0, 1.0)),
+)
+
+ROTATION_CHANNELS = {{
+    'QUATERNION' : 'rotation_quaternion',
+    'AXIS_ANGLE' : 'rotation_axis_angle',
+}}
+
+
+def pose_bone_indices(obj, names):
+    """ Returns the indices of the named bones in obj.pose.bones.
+    """
+    index = {{name: i for i, name in enumerate(obj.pose.bones.keys())}}
+    return np.array([index[name] for name in names if name in index], dtype=np.int64)
+
+
+def read_pose_channel(pose_bones, attr, size, dtype=np.float32):
+    """ Reads an array property of all pose bones at once.
+    """
+    values = np.empty(len(pose_bones) * size, dtype=dtype)
+    pose_bones.foreach_get(attr, values)
+    return values.reshape(-1, size)
+
+
+def write_pose_channel(pose_bones, attr, values):
+    """ Writes an array property of all pose bones at once.
+    """
+    pose_bones.foreach_set(attr, values.ravel())
+
+
+def selected_controls(context, selected_only):
+    if not selected_only:
+        return CONTROLS
+    selected = set(bone.name for bone in (context.selected_pose_bones or []))
+    return [name for name in CONTROLS if name in selected]
+
+
+def reset_controls(obj, names):
+    """ Puts the given control bones back to rest pose.
+    """
+    pose_bones = obj.pose.bones
+    idx = pose_bone_indices(obj, names)
+    if len(idx) == 0:
+        return
+    for attr, size, rest, flip in POSE_CHANNELS:
+        values = read_pose_channel(pose_bones, attr, size)
+        values[idx] = rest
+        write_pose_channel(pose_bones, attr, values)
+    obj.update_tag()
+
+
+def mirror_controls(obj, pairs, right_to_left=False):
+    """ Copies the pose of one side's controls to the other side, mirrored in X.
+    """
+    pose_bones = obj.pose.bones
+    index = {{name: i for i, name in enumerate(pose_bones.keys())}}
+    pairs = [(index[l], index[r]) for l, r in pairs if l in index and r in index]
+    if not pairs:
+        return
+    src, dst = np.array(pairs, dtype=np.int64).T
+    if right_to_left:
+        src, dst = dst, src
+    for attr, size, rest, flip in POSE_CHANNELS:
+        values = read_pose_channel(pose_bones, attr, size)
+        values[dst] = values[src] * np.array(flip, dtype=np.float32)
+        write_pose_channel(pose_bones, attr, values)
+    obj.update_tag()
+
+
+def key_controls(obj, names, frame):
+    """ Inserts keyframes on the unlocked transform channels of the given controls.
+    """
+    pose_bones = obj.pose.bones
+    idx = pose_bone_indices(obj, names)
+    if len(idx) == 0:
+        return
+
+    # Unlocked channels of every control, columns: location, w, rotation, scale
+    modes = [pose_bones[int(i)].rotation_mode for i in idx]
+    euler = np.array([mode not in ROTATION_CHANNELS for mode in modes], dtype=bool)
+    lock_w = np.logical_and(
+        read_pose_channel(pose_bones, 'lock_rotation_w', 1, bool)[idx, 0],
+        read_pose_channel(pose_bones, 'lock_rotations_4d', 1, bool)[idx, 0]
+    )
+    free = ~np.hstack((
+        read_pose_channel(pose_bones, 'lock_location', 3, bool)[idx],
+        np.logical_or(lock_w, euler)[:, None],
+        read_pose_channel(pose_bones, 'lock_rotation', 3, bool)[idx],
+        read_pose_channel(pose_bones, 'lock_scale', 3, bool)[idx],
+    ))
+    rows = np.flatnonzero(free.any(axis=1))
+    if len(rows) == 0:
+        return
+
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    action = obj.animation_data.action
+    if action is None:
+        action = bpy.data.actions.new(obj.name + "Action")
+        obj.animation_data.action = action
+
+    values = {{attr: read_pose_channel(pose_bones, attr, size) for attr, size, rest, flip in POSE_CHANNELS}}
+    fcurves = {{(fc.data_path, fc.array_index): fc for fc in action.fcurves}}
+    keyed = []
+
+    for row in rows:
+        i = idx[row]
+        pbone = pose_bones[int(i)]
+        bone_path = pbone.path_from_id()
+        rot_attr = ROTATION_CHANNELS.get(modes[row], 'rotation_euler')
+        rot_offset = 0 if euler[row] else 1
+        for col in np.flatnonzero(free[row]):
+            if col < 3:
+                attr, j = 'location', col
+            elif col < 7:
+                attr, j = rot_attr, 0 if col == 3 else col - 4 + rot_offset
+            else:
+                attr, j = 'scale', col - 7
+            value = float(values[attr][i, j])
+            data_path = bone_path + '.' + attr
+            fc = fcurves.get((data_path, j))
+            if fc is None:
+                # New curves take their single key in one write
+                fc = action.fcurves.new(data_path, index=j, action_group=pbone.name)
+                fcurves[(data_path, j)] = fc
+                fc.keyframe_points.add(1)
+                fc.keyframe_points.foreach_set('co', (frame, value))
+            else:
+                fc.keyframe_points.insert(frame, value, options={{'FAST'}})
+            keyed.append(fc)
+
+    for fc in keyed:
+        fc.update()
+
+
+class ResetControls(bpy.types.Operator):
+    """ Resets the rig controls to rest pose.
+    """
+    bl_idname = "pose.gamerig_reset_controls_{rig_id}"
+    bl_label = "Reset Controls"
+    bl_options = {{'UNDO'}}
+
+    selected_only: bpy.props.BoolProperty(name="Selected Only", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.mode == 'POSE'
+
+    def execute(self, context):
+        reset_controls(context.active_object, selected_controls(context, self.selected_only))
+        return {{'FINISHED'}}
+
+
+class MirrorControls(bpy.types.Operator):
+    """ Copies the pose of the left side controls to the right side (or vice versa).
+    """
+    bl_idname = "pose.gamerig_mirror_controls_{rig_id}"
+    bl_label = "Mirror Controls"
+    bl_options = {{'UNDO'}}
+
+    right_to_left: bpy.props.BoolProperty(name="Right to Left", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.mode == 'POSE'
+
+    def execute(self, context):
+        mirror_controls(context.active_object, MIRROR_PAIRS, self.right_to_left)
+        return {{'FINISHED'}}
+
+
+class KeyControls(bpy.types.Operator):
+    """ Inserts keyframes on all unlocked control channels at the current frame.
+    """
+    bl_idname = "pose.gamerig_key_controls_{rig_id}"
+    bl_label = "Key All Controls"
+    bl_options = {{'UNDO'}}
+
+    selected_only: bpy.props.BoolProperty(name="Selected Only", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.mode == 'POSE'
+
+    def execute(self, context):
+        key_controls(context.active_object, selected_controls(context, self.selected_only), context.scene.frame_current)
+        return {{'FINISHED'}}
+
+
+###########################
+## Animator playback mode ##
+###########################
+
+PLAYBACK_CONSTRAINTS = {playback_constraints}
+PLAYBACK_DRIVERS     = {playback_drivers}
+
+# Rigs switched to playback mode by the playback handlers
+auto_playback_rigs = set()
+
+
+def rig_objects():
+    return [obj for obj in bpy.data.objects if obj.type == 'ARMATURE' and obj.data.get("gamerig_id") == "{rig_id}"]
+
+
+def set_playback_mode(obj, enable):
+    """ Mutes (or restores) the optional mechanism of the rig in one pass.
+        Constraints and drivers muted before entering the mode stay muted
+        when leaving it.
+    """
+    pose_bones = obj.pose.bones
+    constraints = []
+    for bone_name, const_name in PLAYBACK_CONSTRAINTS:
+        pbone = pose_bones.get(bone_name)
+        constraints.append(pbone.constraints.get(const_name) if pbone is not None else None)
+
+    drivers = []
+    if obj.animation_data is not None:
+        fcurves = {{(fcu.data_path, fcu.array_index): fcu for fcu in obj.animation_data.drivers}}
+        drivers = [fcurves.get(tuple(key)) for key in PLAYBACK_DRIVERS]
+
+    items = [item for item in constraints + drivers if item is not None]
+    if bool(obj.data.get("gamerig_playback_mode")) == enable:
+        return
+    if enable:
+        obj.data["gamerig_playback_muted"] = [int(item.mute) for item in items]
+        for item in items:
+            item.mute = True
+    else:
+        muted = list(obj.data.get("gamerig_playback_muted", []))
+        if len(muted) != len(items):
+            muted = [0] * len(items)
+        for item, was_muted in zip(items, muted):
+            item.mute = bool(was_muted)
+        if "gamerig_playback_muted" in obj.data:
+            del obj.data["gamerig_playback_muted"]
+
+    obj.data["gamerig_playback_mode"] = enable
+    obj.update_tag()
+
+
+def gamerig_playback_pre_{rig_id}(scene, *args):
+    for obj in rig_objects():
+        if obj.data.get("gamerig_auto_playback_mode") and not obj.data.get("gamerig_playback_mode"):
+            set_playback_mode(obj, True)
+            auto_playback_rigs.add(obj.name)
+
+
+def gamerig_playback_post_{rig_id}(scene, *args):
+    for obj in rig_objects():
+        if obj.name in auto_playback_rigs:
+            set_playback_mode(obj, False)
+    auto_playback_rigs.clear()
+
+
+def register_playback_handlers():
+    for handler_name, func in (
+        ('animation_playback_pre', gamerig_playback_pre_{rig_id}),
+        ('animation_playback_post', gamerig_playback_post_{rig_id}),
+    ):
+        handlers = getattr(bpy.app.handlers, handler_name, None)
+        if handlers is None:
+            # Blender without playback handlers, switch manually
+            continue
+        for handler in [h for h in handlers if getattr(h, '__name__', '') == func.__name__]:
+            handlers.remove(handler)
+        handlers.append(func)
+
+
+class PlaybackMode(bpy.types.Operator):
+    """ Mutes the optional mechanism (volume preservation, stretch...) for faster playback.
+    """
+    bl_idname = "pose.gamerig_playback_mode_{rig_id}"
+    bl_label = "Playback Mode"
+    bl_options = {{'UNDO'}}
+
+    enable: bpy.props.BoolProperty(name="Enable", default=True)
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.active_object.type == 'ARMATURE'
+
+    def execute(self, context):
+        set_playback_mode(context.active_object, self.enable)
+        return {{'FINISHED'}}
+
+
 ###########################
 ## Rig special operators ##
 ###########################
@@ -257,8 +557,48 @@ class PropertiesPanel(bpy.types.Panel):
             elif names in selected_bones:
                 return True
             return False
+
+        # Shared properties drawn once, such as physics group switches
+        drawn_properties = set()
 {properties}
 
+class PoseToolsPanel(bpy.types.Panel):
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Item'
+    bl_label = "GameRig Pose Tools"
+    bl_idname = "POSE_PT_gamerig_pose_tools_{rig_id}"
+
+    @classmethod
+    def poll(self, context):
+        if context.mode != 'POSE':
+            return False
+        try:
+            return context.active_object.data.get("gamerig_id") == "{rig_id}"
+        except (AttributeError, KeyError, TypeError):
+            return False
+
+    def draw(self, context):
+        layout = self.layout
+        col = layout.column(align=True)
+        row = col.row(align=True)
+        row.operator("pose.gamerig_reset_controls_{rig_id}", text="Reset All").selected_only = False
+        row.operator("pose.gamerig_reset_controls_{rig_id}", text="Reset Selected").selected_only = True
+        row = col.row(align=True)
+        row.operator("pose.gamerig_mirror_controls_{rig_id}", text="Mirror L->R").right_to_left = False
+        row.operator("pose.gamerig_mirror_controls_{rig_id}", text="Mirror R->L").right_to_left = True
+        row = col.row(align=True)
+        row.operator("pose.gamerig_key_controls_{rig_id}", text="Key All").selected_only = False
+        row.operator("pose.gamerig_key_controls_{rig_id}", text="Key Selected").selected_only = True
+
+        data = context.active_object.data
+        playback = bool(data.get("gamerig_playback_mode"))
+        col = layout.column(align=True)
+        col.operator("pose.gamerig_playback_mode_{rig_id}", text="Playback Mode", icon='PLAY', depress=playback).enable = not playback
+        if "gamerig_auto_playback_mode" in data:
+            col.prop(data, '["gamerig_auto_playback_mode"]', text="Auto on Playback")
+
+
 class LayersPanel(bpy.types.Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
@@ -278,6 +618,8 @@ class LayersPanel(bpy.types.Panel):
         col = layout.column()
 {layers}
 
-for cl in (PropertiesPanel, LayersPanel):
+for cl in (ResetControls, MirrorControls, KeyControls, PlaybackMode, PropertiesPanel, PoseToolsPanel, LayersPanel):
     register_class(cl)
+
+register_playback_handlers()
 '''
@@ -24,9 +24,13 @@ from mathutils import Color
 
 from .utils import (
     get_rig_type, MetarigError, write_metarig, write_widget, unique_name, get_keyed_frames,
-    bones_in_frame, overwrite_prop_animation, get_rig_name
+    bones_in_frame, overwrite_prop_animation, get_rig_name, prune_action, rig_actions
 )
 from . import rig_lists, generate
+from .face_shapes import face_shape_outputs, bake_face_shapes
+from .widget_builder import dedupe_widget_meshes
+from .widget_library import save_library_widget
+from .metarig_data import encode_metarig, encode_widget, data_to_json, write_data
 
 
 class DATA_PT_gamerig(bpy.types.Panel):
@@ -515,10 +519,18 @@ class VIEW3D_PT_gamerig_dev_tools(bpy.types.Panel):
                 r.operator("armature.gamerig_encode_metarig", text="Encode Metarig to Python")
                 r = self.layout.row()
                 r.operator("armature.gamerig_encode_metarig_sample", text="Encode Sample to Python")
+                r = self.layout.row()
+                r.operator("armature.gamerig_encode_metarig", text="Encode Metarig to JSON").format = 'JSON'
+                r = self.layout.row()
+                r.operator("armature.gamerig_encode_metarig_sample", text="Encode Sample to JSON").format = 'JSON'
 
             if context.mode == 'EDIT_MESH':
                 r = self.layout.row()
                 r.operator("mesh.gamerig_encode_mesh_widget", text="Encode Mesh Widget to Python")
+                r = self.layout.row()
+                r.operator("mesh.gamerig_encode_mesh_widget", text="Encode Mesh Widget to JSON").format = 'JSON'
+                r = self.layout.row()
+                r.operator("mesh.gamerig_encode_mesh_widget", text="Save Mesh Widget to Library").format = 'LIBRARY'
 
 
 class BONE_PT_gamerig_utility(bpy.types.Panel):
@@ -536,6 +548,35 @@ class BONE_PT_gamerig_utility(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         layout.operator("pose.gamerig_reveal_unlinked_widget")
+        layout.operator("pose.gamerig_dedupe_widgets")
+
+
+class DATA_PT_gamerig_animation(bpy.types.Panel):
+    bl_label       = "GameRig Animation"
+    bl_space_type  = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context     = "data"
+
+    @classmethod
+    def poll(cls, context):
+        return context.object and context.object.type == 'ARMATURE'\
+          and context.object.data.get("gamerig_id") is not None\
+          and context.object.data.get("gamerig_rig_ui_template") is None
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.object
+
+        ks_name = "GameRig %s" % obj.name
+        if ks_name in context.scene.keying_sets:
+            layout.label(text="Keying Set: %s" % ks_name, icon='KEYINGSET')
+
+        col = layout.column(align=True)
+        col.operator("pose.gamerig_prune_action", text="Prune Active Action").all_actions = False
+        col.operator("pose.gamerig_prune_action", text="Prune All Rig Actions").all_actions = True
+
+        if face_shape_outputs(obj):
+            layout.operator("pose.gamerig_bake_face_shapes")
 
 
 def gamerig_report_exception(operator, exception):
@@ -577,6 +618,10 @@ class LayerInit(bpy.types.Operator):
 
 class RevealUnlinkedWidget(bpy.types.Operator):
     """Reveal unlinked widget in current scene.
+       Widgets in the excluded widget collection of the rig are linked to the
+       active collection too, and kept as they are by later generations.
+       A widget sharing its mesh with other widgets gets its own copy, to be
+       edited alone.
     """
     bl_idname  = "pose.gamerig_reveal_unlinked_widget"
     bl_label   = "Reveal unlinked widget to current scene"
@@ -586,10 +631,104 @@ class RevealUnlinkedWidget(bpy.types.Operator):
     def poll(cls, context):
         return context.scene and context.object and context.object.type == 'ARMATURE' and context.active_pose_bone\
          and context.active_pose_bone.custom_shape is not None\
-         and not (context.active_pose_bone.custom_shape.name in context.scene.objects)
+         and not (context.active_pose_bone.custom_shape.name in context.view_layer.objects)
+
+    def execute(self, context):
+        shape = context.active_pose_bone.custom_shape
+        if shape.data is not None and shape.data.users > 1:
+            shape.data = shape.data.copy()
+            shape.data.name = shape.name
+        if shape.name not in context.collection.objects:
+            context.collection.objects.link(shape)
+        return {'FINISHED'}
+
+
+class DedupeWidgets(bpy.types.Operator):
+    """Make the widgets of the same shape share one mesh and remove the duplicates"""
+
+    bl_idname  = "pose.gamerig_dedupe_widgets"
+    bl_label   = "GameRig Deduplicate Widgets"
+    bl_options = {'UNDO'}
+
+    all_rigs: BoolProperty(
+        name="All Rigs",
+        description="Deduplicate the widgets of every generated rig of the file instead of the active one only",
+        default=True,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.object and context.object.type == 'ARMATURE'\
+         and context.object.data.get("gamerig_id") is not None
 
     def execute(self, context):
-        context.collection.objects.link(context.active_pose_bone.custom_shape)
+        if self.all_rigs:
+            rigs = [obj for obj in bpy.data.objects if obj.type == 'ARMATURE' and obj.data.get("gamerig_id") is not None]
+        else:
+            rigs = [context.object]
+
+        count = dedupe_widget_meshes(rigs)
+        self.report({'INFO'}, "Removed %d duplicate widget meshes from %d rigs" % (count, len(rigs)))
+
+        return {'FINISHED'}
+
+
+class PruneAction(bpy.types.Operator):
+    """Remove F-Curves of mechanism/original bones and locked channels from actions"""
+
+    bl_idname  = "pose.gamerig_prune_action"
+    bl_label   = "GameRig Prune Action"
+    bl_options = {'UNDO'}
+
+    all_actions: BoolProperty(
+        name="All Actions",
+        description="Prune the actions of the NLA strips of the rig too, instead of the active one only",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.object and context.object.type == 'ARMATURE'\
+         and context.object.data.get("gamerig_id") is not None
+
+    def execute(self, context):
+        obj = context.object
+        if self.all_actions:
+            actions = rig_actions(obj)
+        elif obj.animation_data and obj.animation_data.action:
+            actions = [obj.animation_data.action]
+        else:
+            actions = []
+        if not actions:
+            self.report({'WARNING'}, "No action to prune")
+            return {'CANCELLED'}
+
+        count = sum(prune_action(obj, action) for action in actions)
+        self.report({'INFO'}, "Removed %d F-Curves from %d actions" % (count, len(actions)))
+
+        return {'FINISHED'}
+
+
+class BakeFaceShapes(bpy.types.Operator):
+    """Bake the face controls into shape keys of the meshes deformed by the rig"""
+
+    bl_idname  = "pose.gamerig_bake_face_shapes"
+    bl_label   = "Bake Face Shape Keys"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.object and context.object.type == 'ARMATURE'\
+         and context.object.data.get("gamerig_id") is not None
+
+    def execute(self, context):
+        try:
+            count = bake_face_shapes(context, context.object)
+        except MetarigError as rig_exception:
+            gamerig_report_exception(self, rig_exception)
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Baked %d shape keys" % count)
         return {'FINISHED'}
 
 
@@ -677,83 +816,133 @@ class Sample(bpy.types.Operator):
         return {'FINISHED'}
 
 
-class EncodeMetarig(bpy.types.Operator):
-    """ Creates Python code that will generate the selected metarig.
+ENCODE_FORMATS = [
+    ('PYTHON', "Python", "Write Python code to a text"),
+    ('JSON', "JSON", "Write JSON data to a text"),
+    ('NPZ', "NumPy", "Write NumPy .npz data to a file"),
+]
+
+
+def write_text_block(name, text):
+    """ Replaces the content of the text block of that name.
+    """
+    if name in bpy.data.texts:
+        text_block = bpy.data.texts[name]
+        text_block.clear()
+    else:
+        text_block = bpy.data.texts.new(name)
+    text_block.write(text)
+
+
+class EncodeOperatorBase:
+    """ Format and file of the encode operators.
+    """
+    format: EnumProperty(name="Format", items=ENCODE_FORMATS, default='PYTHON')
+
+    filepath: StringProperty(name="File Path", description="File of the .npz data", subtype='FILE_PATH', default="")
+
+    def invoke(self, context, event):
+        if self.format == 'NPZ' and not self.filepath:
+            self.filepath = "%s.npz" % self.text_name
+            context.window_manager.fileselect_add(self)
+            return {'RUNNING_MODAL'}
+        return self.execute(context)
+
+    def write(self, python, encode):
+        """ Writes the Python code or the data, produced on demand.
+        """
+        if self.format == 'PYTHON':
+            write_text_block(self.text_name + ".py", python())
+        elif self.format == 'JSON':
+            write_text_block(self.text_name + ".json", data_to_json(encode()))
+        else:
+            write_data(encode(), bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".npz"))
+
+
+class EncodeMetarig(EncodeOperatorBase, bpy.types.Operator):
+    """ Creates Python code or data that will generate the selected metarig.
     """
     bl_idname  = "armature.gamerig_encode_metarig"
     bl_label   = "GameRig Encode Metarig"
     bl_options = {'UNDO'}
 
+    text_name = "metarig"
+
     @classmethod
     def poll(self, context):
         return context.mode == 'EDIT_ARMATURE'
 
     def execute(self, context):
-        name = "metarig.py"
-
-        if name in bpy.data.texts:
-            text_block = bpy.data.texts[name]
-            text_block.clear()
-        else:
-            text_block = bpy.data.texts.new(name)
-
-        text = write_metarig(context.active_object, func_name="create", layers=True, groups=True, template=True)
-        text_block.write(text)
+        obj = context.active_object
+        self.write(
+            lambda: write_metarig(obj, func_name="create", layers=True, groups=True, template=True),
+            lambda: encode_metarig(obj, layers=True, groups=True, template=True)
+        )
         bpy.ops.object.mode_set(mode='EDIT')
 
         return {'FINISHED'}
 
 
-class EncodeMetarigSample(bpy.types.Operator):
-    """ Creates Python code that will generate the selected metarig
+class EncodeMetarigSample(EncodeOperatorBase, bpy.types.Operator):
+    """ Creates Python code or data that will generate the selected metarig
         as a sample.
     """
     bl_idname  = "armature.gamerig_encode_metarig_sample"
     bl_label   = "GameRig Encode Metarig Sample"
     bl_options = {'UNDO'}
 
+    text_name = "metarig_sample"
+
     @classmethod
     def poll(self, context):
         return context.mode == 'EDIT_ARMATURE'
 
     def execute(self, context):
-        name = "metarig_sample.py"
-
-        if name in bpy.data.texts:
-            text_block = bpy.data.texts[name]
-            text_block.clear()
-        else:
-            text_block = bpy.data.texts.new(name)
-
-        text = write_metarig(context.active_object, func_name="create_sample")
-        text_block.write(text)
+        obj = context.active_object
+        self.write(
+            lambda: write_metarig(obj, func_name="create_sample"),
+            lambda: encode_metarig(obj)
+        )
         bpy.ops.object.mode_set(mode='EDIT')
 
         return {'FINISHED'}
 
 
-class EncodeWidget(bpy.types.Operator):
-    """ Creates Python code that will generate the selected metarig.
+class EncodeWidget(EncodeOperatorBase, bpy.types.Operator):
+    """ Creates Python code or data that will generate the selected widget,
+        or saves it to the widget library.
     """
     bl_idname  = "mesh.gamerig_encode_mesh_widget"
     bl_label   = "GameRig Encode Widget"
     bl_options = {'UNDO'}
 
+    text_name = "widget"
+
+    format: EnumProperty(
+        name="Format",
+        items=ENCODE_FORMATS + [('LIBRARY', "Library", "Save the mesh as a shape of the widget library")],
+        default='PYTHON',
+    )
+
+    shape: StringProperty(
+        name="Shape",
+        description="Name of the shape in the widget library, the object name if empty",
+        default="",
+    )
+
     @classmethod
     def poll(self, context):
         return context.mode == 'EDIT_MESH'
 
     def execute(self, context):
-        name = "widget.py"
-
-        if name in bpy.data.texts:
-            text_block = bpy.data.texts[name]
-            text_block.clear()
+        obj = context.active_object
+        bpy.ops.object.mode_set(mode='OBJECT')
+        if self.format == 'LIBRARY':
+            shape = self.shape or obj.name
+            save_library_widget(obj.data, shape)
+            self.report({'INFO'}, "Saved widget shape '%s' to the library" % shape)
         else:
-            text_block = bpy.data.texts.new(name)
-
-        text = write_widget(context.active_object)
-        text_block.write(text)
+            self.write(lambda: write_widget(obj), lambda: encode_widget(obj))
         bpy.ops.object.mode_set(mode='EDIT')
 
         return {'FINISHED'}
@@ -773,9 +962,13 @@ classes = (
     DATA_PT_gamerig,
     BONE_PT_gamerig_type,
     BONE_PT_gamerig_utility,
+    DATA_PT_gamerig_animation,
     VIEW3D_PT_gamerig_dev_tools,
     LayerInit,
     RevealUnlinkedWidget,
+    DedupeWidgets,
+    PruneAction,
+    BakeFaceShapes,
     Generate,
     Sample,
     EncodeMetarig,
@@ -71,10 +71,12 @@ def get_rig_name(metarig):
 # Rig id generation
 #=======================================================================
 
-def random_id(length=10):
+def random_id(length=10, seed=None):
     """ Generates a random alphanumeric id string.
+        If seed is given, the id is deterministic: the same seed gives the same id.
     """
-    return ''.join([random.choice(string.ascii_lowercase + string.digits) for i in range(length)])
+    rng = random if seed is None else random.Random(seed)
+    return ''.join([rng.choice(string.ascii_lowercase + string.digits) for i in range(length)])
     #return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
 
 #=======================================================================
@@ -148,6 +150,34 @@ def insert_before_first_period(name, text):
     t = name.split('.', 1)
     return t[0] + text + '.' + t[1] if len(t) > 1 else name + text
 
+
+side_suffix_pattern = re.compile(r'([._])([LR])(\.?\d*)$')
+
+
+def mirror_name(name):
+    """ Returns the name of the opposite side bone (.L <-> .R), or None
+        if the name has no side suffix.
+    """
+    match = side_suffix_pattern.search(name)
+    if match is None:
+        return None
+    side = 'R' if match.group(2) == 'L' else 'L'
+    return name[:match.start()] + match.group(1) + side + match.group(3)
+
+
+def symmetrical_pairs(names):
+    """ Returns (left, right) name pairs found in names.
+    """
+    names_set = set(names)
+    pairs = []
+    for name in names:
+        match = side_suffix_pattern.search(name)
+        if match is not None and match.group(2) == 'L':
+            other = mirror_name(name)
+            if other in names_set:
+                pairs.append((name, other))
+    return pairs
+
 #=======================
 # Bone manipulation
 #=======================
@@ -203,6 +233,21 @@ def copy_bone(obj, bone_name, assign_name=''):
     """ Makes a copy of the given bone in the given armature object.
         Returns the resulting bone's name.
     """
+    bone_name_2 = copy_edit_bone(obj, bone_name, assign_name)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    copy_pose_bone(obj, bone_name, bone_name_2)
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    return bone_name_2
+
+
+def copy_edit_bone(obj, bone_name, assign_name=''):
+    """ Makes a copy of the given edit bone in the given armature object,
+        without leaving edit mode. The pose bone attributes must be copied
+        afterwards with copy_pose_bone().
+        Returns the resulting bone's name.
+    """
     #if bone_name not in obj.data.bones:
     if bone_name not in obj.data.edit_bones:
         raise MetarigError("copy_bone(): bone '%s' not found, cannot copy it" % bone_name)
@@ -213,7 +258,6 @@ def copy_bone(obj, bone_name, assign_name=''):
         # Copy the edit bone
         edit_bone_1 = obj.data.edit_bones[bone_name]
         edit_bone_2 = obj.data.edit_bones.new(assign_name)
-        bone_name_1 = bone_name
         bone_name_2 = edit_bone_2.name
 
         edit_bone_2.parent = edit_bone_1.parent
@@ -235,41 +279,66 @@ def copy_bone(obj, bone_name, assign_name=''):
         edit_bone_2.bbone_easein = edit_bone_1.bbone_easein
         edit_bone_2.bbone_easeout = edit_bone_1.bbone_easeout
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        # Get the pose bones
-        pose_bone_1 = obj.pose.bones[bone_name_1]
-        pose_bone_2 = obj.pose.bones[bone_name_2]
-
-        # Copy pose bone attributes
-        pose_bone_2.rotation_mode = pose_bone_1.rotation_mode
-        pose_bone_2.rotation_axis_angle = tuple(pose_bone_1.rotation_axis_angle)
-        pose_bone_2.rotation_euler = tuple(pose_bone_1.rotation_euler)
-        pose_bone_2.rotation_quaternion = tuple(pose_bone_1.rotation_quaternion)
-
-        pose_bone_2.lock_location = tuple(pose_bone_1.lock_location)
-        pose_bone_2.lock_scale = tuple(pose_bone_1.lock_scale)
-        pose_bone_2.lock_rotation = tuple(pose_bone_1.lock_rotation)
-        pose_bone_2.lock_rotation_w = pose_bone_1.lock_rotation_w
-        pose_bone_2.lock_rotations_4d = pose_bone_1.lock_rotations_4d
-
-        # Copy custom properties
-        for key in pose_bone_1.keys():
-            if key != "_RNA_UI" and key != "gamerig_parameters" and key != "gamerig_type":
-                prop1 = rna_idprop_ui_prop_get(pose_bone_1, key, create=False)
-                if prop1 is not None:
-                    prop2 = rna_idprop_ui_prop_get(pose_bone_2, key, create=True)
-                    pose_bone_2[key] = pose_bone_1[key]
-                    for key in prop1.keys():
-                        prop2[key] = prop1[key]
-
-        bpy.ops.object.mode_set(mode='EDIT')
-
         return bone_name_2
     else:
         raise MetarigError("Cannot copy bones outside of edit mode")
 
 
+def copy_pose_bone(obj, bone_name_1, bone_name_2):
+    """ Copies the pose bone attributes and custom properties of a bone
+        to its copy. Must be called outside of edit mode.
+    """
+    # Get the pose bones
+    pose_bone_1 = obj.pose.bones[bone_name_1]
+    pose_bone_2 = obj.pose.bones[bone_name_2]
+
+    # Copy pose bone attributes
+    pose_bone_2.rotation_mode = pose_bone_1.rotation_mode
+    pose_bone_2.rotation_axis_angle = tuple(pose_bone_1.rotation_axis_angle)
+    pose_bone_2.rotation_euler = tuple(pose_bone_1.rotation_euler)
+    pose_bone_2.rotation_quaternion = tuple(pose_bone_1.rotation_quaternion)
+
+    pose_bone_2.lock_location = tuple(pose_bone_1.lock_location)
+    pose_bone_2.lock_scale = tuple(pose_bone_1.lock_scale)
+    pose_bone_2.lock_rotation = tuple(pose_bone_1.lock_rotation)
+    pose_bone_2.lock_rotation_w = pose_bone_1.lock_rotation_w
+    pose_bone_2.lock_rotations_4d = pose_bone_1.lock_rotations_4d
+
+    # Copy custom properties
+    for key in pose_bone_1.keys():
+        if key != "_RNA_UI" and key != "gamerig_parameters" and key != "gamerig_type":
+            prop1 = rna_idprop_ui_prop_get(pose_bone_1, key, create=False)
+            if prop1 is not None:
+                prop2 = rna_idprop_ui_prop_get(pose_bone_2, key, create=True)
+                pose_bone_2[key] = pose_bone_1[key]
+                for key in prop1.keys():
+                    prop2[key] = prop1[key]
+
+
+def generate_in_passes(rigs):
+    """ Generates rigs split into create_bones(), run in edit mode and returning
+        the (source, copy) pairs of the bones it copied, and setup_pose(), run
+        in object mode and returning the UI scripts.
+        All the rigs share a single edit pass and a single pose pass.
+        Returns the list of UI scripts.
+    """
+    obj = rigs[0].obj
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    copies = []
+    for rig in rigs:
+        copies += rig.create_bones()
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    for bone_name_1, bone_name_2 in copies:
+        copy_pose_bone(obj, bone_name_1, bone_name_2)
+
+    scripts = []
+    for rig in rigs:
+        scripts += rig.setup_pose() or []
+    return scripts
+
+
 def flip_bone(obj, bone_name):
     """ Flips an edit bone.
     """
@@ -377,7 +446,8 @@ def assign_and_unlink_all_widgets(collection, armature):
     if hasattr(create_widget, 'created_widgets') and create_widget.created_widgets is not None:
         for obj, bone_name in create_widget.created_widgets:
             armature.pose.bones[bone_name].custom_shape = obj
-            collection.objects.unlink(obj)
+            if obj.name in collection.objects:
+                collection.objects.unlink(obj)
         create_widget.created_widgets = None
 
 
@@ -787,54 +857,27 @@ def write_metarig(obj, func_name="create", layers=False, groups=False, template=
 def write_widget(obj):
     """ Write a mesh object as a python script for widget use.
     """
-    script = ""
-    script += "def create_thing_widget(rig, bone_name, size=1.0, bone_transform_name=None):\n"
-    script += "    obj = create_widget(rig, bone_name, bone_transform_name)\n"
-    script += "    if obj != None:\n"
-
-    # Vertices
-    if len(obj.data.vertices) > 0:
-        script += "        verts = ["
-        for v in obj.data.vertices:
-            script += "({:.5}*size, {:.5}*size, {:.5}*size), ".format(
-                v.co[0] if abs(v.co[0]) > 0.0001 else 0.0,
-                v.co[1] if abs(v.co[1]) > 0.0001 else 0.0,
-                v.co[2] if abs(v.co[2]) > 0.0001 else 0.0,
-            )
-        script += "]\n"
-    else:
-        script += "        verts = []\n"
-
-    # Edges
-    if len(obj.data.edges) > 0:
-        script += "        edges = ["
-        for e in obj.data.edges:
-            script += "(" + str(e.vertices[0]) + ", " + str(e.vertices[1]) + "), "
-        script += "]\n"
-    else:
-        script += "        edges = []\n"
-
-    # Faces
-    if len(obj.data.polygons) > 0:
-        script += "        faces = ["
-        for f in obj.data.polygons:
-            script += "("
-            for v in f.vertices:
-                script += str(v) + ", "
-            script += "), "
-        script += "]\n"
-    else:
-        script += "        faces = []\n"
+    mesh = obj.data
+
+    def fmt(value):
+        return value if abs(value) > 0.0001 else 0.0
+
+    verts = "".join(
+        "({:.5}*size, {:.5}*size, {:.5}*size), ".format(fmt(v.co[0]), fmt(v.co[1]), fmt(v.co[2]))
+        for v in mesh.vertices
+    )
+    edges = "".join("(%d, %d), " % tuple(e.vertices) for e in mesh.edges)
+    faces = "".join("(" + "".join(str(v) + ", " for v in f.vertices) + "), " for f in mesh.polygons)
 
-    # Build mesh
-    script += "\n        mesh = obj.data\n"
-    script += "        mesh.from_pydata(verts, edges, faces)\n"
-    script += "        mesh.update()\n"
-    script += "        return obj\n"
-    script += "    else:\n"
-    script += "        return None\n"
+    script = [
+        "def create_thing_widget(rig, bone_name, size=1.0, bone_transform_name=None):\n",
+        "    verts = [" + verts + "]\n",
+        "    edges = [" + edges + "]\n",
+        "    faces = [" + faces + "]\n",
+        "\n    queue_widget(rig, bone_name, verts, edges, faces, bone_transform_name=bone_transform_name)\n",
+    ]
 
-    return script
+    return "".join(script)
 
 
 #=============================================
@@ -868,6 +911,118 @@ def gamma_correct(color):
 # Keyframing functions
 #=============================================
 
+ROTATION_CHANNELS = {
+    'QUATERNION' : 'rotation_quaternion',
+    'AXIS_ANGLE' : 'rotation_axis_angle',
+}
+
+pose_bone_path_pattern = re.compile(r'^pose\.bones\["(.+?)"\]\.?(.*)$')
+
+
+def transform_locks(pbone):
+    """ Returns {channel name: [locked, ...]} of the active transform channels
+        of a pose bone.
+    """
+    rotation = ROTATION_CHANNELS.get(pbone.rotation_mode, 'rotation_euler')
+    locks = {
+        'location' : list(pbone.lock_location),
+        'scale'    : list(pbone.lock_scale),
+    }
+    if rotation == 'rotation_euler':
+        locks[rotation] = list(pbone.lock_rotation)
+    else:
+        locks[rotation] = [pbone.lock_rotations_4d and pbone.lock_rotation_w] + list(pbone.lock_rotation)
+    return locks
+
+
+def control_channels(pbone):
+    """ Returns (data_path, index) of the channels an animator may key on a
+        control bone. Locked channels are skipped, index -1 means whole array.
+    """
+    channels = []
+    for attr, locks in transform_locks(pbone).items():
+        data_path = pbone.path_from_id(attr)
+        if not any(locks):
+            channels.append((data_path, -1))
+        else:
+            channels += [(data_path, i) for i, locked in enumerate(locks) if not locked]
+
+    # Animatable custom properties (IK/FK, follow switches...)
+    for key in pbone.keys():
+        if key != '_RNA_UI' and isinstance(pbone[key], (int, float)):
+            channels.append(('%s["%s"]' % (pbone.path_from_id(), key), 0))
+
+    return channels
+
+
+def create_control_keying_set(scene, rig, controls):
+    """ Creates (or refreshes) a keying set holding the unlocked channels of
+        the control bones only.
+    """
+    name = "GameRig %s" % rig.name
+    ks = scene.keying_sets.get(name)
+    if ks is None:
+        ks = scene.keying_sets.new(idname=name, name=name)
+    else:
+        ks.paths.clear()
+
+    pbones = rig.pose.bones
+    for bone in controls:
+        for data_path, index in control_channels(pbones[bone]):
+            ks.paths.add(rig, data_path, index=index, group_method='NAMED', group_name=bone)
+
+    scene.keying_sets.active = ks
+    return ks
+
+
+def prune_action(rig, action):
+    """ Removes F-Curves targeting original/mechanism bones or locked channels
+        of the rig from an action. Returns the number of removed F-Curves.
+    """
+    pbones = rig.pose.bones
+    locks = {}
+    pruned = []
+
+    for fcu in action.fcurves:
+        match = pose_bone_path_pattern.match(fcu.data_path)
+        if match is None:
+            continue
+        bone_name, attr = match.groups()
+        if is_org(bone_name) or is_mch(bone_name):
+            pruned.append(fcu)
+            continue
+        pbone = pbones.get(bone_name)
+        if pbone is None:
+            continue
+        if bone_name not in locks:
+            locks[bone_name] = transform_locks(pbone)
+        channel = locks[bone_name].get(attr)
+        if channel and fcu.array_index < len(channel) and channel[fcu.array_index]:
+            pruned.append(fcu)
+
+    for fcu in pruned:
+        action.fcurves.remove(fcu)
+
+    return len(pruned)
+
+
+def rig_actions(rig):
+    """ Returns the actions used by the rig: its active action and the
+        actions of its NLA strips, each once.
+    """
+    actions = []
+    anim = rig.animation_data
+    if anim is None:
+        return actions
+    if anim.action is not None:
+        actions.append(anim.action)
+    for track in anim.nla_tracks:
+        for strip in track.strips:
+            if strip.action is not None and strip.action not in actions:
+                actions.append(strip.action)
+    return actions
+
+
 
 def get_keyed_frames(rig):
     frames = []
@@ -927,3 +1082,39 @@ def overwrite_prop_animation(rig, bone, prop_name, value, frames):
     for kp in curve.keyframe_points:
         if kp.co[0] in frames:
             kp.co[1] = value
+
+#=============================================
+# Animator playback mode
+#=============================================
+
+def tag_playback_optional(pbone, constraint):
+    """ Tags a constraint as optional mechanism. The rig UI mutes it, together
+        with the drivers feeding it, while the rig is in playback mode.
+    """
+    if not hasattr(tag_playback_optional, 'constraints') or tag_playback_optional.constraints is None:
+        tag_playback_optional.constraints = []
+    tag_playback_optional.constraints.append((pbone.name, constraint.name))
+
+
+def playback_optional_mechanism(rig):
+    """ Returns ([(bone, constraint)], [(driver data_path, index)]) of the
+        tagged optional mechanism which still exists on the generated rig.
+    """
+    tagged = getattr(tag_playback_optional, 'constraints', None) or []
+    pbones = rig.pose.bones
+
+    constraints = []
+    paths = set()
+    for bone_name, const_name in tagged:
+        pbone = pbones.get(bone_name)
+        if pbone is not None and const_name in pbone.constraints:
+            constraints.append((bone_name, const_name))
+            paths.add(pbone.constraints[const_name].path_from_id())
+
+    drivers = []
+    if rig.animation_data is not None:
+        for fcu in rig.animation_data.drivers:
+            if fcu.data_path.rsplit('.', 1)[0] in paths:
+                drivers.append((fcu.data_path, fcu.array_index))
+
+    return constraints, drivers
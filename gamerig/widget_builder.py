@@ -0,0 +1,403 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Deferred widget creation.
+
+    Rigs queue the geometry of their bone widgets with queue_widget() while
+    generating, in any mode. The generator builds all of them at the end with
+    build_widgets(): the vertex, edge and face buffers of every widget are
+    filled from shared preallocated arrays with bulk writes, and the widget
+    transforms come from one bulk read of the bone rest matrices.
+
+    Widgets of the same shape share one mesh, keyed by a signature of its
+    geometry, across the bones and rigs of the file. Each bone keeps its own
+    widget object for placement, in the widget collection of the rig, which
+    is excluded from the view layer.
+"""
+
+import bpy
+import hashlib
+import numpy as np
+from mathutils import Matrix
+
+from .utils import MODULE_NAME, create_widget, get_wgt_name, obj_to_bone
+from .widget_library import library_shape
+
+
+WGT_MESH_PREFIX       = "WGT-shape_"  # Name prefix of the shared widget meshes
+WGT_COLLECTION_PREFIX = "WGTS_"       # Name prefix of the widget collection of a rig
+WIDGET_SEGMENTS       = 32            # Segments of the round widgets without add-on preferences
+
+
+def widget_segments():
+    """ Returns the segment count of the round widgets, from the Widget
+        Detail add-on preference.
+    """
+    addon = bpy.context.preferences.addons.get(MODULE_NAME)
+    if addon is None:
+        return WIDGET_SEGMENTS
+    return int(addon.preferences.widget_segments)
+
+
+#=======================================================================
+# Queue
+#=======================================================================
+
+def queue_widget(
+    rig, bone_name, verts, edges=(), faces=(), bone_transform_name=None, mesh_of=None, subsurf=0, mesh_props=None
+):
+    """ Queues the widget of a bone for build_widgets(), replacing the one
+        already queued for that bone.
+        verts, edges and faces are given as for mesh.from_pydata().
+        mesh_of names another queued bone whose widget mesh is reused as is.
+        subsurf is the level of a subdivision surface modifier, 0 for none.
+        mesh_props are custom properties stored on the widget mesh.
+    """
+    if queue_widget.pending is None:
+        queue_widget.pending = {}
+    queue_widget.pending[bone_name] = {
+        'rig'       : rig,
+        'bone'      : bone_name,
+        'transform' : bone_name if bone_transform_name is None else bone_transform_name,
+        'verts'     : verts,
+        'edges'     : edges,
+        'faces'     : faces,
+        'mesh_of'   : mesh_of,
+        'subsurf'   : subsurf,
+        'mesh_props': mesh_props,
+    }
+
+queue_widget.pending = None
+
+
+def queue_library_widget(rig, bone_name, shape, size=1.0, flip_xz=False, bone_transform_name=None, subsurf=0):
+    """ Queues a widget of a shape of the widget library, scaled by size and
+        with x/z swapped by flip_xz, both baked in the vertices.
+    """
+    verts, edges, faces = library_shape(shape, size, flip_xz)
+    queue_widget(rig, bone_name, verts, edges, faces, bone_transform_name=bone_transform_name, subsurf=subsurf)
+
+
+def queued_widget(bone_name):
+    """ Returns the widget request queued for a bone, or None.
+    """
+    return (queue_widget.pending or {}).get(bone_name)
+
+
+def share_widget(rig, bone_name, source_bone):
+    """ Gives the bone the same widget object as source_bone once built.
+    """
+    if share_widget.pending is None:
+        share_widget.pending = []
+    share_widget.pending.append((bone_name, source_bone))
+
+share_widget.pending = None
+
+
+#=======================================================================
+# Shape signature
+#=======================================================================
+
+def shape_signature(verts, edges, face_loops=(), face_totals=()):
+    """ Returns a digest of the widget geometry, stable to float noise.
+    """
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(np.round(np.asarray(verts, dtype=np.float32), 4) + 0.0).tobytes())
+    digest.update(b'e')
+    digest.update(np.ascontiguousarray(edges, dtype=np.int32).tobytes())
+    digest.update(b'f')
+    digest.update(np.ascontiguousarray(face_loops, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(face_totals, dtype=np.int32).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def mesh_signature(mesh):
+    """ Returns the shape signature of an existing mesh, from bulk reads.
+    """
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', verts)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loops)
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', totals)
+    return shape_signature(verts.reshape(-1, 3), edges.reshape(-1, 2), loops, totals)
+
+
+def get_wgt_mesh_name(signature):
+    return WGT_MESH_PREFIX + signature
+
+
+def dedupe_widget_meshes(armatures):
+    """ Makes the widgets of the same shape used by the armatures share
+        one mesh, and removes the meshes left unused.
+        Returns the number of meshes removed.
+    """
+    shapes = set()
+    for armature in armatures:
+        shapes.update(
+            pbone.custom_shape for pbone in armature.pose.bones
+            if pbone.custom_shape is not None and pbone.custom_shape.type == 'MESH'
+        )
+
+    shared = {}
+    replaced = set()
+    for shape in sorted(shapes, key=lambda obj: obj.name):
+        mesh = shape.data
+        if mesh.library is not None or mesh in replaced:
+            continue
+        signature = mesh_signature(mesh)
+        keep = shared.get(signature)
+        if keep is None:
+            keep = bpy.data.meshes.get(get_wgt_mesh_name(signature))
+            if keep is None or keep.library is not None:
+                keep = mesh
+                keep.name = get_wgt_mesh_name(signature)
+            shared[signature] = keep
+        if mesh != keep:
+            shape.data = keep
+            replaced.add(mesh)
+
+    count = 0
+    for mesh in replaced:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+            count += 1
+    return count
+
+
+#=======================================================================
+# Widget collection
+#=======================================================================
+
+def find_layer_collection(layer_collection, collection):
+    """ Returns the layer collection of the collection in the hierarchy, or None.
+    """
+    if layer_collection.collection == collection:
+        return layer_collection
+    for child in layer_collection.children:
+        found = find_layer_collection(child, collection)
+        if found is not None:
+            return found
+    return None
+
+
+def widget_collection(context, rig_name, parent):
+    """ Returns the widget collection of the rig, created in parent the first
+        time, and excluded from the view layer so that its widgets are never
+        evaluated.
+    """
+    name = WGT_COLLECTION_PREFIX + rig_name
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        collection = bpy.data.collections.new(name)
+
+    layer = find_layer_collection(context.view_layer.layer_collection, collection)
+    if layer is None:
+        parent.children.link(collection)
+        layer = find_layer_collection(context.view_layer.layer_collection, collection)
+    if layer is not None:
+        layer.exclude = True
+
+    return collection
+
+
+#=======================================================================
+# Build
+#=======================================================================
+
+def widget_matrices(rig, bone_names):
+    """ Returns the world matrices of the widgets placed on the bones, as
+        obj_to_bone() would place them, from one read of the rest matrices.
+    """
+    bones = rig.data.bones
+    index = dict((name, i) for i, name in enumerate(bones.keys()))
+    selected = np.array([index[name] for name in bone_names], dtype=np.int64)
+
+    local = np.empty(len(bones) * 16, dtype=np.float32)
+    bones.foreach_get('matrix_local', local)
+    local = local.reshape(-1, 4, 4).transpose(0, 2, 1)  # Column major
+
+    lengths = np.empty(len(bones), dtype=np.float32)
+    bones.foreach_get('length', lengths)
+
+    mats = np.array(rig.matrix_world, dtype=np.float32) @ local[selected]
+
+    # Uniform scale of the bone length times the average scale
+    scale = np.linalg.norm(mats[:, :3, :3], axis=1)
+    size = lengths[selected] * scale.mean(axis=1)
+    mats[:, :3, :3] *= (size[:, None] / scale)[:, None, :]
+
+    return mats
+
+
+def face_buffers(faces):
+    """ Returns the (loop vertex indices, loop totals) of the faces.
+    """
+    totals = np.array([len(f) for f in faces], dtype=np.int32)
+    loops = np.fromiter((v for f in faces for v in f), dtype=np.int32, count=int(totals.sum()))
+    return loops, totals
+
+
+def fill_mesh(mesh, verts, edges, loops, totals):
+    """ Writes the buffers to an empty mesh.
+    """
+    if len(verts):
+        mesh.vertices.add(len(verts))
+        mesh.vertices.foreach_set('co', verts.ravel())
+    if len(edges):
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set('vertices', edges.ravel())
+    if len(totals):
+        starts = np.zeros(len(totals), dtype=np.int32)
+        np.cumsum(totals[:-1], out=starts[1:])
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set('vertex_index', loops)
+        mesh.polygons.add(len(totals))
+        mesh.polygons.foreach_set('loop_start', starts)
+        mesh.polygons.foreach_set('loop_total', totals)
+    # Faces come without their edges, as with from_pydata()
+    mesh.update(calc_edges=len(totals) > 0)
+
+
+def shape_mesh(verts, edges, faces=()):
+    """ Returns the shared mesh of the shape, created if not in the file yet.
+    """
+    verts = np.array(verts, dtype=np.float32).reshape(-1, 3)
+    edges = np.array(edges, dtype=np.int32).reshape(-1, 2)
+    loops, totals = face_buffers(faces)
+    name = get_wgt_mesh_name(shape_signature(verts, edges, loops, totals))
+    mesh = bpy.data.meshes.get(name)
+    if mesh is None or mesh.library is not None:
+        mesh = bpy.data.meshes.new(name)
+        fill_mesh(mesh, verts, edges, loops, totals)
+    return mesh
+
+
+def build_widgets(rig, collection):
+    """ Creates the widget objects of all the queued requests in the widget
+        collection of the rig, registered with create_widget() for
+        assign_and_unlink_all_widgets(). The widget objects of an earlier
+        generation are reused.
+        Widgets revealed in another collection of the scene are only moved to
+        their bone.
+        Must be called in object mode.
+    """
+    requests = list((queue_widget.pending or {}).values())
+    shares = share_widget.pending or []
+    queue_widget.pending = None
+    share_widget.pending = None
+
+    scene = bpy.context.scene
+    objects = {}
+    todo = []
+    for request in requests:
+        obj_name = get_wgt_name(rig.name, request['bone'])
+        obj = bpy.data.objects.get(obj_name)
+        if obj is not None and obj_name in scene.objects and any(c != collection for c in obj.users_collection):
+            # Move object to bone position, in case it changed
+            obj_to_bone(obj, rig, request['transform'])
+            objects[request['bone']] = obj
+            continue
+        todo.append((request, obj_name))
+
+    if todo:
+        # All the buffers in a few preallocated arrays
+        built = [request for request, _ in todo if request['mesh_of'] is None]
+        vert_counts = [len(request['verts']) for request in built]
+        edge_counts = [len(request['edges']) for request in built]
+        verts = np.empty((sum(vert_counts), 3), dtype=np.float32)
+        edges = np.empty((sum(edge_counts), 2), dtype=np.int32)
+        v = e = 0
+        buffers = {}
+        for request, nv, ne in zip(built, vert_counts, edge_counts):
+            if nv:
+                verts[v:v + nv] = request['verts']
+            if ne:
+                edges[e:e + ne] = request['edges']
+            buffers[request['bone']] = (verts[v:v + nv], edges[e:e + ne])
+            v += nv
+            e += ne
+
+        mats = widget_matrices(rig, [request['transform'] for request, _ in todo])
+
+        # One mesh per shape, shared with the widgets already in the file
+        meshes = {}
+        shared = {}
+        objects_todo = []
+        for (request, obj_name), mat in zip(todo, mats):
+            bone = request['bone']
+            if request['mesh_of'] is None:
+                verts_buffer, edges_buffer = buffers[bone]
+                loops, totals = face_buffers(request['faces'])
+                signature = shape_signature(verts_buffer, edges_buffer, loops, totals)
+                mesh = shared.get(signature)
+                if mesh is None:
+                    mesh_name = get_wgt_mesh_name(signature)
+                    mesh = bpy.data.meshes.get(mesh_name)
+                    if mesh is None or mesh.library is not None:
+                        mesh = bpy.data.meshes.new(mesh_name)
+                        fill_mesh(mesh, verts_buffer, edges_buffer, loops, totals)
+                    for key, value in (request['mesh_props'] or {}).items():
+                        mesh[key] = value
+                    shared[signature] = mesh
+                meshes[bone] = mesh
+            objects_todo.append((request, obj_name, mat))
+
+        if not hasattr(create_widget, 'created_widgets') or create_widget.created_widgets is None:
+            create_widget.created_widgets = []
+        for request, obj_name, mat in objects_todo:
+            bone = request['bone']
+            mesh = meshes.get(bone)
+            if mesh is None:
+                # Reused mesh of another widget
+                source = request['mesh_of']
+                mesh = meshes.get(source) or (objects[source].data if source in objects else None)
+                if mesh is None:
+                    mesh = bpy.data.meshes.new(obj_name)
+
+            obj = bpy.data.objects.get(obj_name)
+            if obj is None or obj.type != 'MESH' or obj.library is not None:
+                obj = bpy.data.objects.new(obj_name, mesh)
+            else:
+                # Widget of an earlier generation
+                old_mesh = obj.data
+                obj.data = mesh
+                if old_mesh != mesh and old_mesh.users == 0:
+                    bpy.data.meshes.remove(old_mesh)
+                obj.modifiers.clear()
+            if obj_name not in collection.objects:
+                collection.objects.link(obj)
+            obj.rotation_mode = 'XYZ'
+            obj.matrix_world = Matrix(mat.tolist())
+            if request['subsurf']:
+                mod = obj.modifiers.new("subsurf", 'SUBSURF')
+                mod.levels = request['subsurf']
+            objects[bone] = obj
+            create_widget.created_widgets.append((obj, bone))
+
+    pb = rig.pose.bones
+    for bone_name, source_bone in shares:
+        shape = objects.get(source_bone) or bpy.data.objects.get(get_wgt_name(rig.name, source_bone))
+        if shape is not None:
+            pb[bone_name].custom_shape = shape
+
+    return objects
@@ -0,0 +1,101 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Widget library.
+
+    The geometry of the built-in widget shapes is stored in widgets.json next
+    to the add-on, read once on first use instead of being parsed as Python
+    literals at every import. queue_library_widget() bakes the size and flips
+    of a widget into its vertices, so that widgets of the same derived shape
+    share one mesh through the shape signature. Encode Widget can save a mesh
+    as a shape of the library.
+"""
+
+import os
+import numpy as np
+
+from .utils import MetarigError
+from .metarig_data import read_array, rounded, read_data, write_data, DATA_VERSION
+
+WIDGET_LIBRARY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "widgets.json")
+LIBRARY_FORMAT = 'gamerig.widget_library'
+
+
+def read_library(path=WIDGET_LIBRARY):
+    """ Returns the {shape: data} of the library, read once per file change.
+    """
+    stamp = (path, os.path.getmtime(path))
+    if read_library.stamp != stamp:
+        data = read_data(path)
+        if data.get('format') != LIBRARY_FORMAT:
+            raise MetarigError("GAMERIG ERROR: %s is not a widget library" % path)
+        read_library.shapes = data['shapes']
+        read_library.stamp = stamp
+        library_shape.cache = {}
+    return read_library.shapes
+
+read_library.stamp = None
+read_library.shapes = {}
+
+
+def library_shape(shape, size=1.0, flip_xz=False):
+    """ Returns the (verts, edges, faces) of a shape of the library, verts and
+        edges as arrays, verts scaled by size and with x/z swapped by flip_xz.
+        Computed once per shape, size and flip.
+    """
+    key = (shape, size, flip_xz)
+    geometry = library_shape.cache.get(key)
+    if geometry is None:
+        data = read_library().get(shape)
+        if data is None:
+            raise MetarigError("GAMERIG ERROR: no widget shape '%s' in the widget library" % shape)
+        verts = np.array(data['verts'], dtype=np.float32).reshape(-1, 3) * np.float32(size)
+        if flip_xz:
+            verts = np.ascontiguousarray(verts[:, ::-1])
+        loops = iter(data['face_loops'])
+        geometry = (
+            verts,
+            np.array(data['edges'], dtype=np.int32).reshape(-1, 2),
+            [[next(loops) for _ in range(total)] for total in data['face_totals']],
+        )
+        library_shape.cache[key] = geometry
+    return geometry
+
+library_shape.cache = {}
+
+
+def save_library_widget(mesh, shape, path=WIDGET_LIBRARY):
+    """ Adds the geometry of a mesh to the library as shape, replacing the
+        shape of that name.
+    """
+    shapes = dict(read_library(path))
+    shapes[shape] = {
+        'verts'       : rounded(read_array(mesh.vertices, 'co', 3)),
+        'edges'       : read_array(mesh.edges, 'vertices', 2, np.int32).tolist(),
+        'face_loops'  : read_array(mesh.loops, 'vertex_index', dtype=np.int32).tolist(),
+        'face_totals' : read_array(mesh.polygons, 'loop_total', dtype=np.int32).tolist(),
+    }
+    write_data({'format': LIBRARY_FORMAT, 'version': DATA_VERSION, 'shapes': shapes}, path)
+    read_library.stamp = None
+    library_shape.cache = {}
+
+    # Cached rigs were generated with the former shape
+    from .cache import addon_digest
+    addon_digest.value = None